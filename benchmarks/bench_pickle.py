@@ -0,0 +1,43 @@
+"""Compare pickle size and round-trip time of URNs with pydantic's default pickling.
+
+Run from the repository root with:
+
+    uv run python benchmarks/bench_pickle.py
+"""
+import pickle
+import timeit
+
+from urn_citation import Cite2Urn, CtsUrn
+
+
+class DefaultPickleCtsUrn(CtsUrn):
+    """CtsUrn pickled with pydantic's default state dictionary."""
+    __reduce__ = object.__reduce__
+
+
+class DefaultPickleCite2Urn(Cite2Urn):
+    """Cite2Urn pickled with pydantic's default state dictionary."""
+    __reduce__ = object.__reduce__
+
+
+def measure(label, urns, number=5):
+    """Print pickle size and round-trip time for a list of URNs."""
+    data = pickle.dumps(urns, protocol=pickle.HIGHEST_PROTOCOL)
+    single = pickle.dumps(urns[0], protocol=pickle.HIGHEST_PROTOCOL)
+    seconds = timeit.timeit(lambda: pickle.loads(pickle.dumps(urns, protocol=pickle.HIGHEST_PROTOCOL)), number=number) / number
+    print(f"{label:<28} {len(single):>6} B/urn {len(data) / len(urns):>8.1f} B/urn in list {seconds * 1e6 / len(urns):>8.2f} µs/urn round trip")
+
+
+def main():
+    count = 20_000
+    cts = [f"urn:cts:greekLit:tlg0012.tlg001.msA:{n // 700 + 1}.{n % 700 + 1}" for n in range(count)]
+    cite = [f"urn:cite2:hmt:msA.v1:{n // 2 + 1}{'rv'[n % 2]}" for n in range(count)]
+
+    measure("CtsUrn (default)", [DefaultPickleCtsUrn.from_string(urn) for urn in cts])
+    measure("CtsUrn (compact)", [CtsUrn.from_string(urn) for urn in cts])
+    measure("Cite2Urn (default)", [DefaultPickleCite2Urn.from_string(urn) for urn in cite])
+    measure("Cite2Urn (compact)", [Cite2Urn.from_string(urn) for urn in cite])
+
+
+if __name__ == "__main__":
+    main()
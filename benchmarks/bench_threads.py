@@ -0,0 +1,75 @@
+"""Measure how parsing and containment queries scale across threads.
+
+On a free-threaded build (e.g., python3.14t) throughput should grow close to linearly with the number of threads, up to the number of cores. On a build with the GIL, it stays flat.
+
+Run from the repository root with:
+
+    uv run --python 3.14t python benchmarks/bench_threads.py [THREADS ...]
+
+By default, thread counts are powers of two up to the number of cores.
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from urn_citation import CtsUrn, SortedUrnArray, UrnBloomFilter
+
+
+def parse(strings):
+    for value in strings:
+        CtsUrn.from_string(value)
+
+
+def contains(pairs):
+    for container, urn in pairs:
+        container.contains(urn)
+
+
+def query(array, containers):
+    for container in containers:
+        array.contained_slices(container)
+
+
+def probe(bloom, strings):
+    bloom.contains_many(strings)
+
+
+def run(label, work, chunks, threads):
+    """Run one chunk of work per thread and report throughput relative to one thread."""
+    baseline = None
+    for count in threads:
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            start = time.perf_counter()
+            list(pool.map(work, chunks[:count]))
+            elapsed = time.perf_counter() - start
+        rate = count / elapsed
+        baseline = baseline or rate
+        print(f"{label:<22} threads={count:<3} {rate / baseline:5.2f}x")
+
+
+def main():
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    cores = os.cpu_count() or 1
+    if len(sys.argv) > 1:
+        threads = [int(arg) for arg in sys.argv[1:]]
+    else:
+        threads = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= cores]
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {cores} cores")
+
+    strings = [f"urn:cts:greekLit:tlg0012.tlg001.msA:{n // 700 + 1}.{n % 700 + 1}" for n in range(20_000)]
+    urns = [CtsUrn.from_string(value) for value in strings]
+    book = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:12")
+    array = SortedUrnArray(urns)
+    bloom = UrnBloomFilter.from_urns(strings)
+    containers = [urn.set_passage(str(n % 24 + 1)) for n, urn in enumerate(urns[:2_000])]
+    chunks = max(threads)
+
+    run("from_string", parse, [strings] * chunks, threads)
+    run("CtsUrn.contains", contains, [[(book, urn) for urn in urns]] * chunks, threads)
+    run("SortedUrnArray query", lambda c: query(array, c), [containers] * chunks, threads)
+    run("Bloom contains_many", lambda s: probe(bloom, s), [strings] * chunks, threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,20 @@ except PackageNotFoundError:
     # Package is not installed (e.g., running from a local script)
     __version__ = "unknown"
 
-from .urn import Urn
+from .urn import ParseError, Urn, trusted_construction
 from .ctsurn import CtsUrn
 from .cite2urn import Cite2Urn
+from .cex import CexBlock, CexIndex, CexWriter
+from .textstore import TextStore
+from .frontcoded import FrontCodedUrnList
+from .sortedurns import SortedUrnArray
+from .bloom import UrnBloomFilter
+from .columns import Cite2UrnColumns, CtsUrnColumns
+from .aggregate import UrnAggregator
+from .sqlitestore import SqliteUrnStore
+from .filters import UrnFilter
+from .cache import CacheStats, ContainmentCache
+from .symbols import SymbolTable
+from .citations import CitationIndex
 
-__all__ = ["Urn", "CtsUrn", "Cite2Urn"]
\ No newline at end of file
+__all__ = ["Urn", "ParseError", "trusted_construction", "CtsUrn", "Cite2Urn", "CexBlock", "CexIndex", "CexWriter", "TextStore", "FrontCodedUrnList", "SortedUrnArray", "UrnBloomFilter", "CtsUrnColumns", "Cite2UrnColumns", "UrnAggregator", "SqliteUrnStore", "UrnFilter", "ContainmentCache", "CacheStats", "SymbolTable", "CitationIndex"]
\ No newline at end of file
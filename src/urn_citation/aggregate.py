@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn, truncate_passage
+
+CTS_LEVELS = ("namespace", "text_group", "work", "version", "exemplar")
+CITE2_LEVELS = ("namespace", "collection", "version", "object_id")
+
+
+class UrnAggregator:
+    """Streaming group-by over a level of the URN hierarchy.
+
+    Each URN added is assigned to a group by truncating it to a chosen level, and its value is folded into the group's accumulator. By default values are summed and every URN counts 1, so the aggregator counts URNs per group. The work per URN is a string split and a dictionary update, independent of the number of URNs and groups.
+
+    Groups are keyed by tuples: the URN type, then the URN's values down to the chosen level, e.g., ``("cts", "greekLit", "tlg0012", "tlg001")`` for ``level="work"``. With ``depth``, CTS URNs are further grouped by the first ``depth`` levels of their passage, e.g., by book with ``depth=1``; the truncated passage (or None) is the last element of the key.
+
+    Aggregators built with the same settings can be merged, so a large input can be split between processes or threads, aggregated separately and combined. An aggregator is not meant to be updated from several threads at once; give each thread its own and merge them.
+
+    Attributes:
+        level (str): The hierarchy level grouped by.
+        depth (int | None): The number of CTS passage levels grouped by, or None to ignore passages.
+        groups (dict[tuple, Any]): The accumulator of each group.
+    """
+
+    def __init__(
+        self,
+        level: str = "text_group",
+        depth: int | None = None,
+        reducer: Callable[[Any, Any], Any] | None = None,
+        initial: Callable[[], Any] | None = None,
+        combine: Callable[[Any, Any], Any] | None = None,
+    ):
+        """Create an empty aggregator.
+
+        Args:
+            level (str): The level to group by. For CTS URNs one of "namespace", "text_group", "work", "version" or "exemplar"; for CITE2 URNs one of "namespace", "collection", "version" or "object_id".
+            depth (int | None): For CTS URNs, the number of passage levels to group by, in addition to ``level``.
+            reducer (Callable[[Any, Any], Any] | None): Function folding a value into an accumulator, returning the new accumulator. Defaults to addition.
+            initial (Callable[[], Any] | None): Function creating the accumulator of a new group. Defaults to ``int``, i.e., 0.
+            combine (Callable[[Any, Any], Any] | None): Function combining the accumulators of two partial results, used by ``merge``. Defaults to addition if ``reducer`` is not given.
+
+        Raises:
+            ValueError: If ``level`` is not a level of either URN type or ``depth`` is negative.
+        """
+        if level not in CTS_LEVELS and level not in CITE2_LEVELS:
+            raise ValueError(f"Unknown hierarchy level '{level}', expected one of {', '.join(dict.fromkeys(CTS_LEVELS + CITE2_LEVELS))}")
+        if depth is not None and depth < 0:
+            raise ValueError(f"depth cannot be negative, got {depth}")
+        self.level = level
+        self.depth = depth
+        self.groups = {}
+        self._reducer = reducer or operator.add
+        self._initial = initial or int
+        self._combine = combine if combine is not None or reducer is not None else operator.add
+        self._cts_size = CTS_LEVELS.index(level) + 1 if level in CTS_LEVELS else None
+        self._cite2_size = CITE2_LEVELS.index(level) + 1 if level in CITE2_LEVELS else None
+
+    def key(self, urn: CtsUrn | Cite2Urn | str) -> tuple:
+        """Compose the group key of a URN.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN. Strings are split without being validated.
+
+        Returns:
+            tuple: The group key.
+
+        Raises:
+            ValueError: If the URN type has no such level, the string is not a URN, or the passage is a range and ``depth`` is set.
+        """
+        if isinstance(urn, str):
+            parts = urn.split(":")
+            if len(parts) != 5 or parts[0] != "urn":
+                raise ValueError(f"Cannot aggregate {urn!r}: not a URN")
+            _, urn_type, namespace, hierarchy, reference = parts
+            if urn_type == "cts":
+                values = [namespace] + hierarchy.split(".")
+                passage = reference or None
+            elif urn_type == "cite2":
+                collection, _, version = hierarchy.partition(".")
+                values = [namespace, collection, version or None, reference or None]
+            else:
+                raise ValueError(f"Cannot aggregate URNs of type '{urn_type}'")
+        elif isinstance(urn, CtsUrn):
+            urn_type = "cts"
+            values = [urn.namespace, urn.text_group, urn.work, urn.version, urn.exemplar]
+            passage = urn.passage
+        elif isinstance(urn, Cite2Urn):
+            urn_type = "cite2"
+            values = [urn.namespace, urn.collection, urn.version, urn.object_id]
+        else:
+            raise ValueError(f"Cannot aggregate {type(urn).__name__} objects")
+
+        if urn_type == "cts":
+            size = self._cts_size
+        else:
+            size = self._cite2_size
+        if size is None:
+            raise ValueError(f"{urn_type} URNs have no '{self.level}' level")
+        values += [None] * (size - len(values))
+        key = (urn_type, *values[:size])
+        if self.depth is not None and urn_type == "cts":
+            key += (truncate_passage(passage, self.depth),)
+        return key
+
+    def add(self, urn: CtsUrn | Cite2Urn | str, value: Any = 1) -> None:
+        """Fold a URN's value into its group.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN.
+            value (Any): The value to fold in. Defaults to 1, which counts the URN.
+
+        Raises:
+            ValueError: If the URN cannot be assigned to a group (see ``key``).
+        """
+        groups = self.groups
+        key = self.key(urn)
+        accumulator = groups.get(key)
+        if accumulator is None and key not in groups:
+            accumulator = self._initial()
+        groups[key] = self._reducer(accumulator, value)
+
+    def update(self, urns: Iterable[CtsUrn | Cite2Urn | str], values: Iterable[Any] | None = None) -> None:
+        """Fold many URNs into their groups.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): The URNs.
+            values (Iterable[Any] | None): A value for each URN. If None, each URN counts 1.
+
+        Raises:
+            ValueError: If a URN cannot be assigned to a group (see ``key``).
+        """
+        add = self.add
+        if values is None:
+            for urn in urns:
+                add(urn)
+        else:
+            for urn, value in zip(urns, values, strict=True):
+                add(urn, value)
+
+    def merge(self, other: UrnAggregator) -> None:
+        """Combine the groups of another aggregator into this one.
+
+        Args:
+            other (UrnAggregator): A partial result built with the same level and depth.
+
+        Raises:
+            ValueError: If the aggregators group differently, or a custom reducer was given without ``combine``.
+        """
+        if (other.level, other.depth) != (self.level, self.depth):
+            raise ValueError(f"Cannot merge an aggregator by {other.level} (depth {other.depth}) into one by {self.level} (depth {self.depth})")
+        if self._combine is None:
+            raise ValueError("Cannot merge aggregators with a custom reducer unless combine is given")
+        groups = self.groups
+        for key, accumulator in other.groups.items():
+            if key in groups:
+                groups[key] = self._combine(groups[key], accumulator)
+            else:
+                groups[key] = accumulator
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __getitem__(self, key: tuple) -> Any:
+        return self.groups[key]
+
+    def items(self):
+        """Get the groups and their accumulators.
+
+        Returns:
+            ItemsView: Pairs of group key and accumulator.
+        """
+        return self.groups.items()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as exc:
+    raise ImportError("urn_citation.arrow requires pyarrow; install it with pip install 'urn-citation[arrow]'") from exc
+
+from .cite2urn import Cite2Urn
+from .columns import Cite2UrnColumns, CtsUrnColumns
+from .ctsurn import CtsUrn
+
+
+class UrnScalar(pa.ExtensionScalar):
+    """Scalar of a URN extension type, converted to a ``CtsUrn`` or ``Cite2Urn`` by ``as_py``."""
+
+    def as_py(self, **kwargs):
+        if self.value is None:
+            return None
+        fields = {"urn_type": self.type.columns_class.urn_type}
+        fields.update(self.value.as_py(**kwargs))
+        return self.type.columns_class.urn_class._from_fields(fields, trusted=True)
+
+
+class _UrnType(pa.ExtensionType):
+    """Shared implementation of the URN extension types."""
+
+    columns_class: type = None
+    extension_name: str = None
+
+    def __init__(self):
+        storage = pa.struct([(name, pa.string()) for name in self.columns_class.fields])
+        super().__init__(storage, self.extension_name)
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        return cls()
+
+    def __arrow_ext_scalar_class__(self):
+        return UrnScalar
+
+
+class CtsUrnType(_UrnType):
+    """Arrow extension type for CTS URNs.
+
+    URN columns of this type can be written to Parquet or Feather and read back as URNs, and filtered by hierarchy with the predicates in this module without converting rows to Python objects. Storage is a struct of string fields namespace, text_group, work, version, exemplar and passage. Missing values are null.
+    """
+
+    columns_class = CtsUrnColumns
+    extension_name = "urn_citation.cts"
+
+
+class Cite2UrnType(_UrnType):
+    """Arrow extension type for CITE2 URNs.
+
+    Storage is a struct of string fields namespace, collection, version and object_id. Missing values are null.
+    """
+
+    columns_class = Cite2UrnColumns
+    extension_name = "urn_citation.cite2"
+
+
+for _type in (CtsUrnType(), Cite2UrnType()):
+    try:
+        pa.register_extension_type(_type)
+    except pa.ArrowKeyError:
+        # Already registered, e.g., when the module is reloaded.
+        pass
+
+
+def to_arrow(columns: CtsUrnColumns | Cite2UrnColumns) -> pa.ExtensionArray:
+    """Convert a columnar URN container to an Arrow array.
+
+    Each column is converted to an Arrow string array in a single pass; no URN objects or URN strings are created.
+
+    Args:
+        columns (CtsUrnColumns | Cite2UrnColumns): The URNs to convert.
+
+    Returns:
+        pa.ExtensionArray: An array of type ``CtsUrnType`` or ``Cite2UrnType``.
+
+    Raises:
+        ValueError: If ``columns`` is not a columnar URN container.
+    """
+    if isinstance(columns, CtsUrnColumns):
+        urn_type = CtsUrnType()
+    elif isinstance(columns, Cite2UrnColumns):
+        urn_type = Cite2UrnType()
+    else:
+        raise ValueError(f"to_arrow requires a CtsUrnColumns or Cite2UrnColumns, got {type(columns).__name__}")
+    storage = pa.StructArray.from_arrays(
+        [pa.array(values, pa.string()) for values in columns.columns.values()],
+        fields=list(urn_type.storage_type),
+    )
+    return pa.ExtensionArray.from_storage(urn_type, storage)
+
+
+def from_arrow(array: pa.Array | pa.ChunkedArray) -> CtsUrnColumns | Cite2UrnColumns:
+    """Convert an Arrow array of URNs to a columnar URN container.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): An array of type ``CtsUrnType`` or ``Cite2UrnType``. It may not contain nulls.
+
+    Returns:
+        CtsUrnColumns | Cite2UrnColumns: The URNs, in array order.
+
+    Raises:
+        ValueError: If the array is not of a URN extension type or contains nulls.
+    """
+    if not isinstance(array.type, _UrnType):
+        raise ValueError(f"from_arrow requires an array of a URN extension type, got {array.type}")
+    if array.null_count:
+        raise ValueError("from_arrow cannot convert an array containing null URNs")
+    columns_class = array.type.columns_class
+    return columns_class.from_columns(**{name: _field(array, name).to_pylist() for name in columns_class.fields})
+
+
+def _field(array, name: str):
+    """Select one component of a URN array as a string array."""
+    if isinstance(array, pa.ChunkedArray):
+        return pa.chunked_array([_field(chunk, name) for chunk in array.chunks], pa.string())
+    if isinstance(array, pa.ExtensionArray):
+        array = array.storage
+    return pc.struct_field(array, name)
+
+
+def _check_type(array, expected: type, function: str) -> None:
+    if not isinstance(array.type, expected):
+        raise ValueError(f"{function} requires an array of {expected.__name__}, got {array.type}")
+
+
+def _match_prefix(array, urn, names: tuple[str, ...]):
+    """Compare the non-None fields of a URN with the corresponding fields of an array."""
+    result = pa.scalar(True)
+    for name in names:
+        value = getattr(urn, name)
+        if value is not None:
+            result = pc.and_kleene(result, pc.equal(_field(array, name), value))
+    if isinstance(result, pa.Scalar):
+        return pc.is_valid(_field(array, names[0]))
+    return pc.fill_null(result, False)
+
+
+def work_contains(array: pa.Array | pa.ChunkedArray, urn: CtsUrn | str) -> pa.BooleanArray:
+    """Check ``urn.work_contains`` for every URN of an array.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): An array of type ``CtsUrnType``.
+        urn (CtsUrn | str): The containing URN.
+
+    Returns:
+        pa.BooleanArray: True where all non-None work hierarchy fields of ``urn`` match. Null URNs give False.
+
+    Raises:
+        ValueError: If the array is not of type ``CtsUrnType``.
+    """
+    _check_type(array, CtsUrnType, "work_contains")
+    if isinstance(urn, str):
+        urn = CtsUrn.from_string(urn)
+    return _match_prefix(array, urn, ("text_group", "work", "version", "exemplar"))
+
+
+def passage_contains(array: pa.Array | pa.ChunkedArray, urn: CtsUrn | str) -> pa.BooleanArray:
+    """Check ``urn.passage_contains`` for every URN of an array.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): An array of type ``CtsUrnType``.
+        urn (CtsUrn | str): The containing URN. It may not be a range.
+
+    Returns:
+        pa.BooleanArray: True where the passage equals the passage of ``urn`` or lies below it in the citation hierarchy. Null URNs give False.
+
+    Raises:
+        ValueError: If the array is not of type ``CtsUrnType``, or ``urn`` or any passage in the array is a range.
+    """
+    _check_type(array, CtsUrnType, "passage_contains")
+    if isinstance(urn, str):
+        urn = CtsUrn.from_string(urn)
+    if urn.is_range():
+        raise ValueError("passage_contains cannot be called on a CtsUrn with a range passage")
+    passages = _field(array, "passage")
+    if pc.any(pc.match_substring(passages, "-")).as_py():
+        raise ValueError("passage_contains cannot be called with a CtsUrn argument that has a range passage")
+
+    if urn.passage is None:
+        return pc.and_(pc.is_null(passages), pc.is_valid(_field(array, "namespace")))
+    refined = pc.and_(
+        pc.starts_with(passages, urn.passage + "."),
+        pc.greater_equal(pc.utf8_length(passages), len(urn.passage) + 2),
+    )
+    return pc.fill_null(pc.or_(pc.equal(passages, urn.passage), refined), False)
+
+
+def collection_contains(array: pa.Array | pa.ChunkedArray, urn: Cite2Urn | str) -> pa.BooleanArray:
+    """Check ``urn.collection_contains`` for every URN of an array.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): An array of type ``Cite2UrnType``.
+        urn (Cite2Urn | str): The containing URN.
+
+    Returns:
+        pa.BooleanArray: True where all non-None collection hierarchy fields of ``urn`` match. Null URNs give False.
+
+    Raises:
+        ValueError: If the array is not of type ``Cite2UrnType``.
+    """
+    _check_type(array, Cite2UrnType, "collection_contains")
+    if isinstance(urn, str):
+        urn = Cite2Urn.from_string(urn)
+    return _match_prefix(array, urn, ("namespace", "collection", "version"))
+
+
+def contains(array: pa.Array | pa.ChunkedArray, urn: CtsUrn | Cite2Urn | str) -> pa.BooleanArray:
+    """Check ``urn.contains`` for every URN of an array.
+
+    Args:
+        array (pa.Array | pa.ChunkedArray): An array of type ``CtsUrnType`` or ``Cite2UrnType``.
+        urn (CtsUrn | Cite2Urn | str): The containing URN, of the same type as the array.
+
+    Returns:
+        pa.BooleanArray: The result of ``urn.contains`` for each URN. Null URNs give False.
+
+    Raises:
+        ValueError: If the array is not of a URN extension type, or a CTS passage is a range.
+    """
+    if isinstance(array.type, CtsUrnType):
+        return pc.and_(work_contains(array, urn), passage_contains(array, urn))
+    _check_type(array, Cite2UrnType, "contains")
+    if isinstance(urn, str):
+        urn = Cite2Urn.from_string(urn)
+    object_ids = _field(array, "object_id")
+    if urn.object_id is None:
+        same_object = pc.is_null(object_ids)
+    else:
+        same_object = pc.fill_null(pc.equal(object_ids, urn.object_id), False)
+    return pc.and_(collection_contains(array, urn), same_object)
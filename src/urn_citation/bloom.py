@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import math
+import os
+import struct
+import threading
+from collections.abc import Iterable
+from hashlib import blake2b
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn
+
+_MAGIC = b"URNBLOOM"
+_HEADER = struct.Struct("<8sQQQd")
+
+
+class UrnBloomFilter:
+    """Probabilistic set of URNs for fast rejection of URNs that are not present.
+
+    A Bloom filter answers "possibly present" or "definitely absent". It never reports a URN that was added as absent, and reports an absent URN as present with a probability close to the configured false-positive rate, provided no more than ``capacity`` URNs are added.
+
+    Membership checks do not lock and may run in any number of threads. Adding URNs takes a lock, since setting a bit reads and rewrites a whole byte.
+
+    URNs are hashed in their canonical string form, so ``CtsUrn`` and ``Cite2Urn`` objects and strings can be mixed, and batches of strings can be checked without constructing URN models. Strings must be in canonical form (as produced by ``str(urn)``) to match.
+
+    Attributes:
+        capacity (int): Number of URNs the filter is sized for.
+        error_rate (float): Target false-positive rate at capacity.
+        num_bits (int): Size of the bit array.
+        num_hashes (int): Number of bit positions set for each URN.
+        count (int): Number of URNs added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Create an empty filter.
+
+        Args:
+            capacity (int): Number of URNs the filter is sized for.
+            error_rate (float): Target false-positive rate at capacity, between 0 and 1.
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not between 0 and 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_urns(cls, urns: Iterable[CtsUrn | Cite2Urn | str], error_rate: float = 0.01, capacity: int | None = None) -> UrnBloomFilter:
+        """Build a filter holding a collection of URNs.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): URNs to add.
+            error_rate (float): Target false-positive rate at capacity.
+            capacity (int | None): Number of URNs to size the filter for. If None, the collection is counted first.
+
+        Returns:
+            UrnBloomFilter: A filter containing the URNs.
+        """
+        if capacity is None:
+            urns = list(urns)
+            capacity = max(1, len(urns))
+        bloom = cls(capacity, error_rate)
+        bloom.update(urns)
+        return bloom
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> UrnBloomFilter:
+        """Read a filter saved with ``save``.
+
+        Args:
+            path (str | os.PathLike): Path to the saved filter.
+
+        Returns:
+            UrnBloomFilter: The stored filter.
+
+        Raises:
+            ValueError: If the file is not a saved filter.
+        """
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError(f"{path} is not a saved URN Bloom filter")
+            magic, capacity, num_bits, count, error_rate = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a saved URN Bloom filter")
+            bloom = cls(capacity, error_rate)
+            if bloom.num_bits != num_bits:
+                raise ValueError(f"{path} has {num_bits} bits, expected {bloom.num_bits}")
+            bits = f.read()
+            if len(bits) != len(bloom._bits):
+                raise ValueError(f"{path} is truncated")
+            bloom._bits = bytearray(bits)
+            bloom.count = count
+        return bloom
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the filter to a file.
+
+        Args:
+            path (str | os.PathLike): Path to write to.
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.capacity, self.num_bits, self.count, self.error_rate))
+            f.write(self._bits)
+
+    def _positions(self, value: str) -> list[int]:
+        # Double hashing: derive all bit positions from one 128-bit digest.
+        digest = blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, urn: CtsUrn | Cite2Urn | str) -> None:
+        """Add a URN to the filter.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN to add.
+        """
+        positions = self._positions(str(urn))
+        bits = self._bits
+        with self._lock:
+            for position in positions:
+                bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def update(self, urns: Iterable[CtsUrn | Cite2Urn | str]) -> None:
+        """Add many URNs to the filter.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): The URNs to add.
+        """
+        for urn in urns:
+            self.add(urn)
+
+    def __contains__(self, urn: CtsUrn | Cite2Urn | str) -> bool:
+        bits = self._bits
+        for position in self._positions(str(urn)):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def contains_many(self, values: Iterable[str]) -> list[bool]:
+        """Check many URN strings against the filter.
+
+        Strings are hashed directly, without constructing URN models.
+
+        Args:
+            values (Iterable[str]): URN strings in canonical form.
+
+        Returns:
+            list[bool]: For each string, False if it is definitely absent, True if it may be present.
+        """
+        bits = self._bits
+        positions = self._positions
+        results = []
+        for value in values:
+            present = True
+            for position in positions(value):
+                if not bits[position >> 3] & (1 << (position & 7)):
+                    present = False
+                    break
+            results.append(present)
+        return results
+
+    def possibly_present(self, values: Iterable[str]) -> list[str]:
+        """Select the URN strings that may be present.
+
+        Args:
+            values (Iterable[str]): URN strings in canonical form.
+
+        Returns:
+            list[str]: The strings not rejected by the filter, in input order.
+        """
+        values = list(values)
+        return [value for value, present in zip(values, self.contains_many(values)) if present]
+
+    def expected_error_rate(self) -> float:
+        """Estimate the current false-positive rate.
+
+        Returns:
+            float: The expected false-positive rate for the number of URNs added so far.
+        """
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
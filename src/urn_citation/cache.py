@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn
+from .urn import Urn
+
+
+class CacheStats(NamedTuple):
+    """Counters of a ``ContainmentCache``.
+
+    Attributes:
+        hits (int): Number of checks answered from the cache.
+        misses (int): Number of checks computed and stored.
+        evictions (int): Number of results dropped to stay within ``maxsize``.
+        size (int): Number of results currently stored.
+        maxsize (int): Maximum number of results stored.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """float: Fraction of checks answered from the cache, or 0.0 before any check."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _identity(urn: CtsUrn | Cite2Urn | str) -> tuple | str:
+    """Key a URN by its string, or by its class and field values in field order, which identify it independently of the object holding them."""
+    if isinstance(urn, str):
+        return urn
+    urn_class = type(urn)
+    fields = urn.__dict__
+    return (urn_class, *(fields[name] for name in urn_class.__pydantic_fields__))
+
+
+class ContainmentCache:
+    """Bounded memo of containment checks between pairs of URNs.
+
+    Results of ``contains``, ``work_contains`` and ``passage_contains`` are stored per pair of URNs. URN objects are keyed by their field values, so equal URNs share results even when they are different objects. URN strings are keyed by the string and only parsed when the result is not stored, so repeated checks on strings skip parsing altogether; a string and an equal URN object are stored separately. The checks on URN objects are themselves only a few field comparisons, so the cache gains most when URNs arrive as strings, as from a file or a service request. When more than ``maxsize`` results are stored, the least recently used one is evicted.
+
+    Checks that raise, such as ``passage_contains`` on a range, are not stored and raise every time. The cache can be shared between threads: lookups and updates take a lock, while the checks themselves run outside it.
+
+    Attributes:
+        maxsize (int): Maximum number of results stored.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        """Create an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of results stored.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _check(self, name: str, parse: Callable[[str], Urn], container: CtsUrn | Cite2Urn | str, other: CtsUrn | Cite2Urn | str) -> bool:
+        key = (name, _identity(container), _identity(other))
+        results = self._results
+        with self._lock:
+            result = results.get(key)
+            if result is not None:
+                results.move_to_end(key)
+                self._hits += 1
+                return result
+        if isinstance(container, str):
+            container = parse(container)
+        if isinstance(other, str):
+            other = parse(other)
+        result = getattr(container, name)(other)
+        with self._lock:
+            self._misses += 1
+            results[key] = result
+            if len(results) > self.maxsize:
+                results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def contains(self, container: CtsUrn | Cite2Urn | str, other: CtsUrn | Cite2Urn | str) -> bool:
+        """Check whether a URN contains another, as ``CtsUrn.contains`` or ``Cite2Urn.contains``.
+
+        Args:
+            container (CtsUrn | Cite2Urn | str): The containing URN.
+            other (CtsUrn | Cite2Urn | str): The URN to check.
+
+        Returns:
+            bool: True if ``container`` contains ``other``.
+
+        Raises:
+            ValueError: If either CTS URN is a range, or a string is not a valid URN.
+        """
+        return self._check("contains", Urn.parse, container, other)
+
+    def work_contains(self, container: CtsUrn | str, other: CtsUrn | str) -> bool:
+        """Check whether a CTS URN's work hierarchy contains another's, as ``CtsUrn.work_contains``.
+
+        Args:
+            container (CtsUrn | str): The containing URN.
+            other (CtsUrn | str): The URN to check.
+
+        Returns:
+            bool: True if the work hierarchy of ``container`` contains that of ``other``.
+
+        Raises:
+            ValueError: If a string is not a valid CTS URN.
+        """
+        return self._check("work_contains", CtsUrn.from_string, container, other)
+
+    def passage_contains(self, container: CtsUrn | str, other: CtsUrn | str) -> bool:
+        """Check whether a CTS URN's passage contains another's, as ``CtsUrn.passage_contains``.
+
+        Args:
+            container (CtsUrn | str): The containing URN.
+            other (CtsUrn | str): The URN to check.
+
+        Returns:
+            bool: True if the passage of ``container`` contains that of ``other``.
+
+        Raises:
+            ValueError: If either passage is a range, or a string is not a valid CTS URN.
+        """
+        return self._check("passage_contains", CtsUrn.from_string, container, other)
+
+    def stats(self) -> CacheStats:
+        """Get the cache's counters.
+
+        Returns:
+            CacheStats: Hits, misses, evictions and size.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._results), self.maxsize)
+
+    def clear(self) -> None:
+        """Drop all stored results and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
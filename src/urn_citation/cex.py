@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import os
+import threading
+from collections.abc import Iterable, Iterator
+
+from pydantic import BaseModel
+
+from .columns import Cite2UrnColumns, CtsUrnColumns, _UrnColumns
+
+# Example CEX block:
+# #!ctsdata
+# urn:cts:greekLit:tlg0012.tlg001.msA:1.1#Μῆνιν ἄειδε θεὰ Πηληϊάδεω Ἀχιλῆος
+
+
+INDEX_SUFFIX = ".cexidx"
+
+COMPRESSORS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+
+def _is_record(line: bytes) -> bool:
+    """Check if a raw CEX line is a data record.
+
+    Blank lines and lines beginning with ``//`` are ignored in CEX; block
+    headers begin with ``#!``. Every other line is a record.
+
+    Args:
+        line (bytes): A raw line read from a CEX source, including any line terminator.
+
+    Returns:
+        bool: True if the line is a record, False otherwise.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return False
+    return not (stripped.startswith(b"//") or stripped.startswith(b"#!"))
+
+
+class CexBlock(BaseModel):
+    """Location of one labelled block in a CEX source.
+
+    Attributes:
+        label (str): Block label without the ``#!`` marker (e.g., "ctsdata" or "relations").
+        start (int): Byte offset of the first line after the block header.
+        end (int): Byte offset where the block ends (the next header or end of file).
+        record_count (int): Number of data records in the block.
+        record_offsets (list[int]): Byte offsets of every Nth record, where N is the index stride. Empty when the index has no stride.
+    """
+    label: str
+    start: int
+    end: int
+    record_count: int = 0
+    record_offsets: list[int] = []
+
+
+class CexIndex(BaseModel):
+    """Byte-offset index of the blocks in a CEX source.
+
+    The index is built in a single pass over the source, and can be saved to a sidecar file so that later reads seek directly to a requested block, or to a range of records within a block, instead of rescanning the whole source.
+
+    Attributes:
+        source_size (int): Size in bytes of the indexed source.
+        source_mtime_ns (int): Modification time of the indexed source, in nanoseconds.
+        stride (int | None): If set, the offset of every ``stride``-th record in each block is recorded.
+        blocks (list[CexBlock]): Blocks in the order they appear in the source.
+    """
+    source_size: int
+    source_mtime_ns: int
+    stride: int | None = None
+    blocks: list[CexBlock] = []
+
+    @classmethod
+    def build(cls, source: str | os.PathLike, stride: int | None = None) -> CexIndex:
+        """Scan a CEX source and record the byte offsets of its blocks.
+
+        Args:
+            source (str | os.PathLike): Path to the CEX source.
+            stride (int | None): If set, also record the offset of every ``stride``-th record.
+
+        Returns:
+            CexIndex: The index of the source.
+
+        Raises:
+            ValueError: If stride is not a positive integer.
+        """
+        if stride is not None and stride < 1:
+            raise ValueError(f"stride must be a positive integer, got {stride}")
+
+        blocks = []
+        current = None
+        offset = 0
+        with open(source, "rb") as f:
+            for line in f:
+                if line.startswith(b"#!"):
+                    if current is not None:
+                        current.end = offset
+                    label = line[2:].strip().decode("utf-8")
+                    current = CexBlock(label=label, start=offset + len(line), end=offset + len(line))
+                    blocks.append(current)
+                elif current is not None and _is_record(line):
+                    if stride is not None and current.record_count % stride == 0:
+                        current.record_offsets.append(offset)
+                    current.record_count += 1
+                offset += len(line)
+        if current is not None:
+            current.end = offset
+
+        stat = os.stat(source)
+        return cls(
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+            stride=stride,
+            blocks=blocks,
+        )
+
+    @classmethod
+    def load(cls, index_path: str | os.PathLike) -> CexIndex:
+        """Read an index from a sidecar file.
+
+        Args:
+            index_path (str | os.PathLike): Path to the sidecar file.
+
+        Returns:
+            CexIndex: The stored index.
+        """
+        with open(index_path, "r", encoding="utf-8") as f:
+            return cls.model_validate_json(f.read())
+
+    @classmethod
+    def for_source(cls, source: str | os.PathLike, stride: int | None = None) -> CexIndex:
+        """Get an index for a CEX source, reusing its sidecar file when possible.
+
+        If a sidecar file exists next to the source, matches the source's size and modification time, and was built with the requested stride, it is loaded. Otherwise, or if the sidecar file cannot be read or parsed (e.g., it was truncated), the source is scanned and a new sidecar file is written. If the sidecar file cannot be written, e.g., because the source is in a read-only directory, the new index is returned without being saved.
+
+        Args:
+            source (str | os.PathLike): Path to the CEX source.
+            stride (int | None): If set, also record the offset of every ``stride``-th record.
+
+        Returns:
+            CexIndex: The index of the source.
+        """
+        index_path = sidecar_path(source)
+        if os.path.exists(index_path):
+            try:
+                index = cls.load(index_path)
+            except (OSError, ValueError):
+                # Unreadable or corrupt (pydantic's ValidationError is a ValueError); rebuild it.
+                index = None
+            if index is not None and index.is_current(source) and index.stride == stride:
+                return index
+        index = cls.build(source, stride=stride)
+        try:
+            index.save(index_path)
+        except OSError:
+            pass
+        return index
+
+    def save(self, index_path: str | os.PathLike) -> None:
+        """Write the index to a sidecar file.
+
+        Args:
+            index_path (str | os.PathLike): Path to write the sidecar file to.
+        """
+        with open(index_path, "w", encoding="utf-8") as f:
+            f.write(self.model_dump_json())
+
+    def is_current(self, source: str | os.PathLike) -> bool:
+        """Check if the index still describes a CEX source.
+
+        Args:
+            source (str | os.PathLike): Path to the CEX source.
+
+        Returns:
+            bool: True if the source's size and modification time match the index, False otherwise.
+        """
+        stat = os.stat(source)
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def labels(self) -> list[str]:
+        """Get the distinct block labels in source order.
+
+        Returns:
+            list[str]: Labels of the indexed blocks, without duplicates.
+        """
+        return list(dict.fromkeys(block.label for block in self.blocks))
+
+    def blocks_labelled(self, label: str) -> list[CexBlock]:
+        """Get all blocks with a given label.
+
+        A CEX source may contain more than one block with the same label.
+
+        Args:
+            label (str): Block label without the ``#!`` marker.
+
+        Returns:
+            list[CexBlock]: Matching blocks in source order.
+        """
+        return [block for block in self.blocks if block.label == label]
+
+    def block(self, label: str, occurrence: int = 0) -> CexBlock:
+        """Get a single block by label.
+
+        Args:
+            label (str): Block label without the ``#!`` marker.
+            occurrence (int): Which of several blocks with the same label to return, counting from 0.
+
+        Returns:
+            CexBlock: The requested block.
+
+        Raises:
+            KeyError: If there is no such block.
+        """
+        matches = self.blocks_labelled(label)
+        if occurrence >= len(matches):
+            raise KeyError(f"No block #{occurrence} labelled '{label}' in index, found {len(matches)}")
+        return matches[occurrence]
+
+    def read_block(self, source: str | os.PathLike, label: str, occurrence: int = 0) -> Iterator[str]:
+        """Read the records of one block from a CEX source.
+
+        Args:
+            source (str | os.PathLike): Path to the indexed CEX source.
+            label (str): Block label without the ``#!`` marker.
+            occurrence (int): Which of several blocks with the same label to read, counting from 0.
+
+        Yields:
+            str: Each record in the block, without its line terminator.
+        """
+        block = self.block(label, occurrence)
+        yield from self.read_records(source, label, 0, block.record_count, occurrence)
+
+    def read_records(self, source: str | os.PathLike, label: str, start: int, stop: int | None = None, occurrence: int = 0) -> Iterator[str]:
+        """Read a range of records from one block of a CEX source.
+
+        When the index has a stride, reading begins at the nearest recorded offset at or before ``start``; otherwise it begins at the start of the block.
+
+        Args:
+            source (str | os.PathLike): Path to the indexed CEX source.
+            label (str): Block label without the ``#!`` marker.
+            start (int): Index of the first record to read, counting from 0.
+            stop (int | None): Index one past the last record to read, or None to read to the end of the block.
+            occurrence (int): Which of several blocks with the same label to read, counting from 0.
+
+        Yields:
+            str: Each requested record, without its line terminator.
+
+        Raises:
+            KeyError: If there is no such block.
+            ValueError: If start is negative.
+        """
+        block = self.block(label, occurrence)
+        if stop is None or stop > block.record_count:
+            stop = block.record_count
+        if start < 0:
+            raise ValueError(f"start must not be negative, got {start}")
+        if start >= stop:
+            return
+
+        offset = block.start
+        position = 0
+        if self.stride is not None and block.record_offsets:
+            checkpoint = start // self.stride
+            offset = block.record_offsets[checkpoint]
+            position = checkpoint * self.stride
+
+        with open(source, "rb") as f:
+            f.seek(offset)
+            while offset < block.end and position < stop:
+                line = f.readline()
+                if not line:
+                    break
+                offset += len(line)
+                if not _is_record(line):
+                    continue
+                if position >= start:
+                    yield line.decode("utf-8").rstrip("\r\n")
+                position += 1
+
+
+def sidecar_path(source: str | os.PathLike) -> str:
+    """Compose the path of the sidecar index file for a CEX source.
+
+    Args:
+        source (str | os.PathLike): Path to the CEX source.
+
+    Returns:
+        str: The source path with the ``.cexidx`` suffix appended.
+    """
+    return os.fspath(source) + INDEX_SUFFIX
+
+
+class CexWriter:
+    """Buffered writer for CEX output.
+
+    Records are serialized in bulk and collected in memory until the buffer holds at least ``buffer_size`` characters, then written to the target in one call. Fields may be any objects: ``CtsUrn`` and ``Cite2Urn`` values are written in their canonical string form. Output can be compressed on the fly with gzip, bz2 or xz.
+
+    Use the writer as a context manager, or call ``close`` when done, so that buffered records are written. A writer may be shared between threads: each record (or batch written by one call) is appended to the buffer under a lock, so lines from different threads are never interleaved.
+
+    Attributes:
+        path (str): Path of the output file.
+        delimiter (str): Column delimiter between fields of a record.
+        buffer_size (int): Number of characters to collect before writing.
+        compression (str | None): Compression format, one of "gzip", "bz2" or "xz", or None for plain text.
+    """
+
+    def __init__(self, path: str | os.PathLike, delimiter: str = "#", buffer_size: int = 1 << 20, compression: str | None = "infer"):
+        """Open a CEX file for writing.
+
+        Args:
+            path (str | os.PathLike): Path of the output file.
+            delimiter (str): Column delimiter between fields of a record.
+            buffer_size (int): Number of characters to collect before writing.
+            compression (str | None): One of "gzip", "bz2" or "xz", None for plain text, or "infer" to choose from the file suffix.
+
+        Raises:
+            ValueError: If the compression format is not supported.
+        """
+        self.path = os.fspath(path)
+        if compression == "infer":
+            compression = COMPRESSION_SUFFIXES.get(os.path.splitext(self.path)[1])
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"Unsupported compression '{compression}', expected one of {sorted(COMPRESSORS)}")
+        self.delimiter = delimiter
+        self.buffer_size = buffer_size
+        self.compression = compression
+
+        if compression is None:
+            self._file = open(self.path, "w", encoding="utf-8", newline="\n")
+        else:
+            self._file = COMPRESSORS[compression](self.path, "wt", encoding="utf-8", newline="\n")
+        self._chunks = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> CexWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append(self, chunk: str) -> None:
+        with self._lock:
+            self._chunks.append(chunk)
+            self._buffered += len(chunk)
+            if self._buffered >= self.buffer_size:
+                self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        if self._chunks:
+            self._file.write("".join(self._chunks))
+            self._chunks = []
+            self._buffered = 0
+
+    def begin_block(self, label: str) -> None:
+        """Start a new labelled block.
+
+        Args:
+            label (str): Block label without the ``#!`` marker (e.g., "relations").
+        """
+        self._append(f"#!{label}\n")
+
+    def comment(self, text: str) -> None:
+        """Write a comment line.
+
+        Args:
+            text (str): Text of the comment, without the ``//`` marker.
+        """
+        self._append(f"//{text}\n")
+
+    def write_record(self, fields: Iterable[object]) -> None:
+        """Write a single record.
+
+        Args:
+            fields (Iterable[object]): Values of the record's fields, serialized with ``str``.
+        """
+        self._append(self.delimiter.join(map(str, fields)) + "\n")
+
+    def write_records(self, records: Iterable[Iterable[object]]) -> None:
+        """Write many records.
+
+        Args:
+            records (Iterable[Iterable[object]]): Records, each an iterable of field values serialized with ``str``.
+        """
+        join = self.delimiter.join
+        lines = [join(map(str, record)) + "\n" for record in records]
+        if lines:
+            self._append("".join(lines))
+
+    def write_columns(self, *columns: Iterable[object] | CtsUrnColumns | Cite2UrnColumns) -> None:
+        """Write records given column by column.
+
+        Each column is serialized in one pass, then the columns are joined row by row. A ``CtsUrnColumns`` or ``Cite2UrnColumns`` container is serialized from its field lists with ``strings``, without constructing URN objects. All columns must have the same length.
+
+        Args:
+            *columns (Iterable[object] | CtsUrnColumns | Cite2UrnColumns): Values for each field, in field order, serialized with ``str``, or URN containers.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        serialized = [column.strings() if isinstance(column, _UrnColumns) else list(map(str, column)) for column in columns]
+        if not serialized:
+            return
+        length = len(serialized[0])
+        if any(len(column) != length for column in serialized):
+            raise ValueError(f"All columns must have the same length, got {[len(column) for column in serialized]}")
+        join = self.delimiter.join
+        lines = [join(row) for row in zip(*serialized)]
+        if lines:
+            self._append("\n".join(lines) + "\n")
+
+    def flush(self) -> None:
+        """Write all buffered records to the output file and flush it."""
+        with self._lock:
+            self._write_buffer()
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write all buffered records and close the output file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_buffer()
+            self._file.close()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+
+from .cex import CexIndex
+from .ctsurn import CtsUrn
+from .urn import ParseError
+
+
+def _split(urn: CtsUrn | str) -> tuple[str, str | None]:
+    """Split a URN into its work prefix, ending in ":", and its passage without subreferences."""
+    if isinstance(urn, str):
+        fields = CtsUrn._parse_fields(urn)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+        work = urn[:urn.rindex(":") + 1]
+        passage = fields["passage"]
+    else:
+        work = str(urn.drop_passage())
+        passage = urn.passage
+    if passage is not None and "@" in passage:
+        passage = "-".join(part.partition("@")[0] for part in passage.split("-"))
+    return work, passage
+
+
+class CitationIndex:
+    """Citation order of the passages of one or more texts.
+
+    Each version or exemplar (a work, below) keeps its passages in corpus order, the order of the source they were read from. Since the order of citations such as "1.9", "1.10" or "1.10a" is a property of the text and cannot be computed from the citations alone, this index is what makes it possible to enumerate the passages of a range such as ``1.1-1.50``, or to describe a set of passages by the fewest ranges.
+
+    The position of a passage is found with a dictionary lookup. Positions of containing passages (e.g., a book "1" holding lines "1.1" to "1.611") are the span from their first to their last contained passage; these spans are built on first use, under a lock, so an index may be shared between threads once it is filled.
+
+    Attributes:
+        works (dict[str, list[str]]): The passages of each work in corpus order, keyed by the work's URN string without a passage, e.g., "urn:cts:greekLit:tlg0012.tlg001.msA:".
+    """
+
+    def __init__(self, urns: Iterable[CtsUrn | str] = ()):
+        """Create an index from passage URNs in corpus order.
+
+        Args:
+            urns (Iterable[CtsUrn | str]): The passage URNs of one or more works, each work's passages in corpus order.
+
+        Raises:
+            ValueError: If a URN is not a valid CTS URN, has no passage or is a range, or is repeated.
+        """
+        self.works = {}
+        self._positions = {}
+        self._spans = {}
+        self._spans_lock = threading.Lock()
+        self.update(urns)
+
+    @classmethod
+    def from_cex(cls, source: str | os.PathLike, index: CexIndex | None = None, delimiter: str = "#") -> CitationIndex:
+        """Create an index from the ``#!ctsdata`` blocks of a CEX source.
+
+        Args:
+            source (str | os.PathLike): Path to the CEX source.
+            index (CexIndex | None): Index of the source. If None, one is loaded or built with ``CexIndex.for_source``.
+            delimiter (str): Column delimiter used in the ``#!ctsdata`` blocks.
+
+        Returns:
+            CitationIndex: An index of the passages in source order.
+        """
+        if index is None:
+            index = CexIndex.for_source(source)
+
+        def urns():
+            for occurrence in range(len(index.blocks_labelled("ctsdata"))):
+                for record in index.read_block(source, "ctsdata", occurrence):
+                    yield record.split(delimiter, 1)[0]
+
+        return cls(urns())
+
+    def add(self, urn: CtsUrn | str) -> None:
+        """Add a passage after the passages already indexed for its work.
+
+        Args:
+            urn (CtsUrn | str): The passage URN.
+
+        Raises:
+            ValueError: If the URN is not a valid CTS URN, has no passage or is a range, or is already indexed.
+        """
+        work, passage = _split(urn)
+        if passage is None or "-" in passage:
+            raise ValueError(f"Only single passages can be indexed, got {urn}")
+        positions = self._positions.get(work)
+        if positions is None:
+            positions = self._positions[work] = {}
+            self.works[work] = []
+        if passage in positions:
+            raise ValueError(f"Passage {work}{passage} appears more than once in corpus")
+        passages = self.works[work]
+        positions[passage] = len(passages)
+        passages.append(passage)
+        self._spans.pop(work, None)
+
+    def update(self, urns: Iterable[CtsUrn | str]) -> None:
+        """Add many passages in corpus order.
+
+        Args:
+            urns (Iterable[CtsUrn | str]): The passage URNs.
+
+        Raises:
+            ValueError: If a URN is not a valid CTS URN, has no passage or is a range, or is already indexed.
+        """
+        for urn in urns:
+            self.add(urn)
+
+    def __len__(self) -> int:
+        return sum(len(passages) for passages in self.works.values())
+
+    def __contains__(self, urn: CtsUrn | str) -> bool:
+        work, passage = _split(urn)
+        return passage in self._positions.get(work, ())
+
+    def _containing_spans(self, work: str) -> dict[str, tuple[int, int]]:
+        spans = self._spans.get(work)
+        if spans is None:
+            with self._spans_lock:
+                spans = self._spans.get(work)
+                if spans is None:
+                    spans = {}
+                    for i, passage in enumerate(self.works[work]):
+                        parts = passage.split(".")
+                        for depth in range(1, len(parts)):
+                            key = ".".join(parts[:depth])
+                            span = spans.get(key)
+                            spans[key] = (i, i) if span is None else (span[0], i)
+                    self._spans[work] = spans
+        return spans
+
+    def _span(self, work: str, passage: str | None) -> tuple[int, int]:
+        positions = self._positions.get(work)
+        if positions is None:
+            raise KeyError(f"No passages for {work} in citation index")
+        if passage is None:
+            return 0, len(positions) - 1
+        position = positions.get(passage)
+        if position is not None:
+            return position, position
+        span = self._containing_spans(work).get(passage)
+        if span is None:
+            raise KeyError(f"No passages for {work}{passage} in citation index")
+        return span
+
+    def span(self, urn: CtsUrn | str) -> tuple[int, int]:
+        """Find the positions of the first and last passages identified by a URN.
+
+        Args:
+            urn (CtsUrn | str): A URN for a single passage, a containing passage, a range or a whole work. Subreferences are ignored.
+
+        Returns:
+            tuple[int, int]: Positions in the work's corpus order of the first and last passages.
+
+        Raises:
+            KeyError: If the URN does not identify any passage in the index, or is a range ending before it begins.
+        """
+        _, first, last = self._locate(urn)
+        return first, last
+
+    def _locate(self, urn: CtsUrn | str) -> tuple[str, int, int]:
+        work, passage = _split(urn)
+        if passage is not None and "-" in passage:
+            begin, _, end = passage.partition("-")
+            first, _ = self._span(work, begin)
+            _, last = self._span(work, end)
+            if last < first:
+                raise KeyError(f"Range {work}{passage} ends before it begins in corpus order")
+            return work, first, last
+        return (work, *self._span(work, passage))
+
+    def expand(self, urn: CtsUrn | str) -> Iterator[CtsUrn]:
+        """Enumerate the indexed passages identified by a URN.
+
+        The span of the URN is looked up first, so an unknown URN raises at once; URNs are then created one at a time, as iteration proceeds. For example, with the passages of the Iliad indexed, ``1.610-2.2`` yields 1.610, 1.611, 2.1 and 2.2, and ``1`` yields every line of book 1.
+
+        Args:
+            urn (CtsUrn | str): A URN for a single passage, a containing passage, a range or a whole work. Subreferences are ignored.
+
+        Returns:
+            Iterator[CtsUrn]: The passages in corpus order.
+
+        Raises:
+            KeyError: If the URN does not identify any passage in the index, or is a range ending before it begins.
+        """
+        work, first, last = self._locate(urn)
+        return self._urns(work, first, last)
+
+    def _urns(self, work: str, first: int, last: int) -> Iterator[CtsUrn]:
+        base = CtsUrn.from_string(work, trusted=True)
+        passages = self.works[work]
+        for i in range(first, last + 1):
+            yield base._with_passage(passages[i])
+
+    def compress(self, urns: Iterable[CtsUrn | str]) -> list[CtsUrn]:
+        """Describe a set of passages with the fewest URNs.
+
+        Each run of passages that are consecutive in corpus order becomes one range URN, or a single passage URN if the run has one passage. Containing passages and ranges in the input stand for all the passages they contain, and repeated passages count once, so ``compress(expand(urn))`` is ``urn`` with its ends replaced by indexed passages.
+
+        Args:
+            urns (Iterable[CtsUrn | str]): The passages, in any order, of one or more works.
+
+        Returns:
+            list[CtsUrn]: Passages and ranges in corpus order, grouped by work in order of first appearance.
+
+        Raises:
+            KeyError: If a URN does not identify any passage in the index.
+        """
+        spans = {}
+        for urn in urns:
+            work, first, last = self._locate(urn)
+            spans.setdefault(work, []).append((first, last))
+
+        result = []
+        for work, work_spans in spans.items():
+            base = CtsUrn.from_string(work, trusted=True)
+            passages = self.works[work]
+            work_spans.sort()
+            merged = [list(work_spans[0])]
+            for first, last in work_spans[1:]:
+                if first <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], last)
+                else:
+                    merged.append([first, last])
+            for first, last in merged:
+                if first == last:
+                    result.append(base._with_passage(passages[first]))
+                else:
+                    result.append(base._with_passage(f"{passages[first]}-{passages[last]}"))
+        return result
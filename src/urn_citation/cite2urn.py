@@ -1,7 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from pydantic import model_validator
-from .urn import Urn
+from .symbols import intern_fields
+from .urn import ParseError, Urn, _construct
+
+
+# Fields with few distinct values across a corpus, shared through ``symbols.COMPONENTS``.
+_HIERARCHY = ("urn_type", "namespace", "collection", "version")
+
+def _check_subreferences(object_id: str) -> None:
+    """Check that each part of an object identifier has at most one non-empty subreference, raising ValueError if not."""
+    if "@" not in object_id:
+        return
+    for part in object_id.split("-"):
+        if part.count("@") > 1:
+            raise ValueError(f"Each object component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
+        # Check for empty subreferences
+        if "@" in part:
+            subref_parts = part.split("@")
+            if len(subref_parts) != 2 or not subref_parts[1]:
+                raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+
 
 # Example CITE2URN
 #urn:cite2:hmt:datamodels.v1:codexmodel
@@ -28,85 +49,111 @@ class Cite2Urn(Urn):
             ValueError: If the subreference constraints are violated.
         """
         if self.object_id is not None:
-            range_parts = self.object_id.split("-")
-            for part in range_parts:
-                if part.count("@") > 1:
-                    raise ValueError(f"Each object component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
-                # Check for empty subreferences
-                if "@" in part:
-                    subref_parts = part.split("@")
-                    if len(subref_parts) != 2 or not subref_parts[1]:
-                        raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+            _check_subreferences(self.object_id)
         
+        intern_fields(self.__dict__, _HIERARCHY)
         return self
 
     @classmethod
-    def from_string(cls, raw_string: str) -> "Cite2Urn":
-        """Parse a ``urn:cite2`` string into a ``Cite2Urn`` instance.
+    def _parse_fields(cls, raw_string: str) -> dict | ParseError:
+        """Split a CITE2 URN string into field values, without raising on invalid input.
+
+        Args:
+            raw_string (str): The string to parse.
 
-        The string must be in the form ``urn:cite2:<namespace>:<collection[.version]>:<object[-range]>``.
+        Returns:
+            dict | ParseError: Keyword arguments for the constructor, or a description of the first problem found.
         """
+        if not isinstance(raw_string, str):
+            return ParseError("not_a_string", repr(raw_string), f"CITE2 URN must be a string, got {type(raw_string).__name__}")
+
         if not raw_string.startswith("urn:cite2:"):
-            raise ValueError("CITE2 URN must start with 'urn:cite2:'")
+            return ParseError("prefix", raw_string, "CITE2 URN must start with 'urn:cite2:'")
 
         parts = raw_string.split(":")
         if len(parts) != 5:
-            raise ValueError(
-                f"CITE2 URN must have 5 colon-delimited parts, got {len(parts)} from {raw_string}."
-            )
+            return ParseError("part_count", raw_string, f"CITE2 URN must have 5 colon-delimited parts, got {len(parts)} from {raw_string}.")
 
         header, urn_type, namespace, collection_info, object_info = parts
 
         if header != "urn":
-            raise ValueError("CITE2 URN must start with 'urn'")
+            return ParseError("header", header, "CITE2 URN must start with 'urn'")
         if urn_type != "cite2":
-            raise ValueError("CITE2 URN must include the cite2 type identifier")
+            return ParseError("urn_type", urn_type, "CITE2 URN must include the cite2 type identifier")
 
         if not namespace:
-            raise ValueError("Namespace component cannot be empty")
+            return ParseError("empty_namespace", namespace, "Namespace component cannot be empty")
         if not collection_info:
-            raise ValueError("Collection info component cannot be empty")
+            return ParseError("empty_collection", collection_info, "Collection info component cannot be empty")
         if not object_info:
-            raise ValueError("Object component cannot be empty")
+            return ParseError("empty_object", object_info, "Object component cannot be empty")
 
         if collection_info.endswith("."):
-            raise ValueError("Collection info cannot end with a period")
+            return ParseError("collection_trailing_period", collection_info, "Collection info cannot end with a period")
         collection_parts = collection_info.split(".")
         if len(collection_parts) > 2:
-            raise ValueError("Collection info can contain at most one period to separate collection and version")
+            return ParseError("collection_part_count", collection_info, "Collection info can contain at most one period to separate collection and version")
         if any(part == "" for part in collection_parts):
-            raise ValueError("Collection info must contain non-empty collection/version values")
+            return ParseError("collection_empty_part", collection_info, "Collection info must contain non-empty collection/version values")
 
         collection = collection_parts[0]
         version = collection_parts[1] if len(collection_parts) == 2 else None
 
         if object_info.endswith("-"):
-            raise ValueError("Object component cannot end with a hyphen")
+            return ParseError("object_trailing_hyphen", object_info, "Object component cannot end with a hyphen")
         object_parts = object_info.split("-")
         if len(object_parts) > 2:
-            raise ValueError("Object component can contain at most one hyphen to indicate a range")
+            return ParseError("range_count", object_info, "Object component can contain at most one hyphen to indicate a range")
         if any(part == "" for part in object_parts):
-            raise ValueError("Object component must contain non-empty identifiers")
+            return ParseError("object_empty_part", object_info, "Object component must contain non-empty identifiers")
 
         # Validate subreferences (at most one @ per range part, no empty subreferences)
         for part in object_parts:
             if part.count("@") > 1:
-                raise ValueError(f"Each object component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
+                return ParseError("subreference_count", part, f"Each object component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
             # Check for empty subreferences
             if "@" in part:
                 subref_parts = part.split("@")
                 if len(subref_parts) != 2 or not subref_parts[1]:
-                    raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+                    return ParseError("empty_subreference", part, f"Subreference cannot be empty, found empty subreference in '{part}'")
 
         object_id = object_info
 
-        return cls(
+        return intern_fields(dict(
             urn_type=urn_type,
             namespace=namespace,
             collection=collection,
             version=version,
             object_id=object_id,
-        )
+        ), _HIERARCHY)
+
+    @classmethod
+    def from_string(cls, raw_string: str, trusted: bool = False) -> "Cite2Urn":
+        """Parse a ``urn:cite2`` string into a ``Cite2Urn`` instance.
+
+        The string must be in the form ``urn:cite2:<namespace>:<collection[.version]>:<object[-range]>``. If ``trusted`` is True, the URN is built from the parsed fields without running model validation, which repeats checks the parser has already made (see ``urn_citation.trusted_construction``).
+        """
+        fields = cls._parse_fields(raw_string)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+        return cls._from_fields(fields, trusted)
+
+    @classmethod
+    def try_parse(cls, raw_string: str) -> "Cite2Urn | ParseError":
+        """Parse a ``urn:cite2`` string without raising an exception on invalid input.
+
+        Accepts exactly the strings that ``from_string`` accepts. On failure, returns a lightweight ``ParseError`` instead of raising, which is much cheaper when parsing large batches containing some malformed lines.
+
+        Args:
+            raw_string (str): The string to parse.
+
+        Returns:
+            Cite2Urn | ParseError: The parsed URN, or a description of why the string is invalid.
+        """
+        fields = cls._parse_fields(raw_string)
+        if isinstance(fields, ParseError):
+            return fields
+        return cls._from_fields(fields)
 
     def __str__(self) -> str:
         """Serialize the Cite2Urn to its canonical string form."""
@@ -393,6 +440,33 @@ class Cite2Urn(Urn):
             object_id=None,
         )
 
+    def with_objects(self, object_ids: Iterable[str | None]) -> "list[Cite2Urn]":
+        """Create a Cite2Urn in this URN's collection for each of many object identifiers.
+
+        The collection hierarchy was validated with this URN, so only the object identifiers are checked; the URNs are built without model validation. This is much faster than calling the constructor for each object.
+
+        Args:
+            object_ids (Iterable[str | None]): The object identifiers, e.g., folio or image identifiers.
+
+        Returns:
+            list[Cite2Urn]: One URN per identifier, in order.
+
+        Raises:
+            ValueError: If an identifier is not a string or None, or has more than one or an empty subreference in a part.
+        """
+        template = dict(self.__dict__)
+        urn_class = type(self)
+        urns = []
+        for object_id in object_ids:
+            if object_id is not None:
+                if not isinstance(object_id, str):
+                    raise ValueError(f"Object identifier must be a string or None, got {type(object_id).__name__}")
+                _check_subreferences(object_id)
+            fields = template.copy()
+            fields["object_id"] = object_id
+            urns.append(_construct(urn_class, fields))
+        return urns
+
     def drop_subreference(self) -> "Cite2Urn":
         """Create a new Cite2Urn with all subreferences removed.
         
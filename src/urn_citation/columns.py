@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+from .cite2urn import Cite2Urn
+from .cite2urn import _check_subreferences as _check_object_id
+from .ctsurn import CtsUrn
+from .ctsurn import _check_subreferences as _check_passage
+from .urn import ParseError
+
+
+class _UrnColumns:
+    """Shared implementation of the column-oriented URN containers."""
+
+    urn_class: type = None
+    urn_type: str = None
+    fields: tuple[str, ...] = ()
+    # Fields joined with "." in the second component of the URN string, and the field of its last component.
+    _hierarchy: tuple[str, ...] = ()
+    _reference: str = None
+
+    def __init__(self, urns: Iterable[CtsUrn | Cite2Urn | str] = ()):
+        self.columns = {name: [] for name in self.fields}
+        self.extend(urns)
+
+    @classmethod
+    def from_columns(cls, **columns: list) -> _UrnColumns:
+        """Create a container from lists of field values.
+
+        The lists are used as they are, without copying or validating their values.
+
+        Args:
+            **columns (list): One list for each field, all of the same length.
+
+        Returns:
+            _UrnColumns: A container holding the lists.
+
+        Raises:
+            ValueError: If a field is missing or unknown, or the lists differ in length.
+        """
+        if set(columns) != set(cls.fields):
+            raise ValueError(f"{cls.__name__} requires columns {', '.join(cls.fields)}, got {', '.join(columns)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns of {cls.__name__} must have the same length, got lengths {sorted(lengths)}")
+        container = cls.__new__(cls)
+        container.columns = {name: columns[name] for name in cls.fields}
+        return container
+
+    @classmethod
+    def _from_references(cls, base: CtsUrn | Cite2Urn, references: Iterable[str | None], check: Callable[[str], None]) -> _UrnColumns:
+        """Create a container of URNs sharing the hierarchy of ``base``, one per passage or object in ``references``."""
+        if not isinstance(base, cls.urn_class):
+            raise ValueError(f"{cls.__name__} requires a {cls.urn_class.__name__} base, got {type(base).__name__}")
+        name = cls.fields[-1]
+        values = list(references)
+        for value in values:
+            if value is not None:
+                if not isinstance(value, str):
+                    raise ValueError(f"Values of {name} must be strings or None, got {type(value).__name__}")
+                check(value)
+        columns = {field: [getattr(base, field)] * len(values) for field in cls.fields[:-1]}
+        columns[name] = values
+        return cls.from_columns(**columns)
+
+    def _fields_of(self, urn) -> dict:
+        if isinstance(urn, str):
+            fields = self.urn_class._parse_fields(urn)
+            if isinstance(fields, ParseError):
+                raise ValueError(fields.message)
+        elif isinstance(urn, self.urn_class):
+            fields = urn.__dict__
+        else:
+            raise ValueError(f"{type(self).__name__} can only hold {self.urn_class.__name__} objects or strings, got {type(urn).__name__}")
+        if fields["urn_type"] != self.urn_type:
+            raise ValueError(f"{type(self).__name__} can only hold URNs of type '{self.urn_type}', got '{fields['urn_type']}'")
+        return fields
+
+    def append(self, urn: CtsUrn | Cite2Urn | str) -> None:
+        """Add a URN to the end of the container.
+
+        Strings are split into fields directly, without constructing a URN model.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN to add.
+
+        Raises:
+            ValueError: If the URN is of the wrong type, or a string is not a valid URN.
+        """
+        fields = self._fields_of(urn)
+        for name, values in self.columns.items():
+            values.append(fields[name])
+
+    def extend(self, urns: Iterable[CtsUrn | Cite2Urn | str]) -> None:
+        """Add many URNs to the end of the container.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): The URNs to add.
+
+        Raises:
+            ValueError: If a URN is of the wrong type, or a string is not a valid URN.
+        """
+        for urn in urns:
+            self.append(urn)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]])
+
+    def __getitem__(self, i: int | slice):
+        if isinstance(i, slice):
+            return type(self).from_columns(**{name: values[i] for name, values in self.columns.items()})
+        fields = {"urn_type": self.urn_type}
+        for name, values in self.columns.items():
+            fields[name] = values[i]
+        return self.urn_class._from_fields(fields, trusted=True)
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self)):
+            yield self[i]
+
+    def strings(self) -> list[str]:
+        """Serialize every URN in the container.
+
+        The strings are built column by column, without constructing URN objects.
+
+        Returns:
+            list[str]: The URN strings, in container order.
+        """
+        columns = self.columns
+        hierarchy = columns[self._hierarchy[0]]
+        for name in self._hierarchy[1:]:
+            hierarchy = [part if value is None else f"{part}.{value}" for part, value in zip(hierarchy, columns[name])]
+        prefix = f"urn:{self.urn_type}:"
+        return [
+            f"{prefix}{namespace}:{part}:{'' if reference is None else reference}"
+            for namespace, part, reference in zip(columns["namespace"], hierarchy, columns[self._reference])
+        ]
+
+
+class CtsUrnColumns(_UrnColumns):
+    """Column-oriented collection of CTS URNs.
+
+    Each field of ``CtsUrn`` is held in its own list, so a collection of URNs costs one string reference per field instead of one model per URN, and operations over a single field (such as selecting every passage) are plain list operations. Indexing and iteration construct ``CtsUrn`` objects on demand, without revalidating the stored values.
+
+    The container is the in-memory exchange format for columnar back ends such as ``urn_citation.arrow``.
+
+    Attributes:
+        columns (dict[str, list]): Lists of values for namespace, text_group, work, version, exemplar and passage. Missing values are None.
+    """
+
+    urn_class = CtsUrn
+    urn_type = "cts"
+    fields = ("namespace", "text_group", "work", "version", "exemplar", "passage")
+    _hierarchy = ("text_group", "work", "version", "exemplar")
+    _reference = "passage"
+
+    @classmethod
+    def from_passages(cls, base: CtsUrn, passages: Iterable[str | None]) -> CtsUrnColumns:
+        """Create a container of URNs in one work hierarchy, one for each of many passages.
+
+        The work hierarchy columns repeat the values of ``base``, so no URN objects are created. Passages are checked as by ``CtsUrn.set_passage``.
+
+        Args:
+            base (CtsUrn): A URN of the work hierarchy. Its passage is ignored.
+            passages (Iterable[str | None]): The passage components.
+
+        Returns:
+            CtsUrnColumns: The URNs, in the order of ``passages``.
+
+        Raises:
+            ValueError: If ``base`` is not a CtsUrn, or a passage is not a string or None, or has more than one or an empty subreference in a part.
+        """
+        return cls._from_references(base, passages, _check_passage)
+
+
+class Cite2UrnColumns(_UrnColumns):
+    """Column-oriented collection of CITE2 URNs.
+
+    Each field of ``Cite2Urn`` is held in its own list. See ``CtsUrnColumns``.
+
+    Attributes:
+        columns (dict[str, list]): Lists of values for namespace, collection, version and object_id. Missing values are None.
+    """
+
+    urn_class = Cite2Urn
+    urn_type = "cite2"
+    fields = ("namespace", "collection", "version", "object_id")
+    _hierarchy = ("collection", "version")
+    _reference = "object_id"
+
+    @classmethod
+    def from_objects(cls, base: Cite2Urn, object_ids: Iterable[str | None]) -> Cite2UrnColumns:
+        """Create a container of URNs in one collection, one for each of many object identifiers.
+
+        The collection columns repeat the values of ``base``, so no URN objects are created. See ``CtsUrnColumns.from_passages``.
+
+        Args:
+            base (Cite2Urn): A URN of the collection. Its object identifier is ignored.
+            object_ids (Iterable[str | None]): The object identifiers.
+
+        Returns:
+            Cite2UrnColumns: The URNs, in the order of ``object_ids``.
+
+        Raises:
+            ValueError: If ``base`` is not a Cite2Urn, or an identifier is not a string or None, or has more than one or an empty subreference in a part.
+        """
+        return cls._from_references(base, object_ids, _check_object_id)
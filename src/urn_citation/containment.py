@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn
+from .urn import Urn
+
+
+def _passage_ancestors(passage: str | None) -> list[str | None]:
+    """List the passages that contain a passage, itself included, per ``CtsUrn.passage_contains``."""
+    if passage is None:
+        return [None]
+    ancestors = [passage]
+    end = passage.find(".")
+    while end != -1:
+        # "1" contains "1.x" only if something follows the period.
+        if end + 1 < len(passage):
+            ancestors.append(passage[:end])
+        end = passage.find(".", end + 1)
+    return ancestors
+
+
+def _work_prefixes(urn: CtsUrn) -> list[tuple]:
+    """List the work hierarchies that contain a URN's, per ``CtsUrn.work_contains``."""
+    prefixes = []
+    prefix = ()
+    for value in (urn.text_group, urn.work, urn.version, urn.exemplar):
+        if value is None:
+            break
+        prefix += (value,)
+        prefixes.append(prefix)
+    return prefixes
+
+
+def _cts_work_key(urn: CtsUrn) -> tuple:
+    """Compose the tuple of non-None work hierarchy values, which ``work_contains`` compares."""
+    return tuple(value for value in (urn.text_group, urn.work, urn.version, urn.exemplar) if value is not None)
+
+
+def containment_pairs(
+    containers: Iterable[CtsUrn | Cite2Urn | str],
+    contained: Iterable[CtsUrn | Cite2Urn | str],
+) -> list[tuple[int, int]]:
+    """Compute which URNs of one collection contain which URNs of another.
+
+    The result is the relation ``containers[i].contains(contained[j])`` as a sparse list of index pairs. Instead of calling ``contains`` for every pair, the containers are indexed by the values ``contains`` compares, and each contained URN looks up the few keys that could contain it: its work hierarchy and each of its prefixes, combined with its passage and each passage above it in the citation hierarchy. The cost is proportional to the sizes of the two collections and of the result, not to their product.
+
+    CTS URNs are only compared with CTS URNs, and CITE2 URNs with CITE2 URNs. CTS URNs with range passages, for which ``CtsUrn.passage_contains`` raises ValueError, are skipped on both sides.
+
+    Args:
+        containers (Iterable[CtsUrn | Cite2Urn | str]): The containing URNs. Strings are parsed with ``Urn.parse``.
+        contained (Iterable[CtsUrn | Cite2Urn | str]): The URNs to test. Strings are parsed with ``Urn.parse``.
+
+    Returns:
+        list[tuple[int, int]]: Pairs ``(i, j)`` such that ``containers[i]`` contains ``contained[j]``, ordered by ``j`` and then ``i``.
+
+    Raises:
+        ValueError: If a string is not a valid URN.
+    """
+    cts_index = {}
+    cite2_index = {}
+    for i, urn in enumerate(containers):
+        if isinstance(urn, str):
+            urn = Urn.parse(urn)
+        if isinstance(urn, CtsUrn):
+            if not urn.is_range():
+                cts_index.setdefault((_cts_work_key(urn), urn.passage), []).append(i)
+        elif isinstance(urn, Cite2Urn):
+            cite2_index.setdefault((urn.namespace, urn.collection, urn.version, urn.object_id), []).append(i)
+
+    pairs = []
+    for j, urn in enumerate(contained):
+        if isinstance(urn, str):
+            urn = Urn.parse(urn)
+        matches = []
+        if isinstance(urn, CtsUrn):
+            if not cts_index or urn.is_range():
+                continue
+            for work_key in _work_prefixes(urn):
+                for passage in _passage_ancestors(urn.passage):
+                    matches.extend(cts_index.get((work_key, passage), ()))
+        elif isinstance(urn, Cite2Urn):
+            if not cite2_index:
+                continue
+            # A container without a version contains every version of its collection.
+            versions = (None,) if urn.version is None else (None, urn.version)
+            for version in versions:
+                matches.extend(cite2_index.get((urn.namespace, urn.collection, version, urn.object_id), ()))
+        matches.sort()
+        pairs.extend((i, j) for i in matches)
+    return pairs
@@ -1,7 +1,93 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from pydantic import model_validator
-from .urn import Urn
+from .symbols import intern_fields
+from .urn import ParseError, Urn, _construct
+
+
+# Fields with few distinct values across a corpus, shared through ``symbols.COMPONENTS``.
+_HIERARCHY = ("urn_type", "namespace", "text_group", "work", "version", "exemplar")
+
+
+def passage_levels(passage: str | None) -> list[str]:
+    """Split a single passage into its citation levels.
+
+    A subreference is not a citation level and is ignored.
+
+    Args:
+        passage (str | None): A passage component, e.g., "1.2" or "1.2@μῆνιν".
+
+    Returns:
+        list[str]: The dot-separated levels, e.g., ["1", "2"]. Empty if the passage is None.
+
+    Raises:
+        ValueError: If the passage is a range.
+    """
+    if passage is None:
+        return []
+    if "-" in passage:
+        raise ValueError(f"Citation levels are not defined for a range passage, got {passage}")
+    return passage.partition("@")[0].split(".")
+
+
+def passage_within(passage: str | None, container: str | None) -> bool:
+    """Check whether a passage, or both ends of a range, lie within a containing passage.
+
+    A single passage lies within ``container`` when ``CtsUrn.passage_contains`` holds: it is equal to ``container`` or below it in the citation hierarchy. Subreferences are compared as written, so "1.1@μῆνιν" lies within "1" but not within "1.1". A range lies within ``container`` when both of its ends do, so "1.5-1.9" lies within "1" but "1.5-2.3" does not. Every passage, and a missing one, lies within a ``container`` of None.
+
+    Args:
+        passage (str | None): The passage to check. It may be a range.
+        container (str | None): The containing passage. It may not be a range.
+
+    Returns:
+        bool: True if the passage lies within ``container``.
+    """
+    if container is None:
+        return True
+    if passage is None:
+        return False
+    prefix = container + "."
+    for end in passage.split("-"):
+        if end != container and not (len(end) > len(prefix) and end.startswith(prefix)):
+            return False
+    return True
+
+
+def _check_subreferences(passage: str) -> None:
+    """Check that each part of a passage has at most one non-empty subreference, raising ValueError if not."""
+    if "@" not in passage:
+        return
+    for part in passage.split("-"):
+        if part.count("@") > 1:
+            raise ValueError(f"Each passage component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
+        # Check for empty subreferences
+        if "@" in part:
+            subref_parts = part.split("@")
+            if len(subref_parts) != 2 or not subref_parts[1]:
+                raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+
+
+def truncate_passage(passage: str | None, depth: int) -> str | None:
+    """Cut a single passage down to a number of citation levels.
+
+    Args:
+        passage (str | None): A passage component.
+        depth (int): The number of levels to keep.
+
+    Returns:
+        str | None: The passage unchanged if it has no more than ``depth`` levels, otherwise its first ``depth`` levels without any subreference. None if ``depth`` is 0.
+
+    Raises:
+        ValueError: If the passage is a range or ``depth`` is negative.
+    """
+    if depth < 0:
+        raise ValueError(f"depth cannot be negative, got {depth}")
+    levels = passage_levels(passage)
+    if len(levels) <= depth:
+        return passage
+    return ".".join(levels[:depth]) or None
     
 class CtsUrn(Urn):
     """A CTS URN identifying a passage of a canonically citable text.
@@ -47,56 +133,60 @@ class CtsUrn(Urn):
         
         # Validate subreferences in passage component
         if self.passage is not None:
-            range_parts = self.passage.split("-")
-            for part in range_parts:
-                if part.count("@") > 1:
-                    raise ValueError(f"Each passage component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
-                # Check for empty subreferences
-                if "@" in part:
-                    subref_parts = part.split("@")
-                    if len(subref_parts) != 2 or not subref_parts[1]:
-                        raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+            _check_subreferences(self.passage)
         
+        intern_fields(self.__dict__, _HIERARCHY)
         return self
 
     @classmethod
-    def from_string(cls, raw_string):
+    def _parse_fields(cls, raw_string: str) -> dict | ParseError:
+        """Split a CTS URN string into field values, without raising on invalid input.
+
+        Args:
+            raw_string (str): The string to parse.
+
+        Returns:
+            dict | ParseError: Keyword arguments for the constructor, or a description of the first problem found.
+        """
+        if not isinstance(raw_string, str):
+            return ParseError("not_a_string", repr(raw_string), f"CTS URN must be a string, got {type(raw_string).__name__}")
+
         # 1. Split the string into a list of values
         parts = raw_string.split(":")
         if len(parts) != 5:
-            raise ValueError("Bad.")
+            return ParseError("part_count", raw_string, "Bad.")
         header, urn_type, namespace, work_component, passage_component = parts
 
         rangeparts = passage_component.split("-")
         if len(rangeparts) > 2:
-            raise ValueError(f"Passage component of CTS URN cannot have more than one hyphen to indicate a range, found {len(rangeparts)-1} hyphenated parts in {passage_component}.")
+            return ParseError("range_count", passage_component, f"Passage component of CTS URN cannot have more than one hyphen to indicate a range, found {len(rangeparts)-1} hyphenated parts in {passage_component}.")
         
         # Validate subreferences (at most one @ per range part)
         for part in rangeparts:
             if part.count("@") > 1:
-                raise ValueError(f"Each passage component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
+                return ParseError("subreference_count", part, f"Each passage component can have at most one @ delimiter for subreference, found {part.count('@')} in '{part}'")
             # Check for empty subreferences
             if "@" in part:
                 subref_parts = part.split("@")
                 if len(subref_parts) != 2 or not subref_parts[1]:
-                    raise ValueError(f"Subreference cannot be empty, found empty subreference in '{part}'")
+                    return ParseError("empty_subreference", part, f"Subreference cannot be empty, found empty subreference in '{part}'")
         
         if ".." in work_component:
-            raise ValueError(f"Work component of CTS URN cannot contain successive periods, found in {work_component}.")
+            return ParseError("work_successive_periods", work_component, f"Work component of CTS URN cannot contain successive periods, found in {work_component}.")
         
         if ".." in passage_component:
-            raise ValueError(f"Passage component of CTS URN cannot contain successive periods, found in {passage_component}.")
+            return ParseError("passage_successive_periods", passage_component, f"Passage component of CTS URN cannot contain successive periods, found in {passage_component}.")
         
         workparts = work_component.split(".")
         if len(workparts) > 4:
-            raise ValueError(f"Work component of CTS URN cannot have more than 4 dot-delimited components, got {len(workparts)} from {work_component}.")
+            return ParseError("work_part_count", work_component, f"Work component of CTS URN cannot have more than 4 dot-delimited components, got {len(workparts)} from {work_component}.")
 
         groupid, workid, versionid, exemplarid =         (workparts + [None] * 4)[:4]
      
         if not passage_component:
             passage_component = None
 
-        return cls(
+        return intern_fields(dict(
             urn_type=urn_type,
             namespace=namespace,
             text_group=groupid,
@@ -104,7 +194,43 @@ class CtsUrn(Urn):
             version=versionid,
             exemplar=exemplarid,
             passage=passage_component
-        )
+        ), _HIERARCHY)
+
+    @classmethod
+    def from_string(cls, raw_string: str, trusted: bool = False):
+        """Parse a CTS URN string into a ``CtsUrn`` instance.
+
+        Args:
+            raw_string (str): A string in the form ``urn:cts:<namespace>:<work.hierarchy>:<passage>``.
+            trusted (bool): If True, build the URN from the parsed fields without running model validation, which repeats checks the parser has already made. See ``urn_citation.trusted_construction``.
+
+        Returns:
+            CtsUrn: The parsed URN.
+
+        Raises:
+            ValueError: If the string is not a valid CTS URN.
+        """
+        fields = cls._parse_fields(raw_string)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+        return cls._from_fields(fields, trusted)
+
+    @classmethod
+    def try_parse(cls, raw_string: str) -> CtsUrn | ParseError:
+        """Parse a CTS URN string without raising an exception on invalid input.
+
+        Accepts exactly the strings that ``from_string`` accepts. On failure, returns a lightweight ``ParseError`` instead of raising, which is much cheaper when parsing large batches containing some malformed lines.
+
+        Args:
+            raw_string (str): The string to parse.
+
+        Returns:
+            CtsUrn | ParseError: The parsed URN, or a description of why the string is invalid.
+        """
+        fields = cls._parse_fields(raw_string)
+        if isinstance(fields, ParseError):
+            return fields
+        return cls._from_fields(fields)
 
     def __str__(self) -> str:
         """Serialize the CtsUrn to its string representation.
@@ -452,43 +578,63 @@ class CtsUrn(Urn):
         """Create a new CtsUrn without the passage component.
         
         Returns a new CtsUrn instance with the same work hierarchy but
-        with the passage set to None.
+        with the passage set to None. The work hierarchy was validated
+        with this URN, so the new URN is built without validation.
         
         Returns:
             CtsUrn: A new CtsUrn instance without the passage component.
         """
-        return CtsUrn(
-            urn_type=self.urn_type,
-            namespace=self.namespace,
-            text_group=self.text_group,
-            work=self.work,
-            version=self.version,
-            exemplar=self.exemplar,
-            passage=None
-        )
+        return self._with_passage(None)
     
     def set_passage(self, new_passage: str) -> CtsUrn:
         """Create a new CtsUrn with a specified passage component.
         
         Returns a new CtsUrn instance with the same work hierarchy but
-        with the passage set to the provided new_passage value.
+        with the passage set to the provided new_passage value. Only the
+        new passage is validated; the work hierarchy is shared with this URN.
         
         Args:
             new_passage (str | None): The new passage component to set.
         
         Returns:
             CtsUrn: A new CtsUrn instance with the updated passage component.
+
+        Raises:
+            ValueError: If the passage has more than one or an empty subreference in a part, or is not a string.
         """
-        return CtsUrn(
-            urn_type=self.urn_type,
-            namespace=self.namespace,
-            text_group=self.text_group,
-            work=self.work,
-            version=self.version,
-            exemplar=self.exemplar,
-            passage=new_passage
-        )
+        if new_passage is not None:
+            if not isinstance(new_passage, str):
+                # Let pydantic report the type error.
+                return CtsUrn(**{**self.__dict__, "passage": new_passage})
+            _check_subreferences(new_passage)
+        return self._with_passage(new_passage)
+
+    def with_passages(self, passages: Iterable[str | None]) -> list[CtsUrn]:
+        """Create a CtsUrn in this URN's work hierarchy for each of many passages.
 
+        The work hierarchy was validated with this URN, so only the passages are checked, as by ``set_passage``; the URNs are built without model validation. This is much faster than calling ``set_passage`` for each passage, e.g., to create the URN of every line or token of an edition.
+
+        Args:
+            passages (Iterable[str | None]): The passage components.
+
+        Returns:
+            list[CtsUrn]: One URN per passage, in order.
+
+        Raises:
+            ValueError: If a passage is not a string or None, or has more than one or an empty subreference in a part.
+        """
+        template = dict(self.__dict__)
+        urn_class = type(self)
+        urns = []
+        for passage in passages:
+            if passage is not None:
+                if not isinstance(passage, str):
+                    raise ValueError(f"Passage must be a string or None, got {type(passage).__name__}")
+                _check_subreferences(passage)
+            fields = template.copy()
+            fields["passage"] = passage
+            urns.append(_construct(urn_class, fields))
+        return urns
 
     def drop_subreference(self) -> CtsUrn:
         """Create a new CtsUrn with all subreferences removed.
@@ -616,4 +762,119 @@ class CtsUrn(Urn):
             version=self.version,
             exemplar=new_exemplar,
             passage=self.passage
-        )
\ No newline at end of file
+        )
+
+    def _with_passage(self, passage: str | None) -> CtsUrn:
+        # The passage is derived from this URN's valid passage, so it needs no validation.
+        fields = dict(self.__dict__)
+        fields["passage"] = passage
+        return type(self)._from_fields(fields, trusted=True)
+
+    def depth(self) -> int:
+        """Count the citation levels of the passage.
+
+        A subreference is not counted as a level, so "1.2@μῆνιν" has depth 2.
+
+        Returns:
+            int: The number of dot-separated levels of the passage, or 0 if there is no passage.
+
+        Raises:
+            ValueError: If the passage is a range.
+        """
+        return len(passage_levels(self.passage))
+
+    def truncate(self, depth: int) -> CtsUrn:
+        """Create a new CtsUrn with the passage cut down to a number of citation levels.
+
+        For example, truncating a line "1.2" to depth 1 gives its book "1".
+
+        Args:
+            depth (int): The number of levels to keep. 0 drops the passage.
+
+        Returns:
+            CtsUrn: A CtsUrn with the same work hierarchy. Its passage is unchanged if it has no more than ``depth`` levels; otherwise it has the first ``depth`` levels and no subreference.
+
+        Raises:
+            ValueError: If the passage is a range or ``depth`` is negative.
+        """
+        return self._with_passage(truncate_passage(self.passage, depth))
+
+    def parent(self) -> CtsUrn | None:
+        """Create the CtsUrn of the passage one level up in the citation hierarchy.
+
+        The parent of "1.2" is "1", and the parent of "1" is the URN with no passage. The parent of a passage with a subreference, such as "1.2@μῆνιν", is the passage without it, "1.2".
+
+        Returns:
+            CtsUrn | None: The parent URN, or None if there is no passage.
+
+        Raises:
+            ValueError: If the passage is a range.
+        """
+        if self.passage is None:
+            return None
+        if "-" in self.passage:
+            raise ValueError("parent cannot be called on a CtsUrn with a range passage")
+        if "@" in self.passage:
+            return self._with_passage(self.passage.partition("@")[0])
+        return self.truncate(self.depth() - 1)
+
+    @classmethod
+    def common_ancestor(cls, urns: Iterable[CtsUrn | str]) -> CtsUrn | None:
+        """Find the deepest CtsUrn above all of a collection of URNs.
+
+        The result has the longest work hierarchy shared by all URNs and the longest passage shared by all URNs, level by level. If all passages are identical, subreferences included, the result has that passage. If the URNs share no citation level, or any URN has no passage, the result has no passage.
+
+        URNs are consumed one at a time, so any iterable of any size may be used.
+
+        Args:
+            urns (Iterable[CtsUrn | str]): The URNs. Strings are split without constructing URN models.
+
+        Returns:
+            CtsUrn | None: The common ancestor, or None if there are no URNs, or they differ in namespace or text group.
+
+        Raises:
+            ValueError: If a string is not a valid CTS URN or a passage is a range.
+        """
+        first = None
+        for urn in urns:
+            if isinstance(urn, str):
+                fields = cls._parse_fields(urn)
+                if isinstance(fields, ParseError):
+                    raise ValueError(fields.message)
+            else:
+                fields = urn.__dict__
+            work = [fields["text_group"], fields["work"], fields["version"], fields["exemplar"]]
+            passage = fields["passage"]
+            levels = passage_levels(passage)
+            if first is None:
+                first = fields
+                common_work, common_passage, common_levels = work, passage, levels
+                continue
+            if fields["namespace"] != first["namespace"]:
+                return None
+            for i, value in enumerate(common_work):
+                if value is None or value != work[i]:
+                    common_work = common_work[:i] + [None] * (4 - i)
+                    break
+            if common_work[0] is None:
+                return None
+            if passage != common_passage:
+                shared = 0
+                for ours, theirs in zip(common_levels, levels):
+                    if ours != theirs:
+                        break
+                    shared += 1
+                common_levels = common_levels[:shared]
+                common_passage = ".".join(common_levels) or None
+        if first is None:
+            return None
+        text_group, work, version, exemplar = common_work
+        return cls._from_fields({
+            "urn_type": first["urn_type"],
+            "namespace": first["namespace"],
+            "text_group": text_group,
+            "work": work,
+            "version": version,
+            "exemplar": exemplar,
+            "passage": common_passage,
+        }, trusted=True)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+
+from .ordering import canonical_key
+
+ADDED = "+"
+REMOVED = "-"
+
+
+class SortedUrnDiff:
+    """Streaming comparison of two sorted URN sequences.
+
+    The sequences are walked together like the merge step of a merge sort, so memory use does not depend on their length. Iterating yields the differences in order, as pairs of ``ADDED`` ("+") or ``REMOVED`` ("-") and the URN string. The counters are complete once iteration has finished.
+
+    Both sequences must be sorted by ``key``; a sequence found out of order raises ValueError. Repeated URNs are compared as multisets: a URN listed twice in ``old`` and once in ``new`` is reported as removed once.
+
+    Attributes:
+        added (int): Number of URNs only in ``new``.
+        removed (int): Number of URNs only in ``old``.
+        unchanged (int): Number of URNs in both.
+    """
+
+    def __init__(self, old: Iterable[str], new: Iterable[str], key: Callable[[str], tuple] = canonical_key):
+        """Prepare a comparison.
+
+        Args:
+            old (Iterable[str]): The earlier URN strings, sorted by ``key``.
+            new (Iterable[str]): The later URN strings, sorted by ``key``.
+            key (Callable[[str], tuple]): The sort order of both sequences. Defaults to canonical order.
+        """
+        self._old = old
+        self._new = new
+        self._key = key
+        self.added = 0
+        self.removed = 0
+        self.unchanged = 0
+
+    def _keyed(self, values: Iterable[str], name: str) -> Iterator[tuple[tuple, str]]:
+        key = self._key
+        previous = None
+        for value in values:
+            current = key(value)
+            if previous is not None and current < previous:
+                raise ValueError(f"{name} is not sorted: {value} follows a later URN")
+            previous = current
+            yield current, value
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        old = self._keyed(self._old, "old")
+        new = self._keyed(self._new, "new")
+        old_item = next(old, None)
+        new_item = next(new, None)
+        while old_item is not None and new_item is not None:
+            if old_item[0] == new_item[0]:
+                self.unchanged += 1
+                old_item = next(old, None)
+                new_item = next(new, None)
+            elif old_item[0] < new_item[0]:
+                self.removed += 1
+                yield REMOVED, old_item[1]
+                old_item = next(old, None)
+            else:
+                self.added += 1
+                yield ADDED, new_item[1]
+                new_item = next(new, None)
+        while old_item is not None:
+            self.removed += 1
+            yield REMOVED, old_item[1]
+            old_item = next(old, None)
+        while new_item is not None:
+            self.added += 1
+            yield ADDED, new_item[1]
+            new_item = next(new, None)
+
+    def run(self) -> SortedUrnDiff:
+        """Walk both sequences to the end, only counting differences.
+
+        Returns:
+            SortedUrnDiff: This comparison, with its counters complete.
+        """
+        for _ in self:
+            pass
+        return self
+
+
+def _lines(path: str | os.PathLike) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+
+
+def diff_files(
+    old_path: str | os.PathLike,
+    new_path: str | os.PathLike,
+    added_path: str | os.PathLike | None = None,
+    removed_path: str | os.PathLike | None = None,
+    key: Callable[[str], tuple] = canonical_key,
+) -> SortedUrnDiff:
+    """Compare two sorted files of URNs, one URN per line.
+
+    Args:
+        old_path (str | os.PathLike): The earlier file, sorted by ``key``.
+        new_path (str | os.PathLike): The later file, sorted by ``key``.
+        added_path (str | os.PathLike | None): If given, the added URNs are written here, one per line, in order.
+        removed_path (str | os.PathLike | None): If given, the removed URNs are written here, one per line, in order.
+        key (Callable[[str], tuple]): The sort order of both files. Defaults to canonical order.
+
+    Returns:
+        SortedUrnDiff: The completed comparison with its counters.
+
+    Raises:
+        ValueError: If a file is not sorted.
+    """
+    diff = SortedUrnDiff(_lines(old_path), _lines(new_path), key)
+    outputs = {}
+    try:
+        if added_path is not None:
+            outputs[ADDED] = open(added_path, "w", encoding="utf-8")
+        if removed_path is not None:
+            outputs[REMOVED] = open(removed_path, "w", encoding="utf-8")
+        for change, urn in diff:
+            output = outputs.get(change)
+            if output is not None:
+                output.write(urn + "\n")
+    finally:
+        for output in outputs.values():
+            output.close()
+    return diff
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import heapq
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+
+from .ordering import canonical_key
+
+# Approximate memory held by the sort key of one URN, measured for CTS passage URNs.
+_KEY_BYTES = 800
+
+
+def _write_run(values: list[str], directory: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for value in values:
+            f.write(value + "\n")
+    return path
+
+
+def _read_run(path: str) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line[:-1]
+
+
+def _merge_runs(paths: list[str], key: Callable[[str], tuple]) -> Iterator[str]:
+    return heapq.merge(*(_read_run(path) for path in paths), key=key)
+
+
+def _unique(values: Iterable[str]) -> Iterator[str]:
+    previous = None
+    for value in values:
+        if value != previous:
+            yield value
+            previous = value
+
+
+def external_sort(
+    urns: Iterable[str],
+    memory_limit: int = 256 * 1024 * 1024,
+    key: Callable[[str], tuple] = canonical_key,
+    unique: bool = False,
+    fan_in: int = 64,
+    temp_dir: str | os.PathLike | None = None,
+) -> Iterator[str]:
+    """Sort URN strings that may not fit in memory.
+
+    URNs are read into a buffer until its estimated size reaches ``memory_limit``; each full buffer is sorted and spilled to a temporary file as a sorted run. The runs are then combined with a k-way merge that holds one line per run in memory. If there are more than ``fan_in`` runs, groups of runs are first merged into longer runs, so the number of files open at once stays bounded. If all URNs fit within the limit, they are sorted in memory and no files are written.
+
+    The temporary files are removed when the returned iterator is exhausted or closed.
+
+    Args:
+        urns (Iterable[str]): URN strings, e.g., the lines of a file without their line endings.
+        memory_limit (int): Approximate number of bytes of URNs and sort keys to hold in memory at once.
+        key (Callable[[str], tuple]): The sort order. Defaults to canonical order: work hierarchy, then passage in natural order.
+        unique (bool): If True, repeated URNs are output once.
+        fan_in (int): Maximum number of runs merged at once.
+        temp_dir (str | os.PathLike | None): Directory for the temporary files. Defaults to the system temporary directory.
+
+    Yields:
+        str: The URNs in sorted order.
+
+    Raises:
+        ValueError: If ``memory_limit`` is not positive or ``fan_in`` is less than 2.
+    """
+    if memory_limit < 1:
+        raise ValueError(f"memory_limit must be positive, got {memory_limit}")
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    return _external_sort(urns, memory_limit, key, unique, fan_in, temp_dir)
+
+
+def _external_sort(urns, memory_limit, key, unique, fan_in, temp_dir) -> Iterator[str]:
+    with tempfile.TemporaryDirectory(prefix="urnsort-", dir=temp_dir) as directory:
+        runs = []
+        buffer = []
+        size = 0
+        for urn in urns:
+            buffer.append(urn)
+            size += sys.getsizeof(urn) + _KEY_BYTES
+            if size >= memory_limit:
+                buffer.sort(key=key)
+                runs.append(_write_run(_unique(buffer) if unique else buffer, directory))
+                buffer = []
+                size = 0
+        buffer.sort(key=key)
+
+        if not runs:
+            merged = iter(buffer)
+        else:
+            if buffer:
+                runs.append(_write_run(buffer, directory))
+                buffer = []
+            while len(runs) > fan_in:
+                groups = [runs[i:i + fan_in] for i in range(0, len(runs), fan_in)]
+                runs = []
+                for group in groups:
+                    runs.append(_write_run(_merge_runs(group, key), directory))
+                    for path in group:
+                        os.remove(path)
+            merged = _merge_runs(runs, key)
+        yield from _unique(merged) if unique else merged
+
+
+def sort_file(
+    source: str | os.PathLike,
+    destination: str | os.PathLike,
+    memory_limit: int = 256 * 1024 * 1024,
+    key: Callable[[str], tuple] = canonical_key,
+    unique: bool = False,
+    fan_in: int = 64,
+    temp_dir: str | os.PathLike | None = None,
+) -> int:
+    """Sort a file of URNs, one per line, into another file.
+
+    See ``external_sort`` for how the sort works and for the options. Empty lines are dropped.
+
+    Args:
+        source (str | os.PathLike): The file to sort.
+        destination (str | os.PathLike): The file to write. It may be the same as ``source``, which is only replaced once the sort is complete.
+        memory_limit (int): Approximate number of bytes of URNs and sort keys to hold in memory at once.
+        key (Callable[[str], tuple]): The sort order. Defaults to canonical order.
+        unique (bool): If True, repeated URNs are written once.
+        fan_in (int): Maximum number of runs merged at once.
+        temp_dir (str | os.PathLike | None): Directory for the temporary files.
+
+    Returns:
+        int: The number of URNs written.
+    """
+    def lines():
+        with open(source, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line:
+                    yield line
+
+    directory = os.path.dirname(os.path.abspath(destination))
+    fd, partial = tempfile.mkstemp(suffix=".partial", dir=directory)
+    count = 0
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for urn in external_sort(lines(), memory_limit, key, unique, fan_in, temp_dir):
+                f.write(urn + "\n")
+                count += 1
+        os.replace(partial, destination)
+    except BaseException:
+        os.remove(partial)
+        raise
+    return count
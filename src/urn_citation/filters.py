@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable, Iterator
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn, passage_within
+from .sortedurns import SortedUrnArray
+from .sqlitestore import SqliteUrnStore
+from .urn import ParseError, Urn
+
+FIELDS = ("urn_type", "namespace", "text_group", "work", "version", "exemplar", "passage", "collection", "object_id")
+
+_COMPARISONS = {
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+    ast.In: "in", ast.NotIn: "not in", ast.Is: "is", ast.IsNot: "is not",
+}
+
+_STRING_METHODS = ("startswith", "endswith")
+
+# The passage of a CTS URN or the object of a CITE2 URN.
+_REFERENCE = 'f.get("passage", f.get("object_id"))'
+
+
+def _depth(reference: str | None) -> int:
+    """Count citation levels, using the first reference of a range."""
+    if reference is None:
+        return 0
+    return len(reference.partition("-")[0].partition("@")[0].split("."))
+
+
+def _is_literal(node: ast.expr) -> bool:
+    """Check whether an operand is a constant or a tuple or list of constants, which is never None."""
+    return (isinstance(node, ast.Constant) and node.value is not None) or isinstance(node, (ast.Tuple, ast.List))
+
+
+def _record(urn: CtsUrn | Cite2Urn | str) -> dict:
+    """Get the field values of a URN, splitting strings without constructing a model."""
+    if isinstance(urn, str):
+        urn_class = Urn._class_for(urn)
+        if isinstance(urn_class, ParseError):
+            raise ValueError(urn_class.message)
+        fields = urn_class._parse_fields(urn)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+        return fields
+    return urn.__dict__
+
+
+def _within_source(urn: CtsUrn) -> str:
+    if urn.is_range():
+        raise ValueError("within cannot be called with a CtsUrn with a range passage")
+    conditions = ['f["urn_type"] == "cts"', f'f["namespace"] == {urn.namespace!r}']
+    for name in ("text_group", "work", "version", "exemplar"):
+        value = getattr(urn, name)
+        if value is not None:
+            conditions.append(f'f["{name}"] == {value!r}')
+    if urn.passage is not None:
+        conditions.append(f'_passage_within(f["passage"], {urn.passage!r})')
+    return "(" + " and ".join(conditions) + ")"
+
+
+def _contained_by_source(urn: CtsUrn | Cite2Urn) -> str:
+    if isinstance(urn, Cite2Urn):
+        conditions = ['f["urn_type"] == "cite2"', f'f["namespace"] == {urn.namespace!r}', f'f["collection"] == {urn.collection!r}']
+        if urn.version is not None:
+            conditions.append(f'f["version"] == {urn.version!r}')
+        conditions.append(f'f["object_id"] == {urn.object_id!r}')
+        return "(" + " and ".join(conditions) + ")"
+    if urn.is_range():
+        raise ValueError("contained_by cannot be called with a CtsUrn with a range passage")
+    conditions = ['f["urn_type"] == "cts"']
+    for name in ("text_group", "work", "version", "exemplar"):
+        value = getattr(urn, name)
+        if value is not None:
+            conditions.append(f'f["{name}"] == {value!r}')
+    if urn.passage is None:
+        conditions.append('f["passage"] is None')
+    else:
+        conditions.append('f["passage"] is not None and "-" not in f["passage"]')
+        conditions.append(f'(f["passage"] == {urn.passage!r} or (f["passage"].startswith({urn.passage + "."!r}) and len(f["passage"]) >= {len(urn.passage) + 2}))')
+    return "(" + " and ".join(conditions) + ")"
+
+
+class _Compiler(ast.NodeVisitor):
+    """Translate a parsed filter expression to Python source, rejecting anything outside the filter language."""
+
+    def generic_visit(self, node):
+        raise ValueError(f"Unsupported syntax in filter expression: {ast.dump(node)}")
+
+    def visit_Expression(self, node):
+        return self.visit(node.body)
+
+    def visit_BoolOp(self, node):
+        operator = " and " if isinstance(node.op, ast.And) else " or "
+        return "(" + operator.join(self.visit(value) for value in node.values) + ")"
+
+    def visit_UnaryOp(self, node):
+        if not isinstance(node.op, ast.Not):
+            raise ValueError("Only 'not' is supported as a unary operator in filter expressions")
+        return f"(not {self.visit(node.operand)})"
+
+    def visit_Compare(self, node):
+        # A chain such as a < b < c becomes (a < b) and (b < c). Fields a URN lacks are None, so ordering and
+        # membership tests are only made when both sides have values, and are false otherwise.
+        terms = []
+        left_node, left = node.left, self.visit(node.left)
+        for operator, comparator in zip(node.ops, node.comparators):
+            right = self.visit(comparator)
+            symbol = _COMPARISONS[type(operator)]
+            if isinstance(operator, (ast.Eq, ast.NotEq, ast.Is, ast.IsNot)):
+                terms.append(f"({left} {symbol} {right})")
+            else:
+                guards = [f"{code} is not None" for operand, code in ((left_node, left), (comparator, right)) if not _is_literal(operand)]
+                test = " and ".join([*guards, f"{left} {'in' if isinstance(operator, ast.NotIn) else symbol} {right}"])
+                terms.append(f"(not ({test}))" if isinstance(operator, ast.NotIn) else f"({test})")
+            left_node, left = comparator, right
+        return terms[0] if len(terms) == 1 else "(" + " and ".join(terms) + ")"
+
+    def visit_Name(self, node):
+        if node.id not in FIELDS:
+            raise ValueError(f"Unknown field '{node.id}' in filter expression, expected one of {', '.join(FIELDS)}")
+        return f'f.get("{node.id}")'
+
+    def visit_Constant(self, node):
+        if node.value is not None and type(node.value) not in (str, int, bool):
+            raise ValueError(f"Unsupported constant in filter expression: {node.value!r}")
+        return repr(node.value)
+
+    def visit_Tuple(self, node):
+        return "(" + "".join(self.visit(element) + ", " for element in node.elts) + ")"
+
+    visit_List = visit_Tuple
+
+    def visit_Call(self, node):
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported in filter expressions")
+        if isinstance(node.func, ast.Attribute):
+            if node.func.attr not in _STRING_METHODS or not isinstance(node.func.value, ast.Name):
+                raise ValueError(f"Only {' and '.join(_STRING_METHODS)} can be called on fields in filter expressions")
+            field = self.visit(node.func.value)
+            arguments = ", ".join(self.visit(argument) for argument in node.args)
+            return f'(({field} or "").{node.func.attr}({arguments}) and {field} is not None)'
+        if not isinstance(node.func, ast.Name):
+            raise ValueError("Unsupported function call in filter expression")
+        name = node.func.id
+        if name in ("is_range", "has_subreference", "depth"):
+            if node.args:
+                raise ValueError(f"{name}() takes no arguments")
+            if name == "is_range":
+                return f'("-" in ({_REFERENCE} or ""))'
+            if name == "has_subreference":
+                return f'("@" in ({_REFERENCE} or ""))'
+            return f"_depth({_REFERENCE})"
+        if name in ("within", "contained_by"):
+            if len(node.args) != 1 or not isinstance(node.args[0], ast.Constant) or not isinstance(node.args[0].value, str):
+                raise ValueError(f"{name}() takes one URN string")
+            if name == "within":
+                return _within_source(CtsUrn.from_string(node.args[0].value))
+            return _contained_by_source(Urn.parse(node.args[0].value))
+        raise ValueError(f"Unknown function '{name}' in filter expression")
+
+
+class UrnFilter:
+    """A filter over URNs, written as an expression and compiled to a single predicate.
+
+    Expressions use Python syntax: ``and``, ``or``, ``not``, parentheses, and comparisons (``==``, ``!=``, ``<``, ``in``, ``is None`` ...) of URN fields with string or integer constants. The fields are urn_type, namespace, text_group, work, version, exemplar and passage for CTS URNs, and urn_type, namespace, collection, version and object_id for CITE2 URNs; fields a URN does not have are None. A comparison with ``<``, ``<=``, ``>``, ``>=`` or ``in`` is false when either side is None, and ``not in`` is then true, so filters can run over mixed streams of CTS and CITE2 URNs. Fields can also be tested with ``startswith`` and ``endswith``. The following functions are available:
+
+    - ``within("urn:cts:...")``: the URN lies within a CTS URN's namespace, work hierarchy and passage, as in ``SqliteUrnStore.within``.
+    - ``contained_by("urn:...")``: the given URN contains the URN, as in ``CtsUrn.contains`` or ``Cite2Urn.contains``. CTS ranges are never contained.
+    - ``is_range()`` and ``has_subreference()``: tests on the passage or object.
+    - ``depth()``: the number of citation levels of the passage or object (of its first reference, for a range).
+
+    For example: ``namespace == "greekLit" and within("urn:cts:greekLit:tlg0012.tlg001:1") and not has_subreference()``.
+
+    The whole expression is translated into the source of one Python function, so checking a URN costs one call instead of a call per predicate, and URNs given in ``within`` and ``contained_by`` are parsed once, when the filter is compiled.
+
+    Attributes:
+        expression (str): The filter expression.
+        source (str): Python source of the compiled predicate, which takes a dictionary of field values.
+    """
+
+    def __init__(self, expression: str):
+        """Compile a filter expression.
+
+        Args:
+            expression (str): The filter expression.
+
+        Raises:
+            ValueError: If the expression is not valid in the filter language, or a URN in it is invalid.
+        """
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as exc:
+            raise ValueError(f"Invalid filter expression: {exc.msg}") from exc
+        self.expression = expression
+        self.source = f"def predicate(f):\n    return {_Compiler().visit(tree)}\n"
+        namespace = {"_depth": _depth, "_passage_within": passage_within}
+        exec(compile(self.source, "<urn filter>", "exec"), namespace)
+        self._predicate = namespace["predicate"]
+        self._index_terms = self._find_index_terms(tree.body)
+
+    @staticmethod
+    def _find_index_terms(body: ast.expr) -> dict[str, str]:
+        """Find ``within`` and ``contained_by`` calls that every matching URN must satisfy."""
+        terms = body.values if isinstance(body, ast.BoolOp) and isinstance(body.op, ast.And) else [body]
+        found = {}
+        for term in terms:
+            if isinstance(term, ast.Call) and isinstance(term.func, ast.Name) and term.func.id in ("within", "contained_by"):
+                found.setdefault(term.func.id, term.args[0].value)
+        return found
+
+    def __call__(self, urn: CtsUrn | Cite2Urn | str) -> bool:
+        """Check whether a URN passes the filter.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN. Strings are split without constructing a model.
+
+        Returns:
+            bool: True if the URN matches the expression.
+
+        Raises:
+            ValueError: If a string is not a valid URN.
+        """
+        return bool(self._predicate(_record(urn)))
+
+    def filter(self, urns: Iterable[CtsUrn | Cite2Urn | str]) -> Iterator[CtsUrn | Cite2Urn | str]:
+        """Select the URNs of a stream that pass the filter.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): The URNs.
+
+        Yields:
+            CtsUrn | Cite2Urn | str: The matching URNs, unchanged and in input order.
+
+        Raises:
+            ValueError: If a string is not a valid URN.
+        """
+        predicate = self._predicate
+        for urn in urns:
+            if predicate(_record(urn)):
+                yield urn
+
+    def select(self, source: SortedUrnArray | SqliteUrnStore | Iterable[CtsUrn | Cite2Urn | str]) -> list:
+        """Select the URNs of a collection that pass the filter, using its index where possible.
+
+        If the expression is a conjunction with a ``within`` or ``contained_by`` term, the candidates are first narrowed with the collection's index: ``SqliteUrnStore.contained`` or ``SqliteUrnStore.within``, or ``SortedUrnArray.contained`` for ``within``. The full predicate is then checked on the candidates only. Other collections are scanned.
+
+        Args:
+            source (SortedUrnArray | SqliteUrnStore | Iterable[CtsUrn | Cite2Urn | str]): The URNs to filter.
+
+        Returns:
+            list: The matching URNs. URN strings in canonical order for indexed collections; otherwise the matching items in input order.
+        """
+        candidates = source
+        if isinstance(source, SqliteUrnStore):
+            if "contained_by" in self._index_terms:
+                candidates = source.contained(self._index_terms["contained_by"])
+            elif "within" in self._index_terms:
+                candidates = source.within(self._index_terms["within"])
+        elif isinstance(source, SortedUrnArray):
+            if "within" in self._index_terms:
+                candidates = source.contained(self._index_terms["within"])
+            else:
+                candidates = source.urns
+        return list(self.filter(candidates))
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn
+
+
+def _encode_varint(value: int, buffer: bytearray) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decode_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class FrontCodedUrnList:
+    """Immutable, sorted list of URNs stored with front coding.
+
+    URN strings are sorted by their UTF-8 bytes and grouped in blocks of ``block_size`` entries. The first entry of each block (a restart point) is stored in full; every other entry is stored as the length of the prefix it shares with the previous entry followed by the remaining suffix. Sorted URNs from the same text share long prefixes (e.g., ``urn:cts:greekLit:tlg0012.tlg001.msA:1.``), so the encoded list is a fraction of the size of the strings it holds.
+
+    Lookups binary search the restart points, then decode at most one block. Entries are returned as URN objects of the list's ``urn_class``, or as strings with ``string``.
+
+    Attributes:
+        urn_class (type): ``CtsUrn`` or ``Cite2Urn``, used to construct entries on access.
+        block_size (int): Number of entries between restart points.
+    """
+
+    def __init__(self, urns: Iterable[CtsUrn | Cite2Urn | str], urn_class: type = CtsUrn, block_size: int = 16):
+        """Build a front-coded list.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): URNs to store, in any order. They are sorted on construction.
+            urn_class (type): ``CtsUrn`` or ``Cite2Urn``, used to construct entries on access.
+            block_size (int): Number of entries between restart points.
+
+        Raises:
+            ValueError: If block_size is not a positive integer.
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be a positive integer, got {block_size}")
+        self.urn_class = urn_class
+        self.block_size = block_size
+
+        encoded = sorted(str(urn).encode("utf-8") for urn in urns)
+        self._length = len(encoded)
+        self._data = bytearray()
+        self._restarts = array("q")
+        previous = b""
+        for i, current in enumerate(encoded):
+            if i % block_size == 0:
+                self._restarts.append(len(self._data))
+                shared = 0
+            else:
+                shared = 0
+                limit = min(len(previous), len(current))
+                while shared < limit and previous[shared] == current[shared]:
+                    shared += 1
+            _encode_varint(shared, self._data)
+            _encode_varint(len(current) - shared, self._data)
+            self._data += current[shared:]
+            previous = current
+        self._data = bytes(self._data)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i: int) -> CtsUrn | Cite2Urn:
+        return self.urn_class.from_string(self.string(i))
+
+    def __iter__(self) -> Iterator[CtsUrn | Cite2Urn]:
+        for value in self.strings():
+            yield self.urn_class.from_string(value)
+
+    def __contains__(self, urn: CtsUrn | Cite2Urn | str) -> bool:
+        key = str(urn).encode("utf-8")
+        i = self._bisect(key)
+        return i < self._length and self._decode(i) == key
+
+    def nbytes(self) -> int:
+        """Get the size of the encoded entries.
+
+        Returns:
+            int: Number of bytes used by the front-coded data.
+        """
+        return len(self._data)
+
+    def string(self, i: int) -> str:
+        """Get one entry as a string.
+
+        Args:
+            i (int): Position of the entry. Negative positions count from the end.
+
+        Returns:
+            str: The URN string at that position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError(f"FrontCodedUrnList index {i} out of range for list of length {self._length}")
+        return self._decode(i).decode("utf-8")
+
+    def strings(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """Decode entries sequentially as strings.
+
+        Args:
+            start (int): Position of the first entry to decode.
+            stop (int | None): Position one past the last entry to decode, or None to decode to the end.
+
+        Yields:
+            str: Each URN string in sorted order.
+        """
+        if stop is None or stop > self._length:
+            stop = self._length
+        for value in self._decode_range(start, stop):
+            yield value.decode("utf-8")
+
+    def index(self, urn: CtsUrn | Cite2Urn | str) -> int:
+        """Find the position of a URN.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN to find.
+
+        Returns:
+            int: Position of the first entry equal to the URN.
+
+        Raises:
+            ValueError: If the URN is not in the list.
+        """
+        key = str(urn).encode("utf-8")
+        i = self._bisect(key)
+        if i < self._length and self._decode(i) == key:
+            return i
+        raise ValueError(f"{urn} is not in list")
+
+    def bisect_left(self, urn: CtsUrn | Cite2Urn | str) -> int:
+        """Find where a URN would be inserted to keep the list sorted.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN to locate.
+
+        Returns:
+            int: Position of the first entry not less than the URN.
+        """
+        return self._bisect(str(urn).encode("utf-8"))
+
+    def prefixed(self, prefix: str) -> Iterator[str]:
+        """Decode all entries beginning with a string prefix.
+
+        Args:
+            prefix (str): Leading characters of the URN strings to return (e.g., ``urn:cts:greekLit:tlg0012.tlg001.msA:1.``).
+
+        Yields:
+            str: Each matching URN string in sorted order.
+        """
+        key = prefix.encode("utf-8")
+        for value in self._decode_range(self._bisect(key), self._length):
+            if not value.startswith(key):
+                return
+            yield value.decode("utf-8")
+
+    def _bisect(self, key: bytes) -> int:
+        # Find the last block whose restart key is less than key, then scan it.
+        lo, hi = 0, len(self._restarts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._restart_key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return 0
+        block = lo - 1
+        start = block * self.block_size
+        stop = min(start + self.block_size, self._length)
+        for i, value in enumerate(self._decode_range(start, stop), start):
+            if value >= key:
+                return i
+        return stop
+
+    def _restart_key(self, block: int) -> bytes:
+        # Restart entries share no prefix, so the suffix is the whole key.
+        _, position = _decode_varint(self._data, self._restarts[block])
+        length, position = _decode_varint(self._data, position)
+        return self._data[position:position + length]
+
+    def _decode(self, i: int) -> bytes:
+        return next(self._decode_range(i, i + 1))
+
+    def _decode_range(self, start: int, stop: int) -> Iterator[bytes]:
+        if start >= stop:
+            return
+        block = start // self.block_size
+        position = self._restarts[block]
+        i = block * self.block_size
+        data = self._data
+        previous = b""
+        while i < stop:
+            shared, position = _decode_varint(data, position)
+            length, position = _decode_varint(data, position)
+            current = previous[:shared] + data[position:position + length]
+            position += length
+            if i >= start:
+                yield current
+            previous = current
+            i += 1
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .columns import CtsUrnColumns
+from .ctsurn import CtsUrn, passage_levels, truncate_passage
+
+
+def _split(urn: CtsUrn | str) -> tuple[str, str | None]:
+    """Split a URN into the text before its passage, including the final colon, and its passage."""
+    if isinstance(urn, str):
+        head, colon, passage = urn.rpartition(":")
+        return head + colon, passage or None
+    passage = urn.passage
+    text = str(urn)
+    return text[:len(text) - len(passage or "")], passage
+
+
+def depths(urns: Iterable[CtsUrn | str] | CtsUrnColumns) -> list[int]:
+    """Count the citation levels of the passages of many URNs.
+
+    Args:
+        urns (Iterable[CtsUrn | str] | CtsUrnColumns): The URNs. Strings are assumed to be valid CTS URNs and are not parsed.
+
+    Returns:
+        list[int]: The depth of each passage (see ``CtsUrn.depth``), in input order.
+
+    Raises:
+        ValueError: If a passage is a range.
+    """
+    if isinstance(urns, CtsUrnColumns):
+        passages = urns.columns["passage"]
+    else:
+        passages = (_split(urn)[1] for urn in urns)
+    return [len(passage_levels(passage)) for passage in passages]
+
+
+def truncate_many(urns: Iterable[CtsUrn | str] | CtsUrnColumns, depth: int) -> list[str] | CtsUrnColumns:
+    """Cut the passages of many URNs down to a number of citation levels.
+
+    This is ``CtsUrn.truncate`` applied to every URN, working on strings or columns so that no URN model is built per item.
+
+    Args:
+        urns (Iterable[CtsUrn | str] | CtsUrnColumns): The URNs. Strings are assumed to be valid CTS URNs and are not parsed.
+        depth (int): The number of levels to keep. 0 drops the passage.
+
+    Returns:
+        list[str] | CtsUrnColumns: The truncated URNs in input order: a ``CtsUrnColumns`` sharing all columns but the passage if ``urns`` is a ``CtsUrnColumns``, otherwise URN strings.
+
+    Raises:
+        ValueError: If a passage is a range or ``depth`` is negative.
+    """
+    if isinstance(urns, CtsUrnColumns):
+        columns = dict(urns.columns)
+        columns["passage"] = [truncate_passage(passage, depth) for passage in columns["passage"]]
+        return CtsUrnColumns.from_columns(**columns)
+    truncated = []
+    for urn in urns:
+        head, passage = _split(urn)
+        truncated.append(head + (truncate_passage(passage, depth) or ""))
+    return truncated
+
+
+def parents(urns: Iterable[CtsUrn | str]) -> list[str | None]:
+    """Find the parent of each of many URNs.
+
+    This is ``CtsUrn.parent`` applied to every URN, working on strings so that no URN model is built per item.
+
+    Args:
+        urns (Iterable[CtsUrn | str]): The URNs. Strings are assumed to be valid CTS URNs and are not parsed.
+
+    Returns:
+        list[str | None]: The parent URN strings in input order, with None for URNs without a passage.
+
+    Raises:
+        ValueError: If a passage is a range.
+    """
+    results = []
+    for urn in urns:
+        head, passage = _split(urn)
+        if passage is None:
+            results.append(None)
+            continue
+        if "-" in passage:
+            raise ValueError(f"Parent is not defined for a range passage, got {passage}")
+        reference, at, _ = passage.partition("@")
+        if at:
+            results.append(head + reference)
+        else:
+            results.append(head + reference.rpartition(".")[0])
+    return results
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import re
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn
+
+_DIGITS = re.compile(r"(\d+)")
+
+
+class _Top:
+    """Sentinel that sorts after every other value."""
+
+    def __eq__(self, other) -> bool:
+        return other is self
+
+    def __lt__(self, other) -> bool:
+        return False
+
+    def __gt__(self, other) -> bool:
+        return other is not self
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "TOP"
+
+
+TOP = _Top()
+
+
+def natural_key(identifier: str | None) -> tuple:
+    """Compose a sort key for a single identifier in natural order.
+
+    Runs of digits compare numerically and other runs compare as text, so that "2" sorts before "10" and "12r" before "12v". A missing identifier sorts before every identifier.
+
+    Args:
+        identifier (str | None): An identifier such as a text group, a citation level or an object id.
+
+    Returns:
+        tuple: The sort key. Text runs are at even positions and numbers at odd positions.
+    """
+    if identifier is None:
+        return ()
+    chunks = _DIGITS.split(identifier)
+    return tuple(int(chunk) if i % 2 else chunk for i, chunk in enumerate(chunks))
+
+
+def reference_key(reference: str | None) -> tuple:
+    """Compose a sort key for a passage or object reference.
+
+    The key is a tuple of three values: the natural keys of the dot-separated levels of the (first) reference, the subreference of the first reference, and the key of the range end, if any. A reference sorts before the references it contains, and a single reference sorts before a range beginning with it.
+
+    Args:
+        reference (str | None): A passage component of a CTS URN or object component of a CITE2 URN, possibly a range or with subreferences.
+
+    Returns:
+        tuple: The sort key.
+    """
+    if reference is None:
+        return ((), "", ())
+    begin, _, end = reference.partition("-")
+    begin, _, subreference = begin.partition("@")
+    levels = tuple(natural_key(level) for level in begin.split("."))
+    end_key = reference_key(end)[:2] if end else ()
+    return (levels, subreference, end_key)
+
+
+def cts_key(urn: CtsUrn | str) -> tuple:
+    """Compose the canonical sort key for a CTS URN.
+
+    URNs are ordered by namespace, text group, work, version and exemplar, then by passage in natural order. A URN sorts before the URNs it contains. All URNs sharing a work hierarchy prefix are contiguous, and so are all URNs below one passage of a given version.
+
+    Args:
+        urn (CtsUrn | str): A CtsUrn, or a string in CTS URN syntax. Strings are split without constructing a model.
+
+    Returns:
+        tuple: The sort key.
+    """
+    if isinstance(urn, str):
+        _, _, namespace, work_component, passage = urn.split(":")
+        text_group, work, version, exemplar = (work_component.split(".") + [None] * 4)[:4]
+        passage = passage or None
+    else:
+        namespace, text_group, work, version, exemplar, passage = urn.namespace, urn.text_group, urn.work, urn.version, urn.exemplar, urn.passage
+    return (
+        namespace,
+        natural_key(text_group),
+        natural_key(work),
+        natural_key(version),
+        natural_key(exemplar),
+    ) + reference_key(passage)
+
+
+def cite2_key(urn: Cite2Urn | str) -> tuple:
+    """Compose the canonical sort key for a CITE2 URN.
+
+    URNs are ordered by namespace, collection and version, then by object identifier in natural order.
+
+    Args:
+        urn (Cite2Urn | str): A Cite2Urn, or a string in CITE2 URN syntax. Strings are split without constructing a model.
+
+    Returns:
+        tuple: The sort key.
+    """
+    if isinstance(urn, str):
+        _, _, namespace, collection_info, object_id = urn.split(":")
+        collection, _, version = collection_info.partition(".")
+        version = version or None
+        object_id = object_id or None
+    else:
+        namespace, collection, version, object_id = urn.namespace, urn.collection, urn.version, urn.object_id
+    return (
+        namespace,
+        natural_key(collection),
+        natural_key(version),
+    ) + reference_key(object_id)
+
+
+def sort_key(urn: CtsUrn | Cite2Urn | str) -> tuple:
+    """Compose the canonical sort key for any URN.
+
+    CTS URNs sort before CITE2 URNs; within each type URNs follow ``cts_key`` or ``cite2_key``.
+
+    Args:
+        urn (CtsUrn | Cite2Urn | str): A URN object or a URN string.
+
+    Returns:
+        tuple: The sort key.
+
+    Raises:
+        ValueError: If a string is neither a CTS nor a CITE2 URN.
+    """
+    if isinstance(urn, CtsUrn) or (isinstance(urn, str) and urn.startswith("urn:cts:")):
+        return (0,) + cts_key(urn)
+    if isinstance(urn, Cite2Urn) or (isinstance(urn, str) and urn.startswith("urn:cite2:")):
+        return (1,) + cite2_key(urn)
+    raise ValueError(f"Cannot compose a sort key for {urn!r}")
+
+
+def canonical_key(urn: str) -> tuple:
+    """Compose the key of a URN string in canonical order, with exact ties broken by the string.
+
+    Different strings can have equal ``sort_key`` values (e.g., passages "1.01" and "1.1"), so the string itself is appended to make the order total. ``SortedUrnArray`` orders CTS URNs the same way, and ``external_sort`` and ``SortedUrnDiff`` use this order by default.
+
+    Args:
+        urn (str): A CTS or CITE2 URN string.
+
+    Returns:
+        tuple: The key.
+    """
+    return (sort_key(urn), urn)
+
+
+def cts_work_bounds(urn: CtsUrn) -> tuple[tuple, tuple]:
+    """Compose the range of sort keys of all URNs whose work hierarchy a CTS URN contains.
+
+    The URN's namespace and work hierarchy are treated as a prefix: fields that are None leave the corresponding levels open. The URN's passage is not considered.
+
+    Args:
+        urn (CtsUrn): The containing URN.
+
+    Returns:
+        tuple[tuple, tuple]: Lower and upper bounds, such that every contained URN has ``lower <= cts_key(u) < upper``.
+    """
+    prefix = [urn.namespace]
+    for value in (urn.text_group, urn.work, urn.version, urn.exemplar):
+        if value is None:
+            break
+        prefix.append(natural_key(value))
+    lower = tuple(prefix)
+    return lower, lower + (TOP,)
+
+
+def cts_passage_bounds(work_key: tuple, passage: str) -> tuple[tuple, tuple]:
+    """Compose the range of sort keys of the passages a passage contains within one version.
+
+    The bounds enclose the keys of the passage itself, with or without subreferences, of every passage below it in the citation hierarchy, and of every range beginning at one of these. Since keys ignore subreferences and leading zeros, and a range sorts by its first passage, not every URN within the bounds is contained; check candidates with ``urn_citation.ctsurn.passage_within``.
+
+    Args:
+        work_key (tuple): The first five values of ``cts_key`` for URNs of the version, i.e., namespace and work hierarchy.
+        passage (str): The containing passage. It may not be a range. Subreferences are ignored.
+
+    Returns:
+        tuple[tuple, tuple]: Lower and upper bounds, such that every contained URN has ``lower <= cts_key(u) < upper``.
+
+    Raises:
+        ValueError: If the passage is a range.
+    """
+    if "-" in passage:
+        raise ValueError(f"Cannot compose passage bounds for a range, got {passage}")
+    levels = reference_key(passage)[0]
+    return work_key + (levels,), work_key + (levels + (TOP,),)
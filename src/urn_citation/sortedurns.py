@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+
+from .ctsurn import CtsUrn, passage_within
+from .ordering import TOP, cts_key, cts_passage_bounds, cts_work_bounds
+
+
+class SortedUrnArray:
+    """Static array of CTS URNs in canonical order, searched by bisection.
+
+    URNs are sorted once on construction by work hierarchy, then by passage in natural order (see ``urn_citation.ordering.cts_key``). In this order, the URNs contained by a URN with a complete work hierarchy occupy one contiguous slice of the array, so range and containment queries are answered with binary searches instead of a scan.
+
+    Attributes:
+        urns (list[str]): URN strings in canonical order.
+    """
+
+    def __init__(self, urns: Iterable[CtsUrn | str]):
+        """Build a sorted array.
+
+        Args:
+            urns (Iterable[CtsUrn | str]): URNs to store, in any order.
+        """
+        pairs = sorted((cts_key(urn), str(urn)) for urn in urns)
+        self._keys = [key for key, _ in pairs]
+        self.urns = [value for _, value in pairs]
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> SortedUrnArray:
+        """Read an array saved with ``save``.
+
+        Args:
+            path (str | os.PathLike): Path to the saved array.
+
+        Returns:
+            SortedUrnArray: The stored array.
+        """
+        array = cls.__new__(cls)
+        with open(path, "r", encoding="utf-8") as f:
+            array.urns = f.read().splitlines()
+        # Saved URNs are already in canonical order.
+        array._keys = [cts_key(urn) for urn in array.urns]
+        return array
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the array to a file, one URN per line in canonical order.
+
+        Args:
+            path (str | os.PathLike): Path to write to.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for urn in self.urns:
+                f.write(urn + "\n")
+
+    def __len__(self) -> int:
+        return len(self.urns)
+
+    def __getitem__(self, i: int) -> CtsUrn:
+        return CtsUrn.from_string(self.urns[i])
+
+    def __iter__(self) -> Iterator[CtsUrn]:
+        for urn in self.urns:
+            yield CtsUrn.from_string(urn)
+
+    def _find(self, urn: CtsUrn | str) -> int | None:
+        # Different strings can share a key (e.g., passages "1.01" and "1.1"), so the run of equal keys is checked for the exact string.
+        key = cts_key(urn)
+        text = str(urn)
+        keys = self._keys
+        i = bisect_left(keys, key)
+        while i < len(keys) and keys[i] == key:
+            if self.urns[i] == text:
+                return i
+            i += 1
+        return None
+
+    def __contains__(self, urn: CtsUrn | str) -> bool:
+        return self._find(urn) is not None
+
+    def index(self, urn: CtsUrn | str) -> int:
+        """Find the position of a URN.
+
+        Args:
+            urn (CtsUrn | str): The URN to find.
+
+        Returns:
+            int: Position of the URN in canonical order.
+
+        Raises:
+            ValueError: If the URN is not in the array.
+        """
+        i = self._find(urn)
+        if i is None:
+            raise ValueError(f"{urn} is not in array")
+        return i
+
+    def contained_slices(self, urn: CtsUrn | str) -> list[slice]:
+        """Find the slices of URNs contained by a URN.
+
+        The URN's work hierarchy is treated as a prefix: a URN with no version contains all versions of its work, and a URN with no passage contains every passage of its work. A passage contains the URNs whose passages lie within it, as decided by ``urn_citation.ctsurn.passage_within``: itself and the passages below it in the citation hierarchy, as in ``CtsUrn.passage_contains``, and the ranges whose two ends both lie within it. A range such as "1.5-2.3" is not contained by "1", and "1@μῆνιν" is not contained by "1".
+
+        URNs contained by a URN with a complete work hierarchy form a single slice. If the containing URN has a passage but leaves lower levels of the work hierarchy open, there is one slice for each matching version or exemplar. Identifiers are compared as strings, so "1.01" is not contained by "1.1" even though the two sort together; URNs that sort among contained ones without being contained split a slice.
+
+        Args:
+            urn (CtsUrn | str): The containing URN. It may not be a range.
+
+        Returns:
+            list[slice]: Non-empty slices of contained URNs, in canonical order.
+
+        Raises:
+            ValueError: If the URN is a range.
+        """
+        if isinstance(urn, str):
+            urn = CtsUrn.from_string(urn)
+        if urn.is_range():
+            raise ValueError("contained_slices cannot be called on a CtsUrn with a range passage")
+        lower, upper = cts_work_bounds(urn)
+        start = bisect_left(self._keys, lower)
+        stop = bisect_left(self._keys, upper, start)
+        if urn.passage is None:
+            return self._matching_slices(urn, start, stop)
+
+        # Visit each distinct work hierarchy in the slice, jumping over its passages.
+        slices = []
+        i = start
+        while i < stop:
+            work_key = self._keys[i][:5]
+            passage_lower, passage_upper = cts_passage_bounds(work_key, urn.passage)
+            first = bisect_left(self._keys, passage_lower, i, stop)
+            last = bisect_left(self._keys, passage_upper, first, stop)
+            slices += self._matching_slices(urn, first, last)
+            i = bisect_left(self._keys, work_key + (TOP,), last, stop)
+        return slices
+
+    def _matching_slices(self, urn: CtsUrn, start: int, stop: int) -> list[slice]:
+        """Split the positions from ``start`` to ``stop`` into runs of URNs that ``urn`` contains by their strings.
+
+        Keys compare identifiers in natural order and ignore subreferences, and a range sorts by its first passage, so a key range can also hold URNs that are not contained (e.g., "1.01" in the range of "1.1", or "1.5-2.3" in the range of "1"); these are left out.
+        """
+        prefix = [value for value in (urn.text_group, urn.work, urn.version, urn.exemplar) if value is not None]
+        passage = urn.passage
+        slices = []
+        first = None
+        for i in range(start, stop):
+            _, _, namespace, work_component, value = self.urns[i].split(":")
+            matches = (
+                namespace == urn.namespace
+                and work_component.split(".")[:len(prefix)] == prefix
+                and passage_within(value or None, passage)
+            )
+            if matches and first is None:
+                first = i
+            elif not matches and first is not None:
+                slices.append(slice(first, i))
+                first = None
+        if first is not None:
+            slices.append(slice(first, stop))
+        return slices
+
+    def contained(self, urn: CtsUrn | str) -> list[str]:
+        """Get all URNs contained by a URN.
+
+        See ``contained_slices`` for how containment is determined.
+
+        Args:
+            urn (CtsUrn | str): The containing URN. It may not be a range.
+
+        Returns:
+            list[str]: The contained URNs in canonical order.
+        """
+        return [value for contained in self.contained_slices(urn) for value in self.urns[contained]]
+
+    def first_contained(self, urn: CtsUrn | str) -> CtsUrn | None:
+        """Get the first URN contained by a URN.
+
+        Args:
+            urn (CtsUrn | str): The containing URN (e.g., a book, or a version with no passage).
+
+        Returns:
+            CtsUrn | None: The first contained URN in canonical order, or None if there is none.
+        """
+        slices = self.contained_slices(urn)
+        if not slices:
+            return None
+        return self[slices[0].start]
+
+    def between_slice(self, begin: CtsUrn | str, end: CtsUrn | str) -> slice:
+        """Find the slice of URNs from one URN to another, inclusive.
+
+        The slice starts at the first URN not before ``begin``, and ends after the last URN contained by ``end``, so that an ``end`` of "1.5" includes "1.5.3" and an ``end`` of "2" includes all of book 2.
+
+        Args:
+            begin (CtsUrn | str): The first URN of the range.
+            end (CtsUrn | str): The last URN of the range. It may not be a range.
+
+        Returns:
+            slice: Positions of the URNs in the range. Empty if ``end`` sorts before ``begin``.
+
+        Raises:
+            ValueError: If ``end`` is a range.
+        """
+        if isinstance(end, str):
+            end = CtsUrn.from_string(end)
+        start = bisect_left(self._keys, cts_key(begin))
+        if end.passage is None:
+            _, upper = cts_work_bounds(end)
+        else:
+            _, upper = cts_passage_bounds(cts_key(end)[:5], end.passage)
+        stop = max(start, bisect_left(self._keys, upper))
+        return slice(start, stop)
+
+    def between(self, begin: CtsUrn | str, end: CtsUrn | str) -> list[str]:
+        """Get all URNs from one URN to another, inclusive.
+
+        See ``between_slice`` for how the range is determined.
+
+        Args:
+            begin (CtsUrn | str): The first URN of the range.
+            end (CtsUrn | str): The last URN of the range.
+
+        Returns:
+            list[str]: The URNs in the range in canonical order.
+        """
+        return self.urns[self.between_slice(begin, end)]
+
+    def range(self, urn: CtsUrn | str) -> list[str]:
+        """Get all URNs within the passage range of a range URN.
+
+        Args:
+            urn (CtsUrn | str): A URN with a range passage (e.g., ``...:1.1-1.50``).
+
+        Returns:
+            list[str]: The URNs in the range in canonical order.
+
+        Raises:
+            ValueError: If the URN is not a range.
+        """
+        if isinstance(urn, str):
+            urn = CtsUrn.from_string(urn)
+        if not urn.is_range():
+            raise ValueError("range can only be called with range URNs")
+        return self.between(urn.set_passage(urn.range_begin()), urn.set_passage(urn.range_end()))
+
+    def bisect_left(self, urn: CtsUrn | str) -> int:
+        """Find where a URN would be inserted to keep the array in canonical order.
+
+        Args:
+            urn (CtsUrn | str): The URN to locate.
+
+        Returns:
+            int: Position of the first URN not before the given URN.
+        """
+        return bisect_left(self._keys, cts_key(urn))
+
+    def bisect_right(self, urn: CtsUrn | str) -> int:
+        """Find the position after any entries equal to a URN.
+
+        Args:
+            urn (CtsUrn | str): The URN to locate.
+
+        Returns:
+            int: Position of the first URN after the given URN.
+        """
+        return bisect_right(self._keys, cts_key(urn))
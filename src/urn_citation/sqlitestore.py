@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+
+from .cite2urn import Cite2Urn
+from .ctsurn import CtsUrn, passage_within
+from .ordering import cite2_key, cts_key
+from .urn import ParseError, Urn
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cts_urns (
+    urn TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    text_group TEXT NOT NULL,
+    work TEXT,
+    version TEXT,
+    exemplar TEXT,
+    passage TEXT,
+    is_range INTEGER NOT NULL,
+    sort_key BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cts_urns_hierarchy ON cts_urns (text_group, work, version, exemplar, passage);
+CREATE INDEX IF NOT EXISTS cts_urns_order ON cts_urns (sort_key, urn);
+CREATE TABLE IF NOT EXISTS cite2_urns (
+    urn TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    version TEXT,
+    object_id TEXT,
+    sort_key BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cite2_urns_hierarchy ON cite2_urns (namespace, collection, object_id, version);
+CREATE INDEX IF NOT EXISTS cite2_urns_order ON cite2_urns (sort_key, urn);
+"""
+
+
+def encode_key(key) -> bytes:
+    """Encode a sort key as bytes that compare in the same order.
+
+    Keys from ``urn_citation.ordering`` are nested tuples of strings and non-negative integers, with the same type at the same position in every key. Each tuple item is introduced by 0x02 and a tuple is closed by 0x01, so a tuple sorts before any longer tuple it is a prefix of; strings are UTF-8 followed by 0x00; integers are their digit count followed by their digits. A digit count below 255 is one byte; a larger count is 0xFF followed by the count's own encoding, so integers of any length keep their order. Comparing the encodings bytewise, as SQLite does for BLOBs, gives the order of the keys.
+
+    Args:
+        key (tuple | str | int): A sort key, e.g., from ``cts_key``.
+
+    Returns:
+        bytes: The encoded key.
+    """
+    if isinstance(key, tuple):
+        return b"".join(b"\x02" + encode_key(item) for item in key) + b"\x01"
+    if isinstance(key, str):
+        return key.encode("utf-8") + b"\x00"
+    digits = str(key).encode("ascii")
+    if len(digits) < 0xFF:
+        return bytes([len(digits)]) + digits
+    return b"\xff" + encode_key(len(digits)) + digits
+
+
+def _fields(urn: CtsUrn | Cite2Urn | str) -> tuple[type, dict]:
+    if isinstance(urn, str):
+        urn_class = Urn._class_for(urn)
+        if isinstance(urn_class, ParseError):
+            raise ValueError(urn_class.message)
+        fields = urn_class._parse_fields(urn)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+        return urn_class, fields
+    if isinstance(urn, (CtsUrn, Cite2Urn)):
+        return type(urn), urn.__dict__
+    raise ValueError(f"Cannot store {type(urn).__name__} objects")
+
+
+def _successor(prefix: str, separator: str) -> tuple[str, str]:
+    """Bounds of the strings starting with ``prefix + separator``, for an indexed range scan."""
+    return prefix + separator, prefix + chr(ord(separator) + 1)
+
+
+class SqliteUrnStore:
+    """Persistent catalog of CTS and CITE2 URNs in an SQLite database.
+
+    Each component of a URN is stored in its own column, and a composite index over the work hierarchy and passage (or collection and object) answers hierarchy and containment queries with indexed range scans instead of Python loops. Each row also holds its canonical sort key (see ``encode_key``), so results are returned in canonical order by SQLite.
+
+    URNs are returned as strings. A URN is stored at most once.
+
+    Attributes:
+        connection (sqlite3.Connection): The database connection.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:"):
+        """Open or create a store.
+
+        Args:
+            path (str | os.PathLike): Path to the database file. Defaults to an in-memory database.
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.create_function("passage_within", 2, passage_within, deterministic=True)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> SqliteUrnStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, urn: CtsUrn | Cite2Urn | str) -> bool:
+        """Store a URN.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The URN to store.
+
+        Returns:
+            bool: True if the URN was added, False if it was already stored.
+
+        Raises:
+            ValueError: If a string is not a valid URN.
+        """
+        return self.add_many([urn]) == 1
+
+    def add_many(self, urns: Iterable[CtsUrn | Cite2Urn | str], batch_size: int = 10000) -> int:
+        """Store many URNs in bulk.
+
+        URNs are inserted in batches, each in a single transaction. If a URN is invalid, the URNs of earlier batches remain stored and none of its own batch are.
+
+        Args:
+            urns (Iterable[CtsUrn | Cite2Urn | str]): The URNs to store.
+            batch_size (int): Number of URNs inserted per transaction.
+
+        Returns:
+            int: The number of URNs added, not counting those already stored.
+
+        Raises:
+            ValueError: If a string is not a valid URN.
+        """
+        added = 0
+        cts_rows, cite2_rows = [], []
+        for urn in urns:
+            urn_class, fields = _fields(urn)
+            if issubclass(urn_class, CtsUrn):
+                text = str(urn) if not isinstance(urn, str) else urn
+                passage = fields["passage"]
+                cts_rows.append((
+                    text, fields["namespace"], fields["text_group"], fields["work"], fields["version"], fields["exemplar"],
+                    passage, passage is not None and "-" in passage, encode_key(cts_key(text)),
+                ))
+            else:
+                text = str(urn) if not isinstance(urn, str) else urn
+                cite2_rows.append((
+                    text, fields["namespace"], fields["collection"], fields["version"], fields["object_id"],
+                    encode_key(cite2_key(text)),
+                ))
+            if len(cts_rows) + len(cite2_rows) >= batch_size:
+                added += self._insert(cts_rows, cite2_rows)
+                cts_rows, cite2_rows = [], []
+        return added + self._insert(cts_rows, cite2_rows)
+
+    def _insert(self, cts_rows: list[tuple], cite2_rows: list[tuple]) -> int:
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany("INSERT OR IGNORE INTO cts_urns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", cts_rows)
+            self.connection.executemany("INSERT OR IGNORE INTO cite2_urns VALUES (?, ?, ?, ?, ?, ?)", cite2_rows)
+        return self.connection.total_changes - before
+
+    def __len__(self) -> int:
+        (cts,), = self.connection.execute("SELECT count(*) FROM cts_urns")
+        (cite2,), = self.connection.execute("SELECT count(*) FROM cite2_urns")
+        return cts + cite2
+
+    def __contains__(self, urn: CtsUrn | Cite2Urn | str) -> bool:
+        text = str(urn)
+        table = "cite2_urns" if text.startswith("urn:cite2:") else "cts_urns"
+        return self.connection.execute(f"SELECT 1 FROM {table} WHERE urn = ?", (text,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for table in ("cts_urns", "cite2_urns"):
+            for (urn,) in self.connection.execute(f"SELECT urn FROM {table} ORDER BY sort_key, urn"):
+                yield urn
+
+    def _select(self, table: str, conditions: list[str], parameters: list) -> list[str]:
+        where = " AND ".join(conditions) or "1"
+        rows = self.connection.execute(f"SELECT urn FROM {table} WHERE {where} ORDER BY sort_key, urn", parameters)
+        return [urn for (urn,) in rows]
+
+    @staticmethod
+    def _cts_work_conditions(urn: CtsUrn, conditions: list[str], parameters: list) -> None:
+        for name in ("text_group", "work", "version", "exemplar"):
+            value = getattr(urn, name)
+            if value is not None:
+                conditions.append(f"{name} = ?")
+                parameters.append(value)
+
+    def contained(self, urn: CtsUrn | Cite2Urn | str) -> list[str]:
+        """Get the stored URNs a URN contains.
+
+        Containment is the same as ``CtsUrn.contains`` or ``Cite2Urn.contains``: for CTS URNs the work hierarchy fields of ``urn`` that are not None must match (the namespace is not compared) and the passage must be equal or below ``urn``'s passage in the citation hierarchy; a URN without a passage contains only URNs without a passage. Stored range URNs are never contained.
+
+        Args:
+            urn (CtsUrn | Cite2Urn | str): The containing URN. A CTS URN may not be a range.
+
+        Returns:
+            list[str]: The contained URNs in canonical order.
+
+        Raises:
+            ValueError: If ``urn`` is not a valid URN, or is a CTS range.
+        """
+        if isinstance(urn, str):
+            urn = Urn.parse(urn)
+        conditions, parameters = [], []
+        if isinstance(urn, Cite2Urn):
+            conditions += ["namespace = ?", "collection = ?"]
+            parameters += [urn.namespace, urn.collection]
+            if urn.version is not None:
+                conditions.append("version = ?")
+                parameters.append(urn.version)
+            if urn.object_id is None:
+                conditions.append("object_id IS NULL")
+            else:
+                conditions.append("object_id = ?")
+                parameters.append(urn.object_id)
+            return self._select("cite2_urns", conditions, parameters)
+
+        if urn.is_range():
+            raise ValueError("contained cannot be called on a CtsUrn with a range passage")
+        self._cts_work_conditions(urn, conditions, parameters)
+        conditions.append("is_range = 0")
+        if urn.passage is None:
+            conditions.append("passage IS NULL")
+        else:
+            lower, upper = _successor(urn.passage, ".")
+            conditions.append("(passage = ? OR (passage > ? AND passage < ?))")
+            parameters += [urn.passage, lower, upper]
+        return self._select("cts_urns", conditions, parameters)
+
+    def within(self, urn: CtsUrn | str) -> list[str]:
+        """Get the stored CTS URNs within a URN's work hierarchy and passage.
+
+        The URN's namespace and work hierarchy are treated as prefixes, as in ``SortedUrnArray.contained``: a URN with no version selects all versions of its work, and a URN with no passage selects every passage of its work. A passage selects the URNs whose passages lie within it, as decided by ``urn_citation.ctsurn.passage_within``: itself, the passages below it, and the ranges whose two ends both lie within it.
+
+        Args:
+            urn (CtsUrn | str): The selecting URN. It may not be a range.
+
+        Returns:
+            list[str]: The selected URNs in canonical order.
+
+        Raises:
+            ValueError: If ``urn`` is not a valid CTS URN, or is a range.
+        """
+        if isinstance(urn, str):
+            urn = CtsUrn.from_string(urn)
+        if urn.is_range():
+            raise ValueError("within cannot be called on a CtsUrn with a range passage")
+        conditions, parameters = ["namespace = ?"], [urn.namespace]
+        self._cts_work_conditions(urn, conditions, parameters)
+        if urn.passage is not None:
+            # "-" and "." are adjacent characters, so one indexed scan finds the ranges and lower levels to check.
+            range_lower, _ = _successor(urn.passage, "-")
+            _, level_upper = _successor(urn.passage, ".")
+            conditions.append("(passage = ? OR (passage >= ? AND passage < ? AND passage_within(passage, ?)))")
+            parameters += [urn.passage, range_lower, level_upper, urn.passage]
+        return self._select("cts_urns", conditions, parameters)
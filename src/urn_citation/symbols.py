@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+
+
+class SymbolTable:
+    """Table assigning integer IDs to strings, holding one shared copy of each string.
+
+    Interning a string returns the table's copy of it, so equal component strings of many URNs are one object in memory, and equality tests between them succeed on the identity check Python makes before comparing characters. Each distinct string also has a stable integer ID, in order of first use, for compact storage or comparison of components.
+
+    Lookups do not lock and may run in any number of threads. Adding a new string takes a lock, so concurrent threads always agree on its ID. Strings are never removed, so a table should only hold values with few distinct members, such as namespaces and work identifiers.
+
+    Attributes:
+        symbols (list[str]): The interned strings, indexed by ID.
+    """
+
+    def __init__(self):
+        """Create an empty table."""
+        self.symbols = []
+        self._ids = {}
+        self._copies = {}
+        self._lock = threading.Lock()
+
+    def id(self, symbol: str) -> int:
+        """Get the ID of a string, adding it to the table if it is new.
+
+        Args:
+            symbol (str): The string.
+
+        Returns:
+            int: The string's ID.
+        """
+        found = self._ids.get(symbol)
+        if found is None:
+            with self._lock:
+                found = self._ids.get(symbol)
+                if found is None:
+                    found = len(self.symbols)
+                    self.symbols.append(symbol)
+                    self._copies[symbol] = symbol
+                    self._ids[symbol] = found
+        return found
+
+    def intern(self, symbol: str | None) -> str | None:
+        """Get the table's copy of a string, adding it if it is new.
+
+        Args:
+            symbol (str | None): The string. None is returned unchanged.
+
+        Returns:
+            str | None: The shared copy of the string.
+        """
+        if symbol is None:
+            return None
+        copy = self._copies.get(symbol)
+        if copy is None:
+            copy = self.symbols[self.id(symbol)]
+        return copy
+
+    def symbol(self, id: int) -> str:
+        """Get the string with an ID.
+
+        Args:
+            id (int): The ID.
+
+        Returns:
+            str: The string.
+
+        Raises:
+            KeyError: If no string has the ID.
+        """
+        if not 0 <= id < len(self.symbols):
+            raise KeyError(id)
+        return self.symbols[id]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+# Shared by all URNs for the components of their work or collection hierarchy.
+COMPONENTS = SymbolTable()
+
+
+def intern_fields(fields: dict, names: tuple[str, ...]) -> dict:
+    """Replace the named values of a field dictionary with their copies in ``COMPONENTS``.
+
+    Args:
+        fields (dict): The field values, changed in place.
+        names (tuple[str, ...]): The fields to intern.
+
+    Returns:
+        dict: ``fields``.
+    """
+    copies = COMPONENTS._copies
+    for name in names:
+        value = fields[name]
+        if value is not None:
+            copy = copies.get(value)
+            fields[name] = copy if copy is not None else COMPONENTS.intern(value)
+    return fields
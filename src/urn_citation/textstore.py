@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from array import array
+from collections.abc import Iterable
+
+from .cex import CexIndex
+from .ctsurn import CtsUrn
+
+URNS_SUFFIX = ".urns"
+OFFSETS_SUFFIX = ".offsets"
+
+
+class TextStore:
+    """Passage texts of a corpus stored in a memory-mapped file.
+
+    A store is made of three files: a data file with the UTF-8 text of every passage in corpus order, each followed by a newline; a ``.urns`` file listing the passage URNs in the same order; and an ``.offsets`` file with the byte offset of each passage in the data file. Only the URN strings and offsets are held in memory. Text is read from the mapped file on request, either as a ``memoryview`` on the mapped bytes or as a decoded string.
+
+    A store may be shared between threads. The table of containing passages is built once, on first use, under a lock; all other state is read-only after the store is opened.
+
+    Because passages are stored in corpus order, a range of passages, or all the passages contained by a higher level of the citation hierarchy (e.g., a whole book), occupy one contiguous span of the data file.
+
+    Attributes:
+        path (str): Path to the data file.
+        urns (list[str]): Passage URNs in corpus order.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open an existing store.
+
+        Args:
+            path (str | os.PathLike): Path to the data file written by ``build`` or ``from_cex``.
+        """
+        self.path = os.fspath(path)
+        with open(self.path + URNS_SUFFIX, "r", encoding="utf-8") as f:
+            self.urns = f.read().splitlines()
+        self._offsets = array("q")
+        with open(self.path + OFFSETS_SUFFIX, "rb") as f:
+            self._offsets.frombytes(f.read())
+        self._positions = {urn: i for i, urn in enumerate(self.urns)}
+        self._spans = None
+        self._spans_lock = threading.Lock()
+
+        self._file = open(self.path, "rb")
+        if self._offsets[-1] > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            # mmap cannot map an empty file.
+            self._map = None
+            self._view = memoryview(b"")
+
+    @classmethod
+    def build(cls, passages: Iterable[tuple[CtsUrn | str, str]], path: str | os.PathLike) -> TextStore:
+        """Write a new store from passages in corpus order, and open it.
+
+        Args:
+            passages (Iterable[tuple[CtsUrn | str, str]]): Pairs of a passage URN and its text, in corpus order.
+            path (str | os.PathLike): Path to write the data file to.
+
+        Returns:
+            TextStore: The newly written store.
+
+        Raises:
+            ValueError: If a URN is repeated, or a text contains a newline.
+        """
+        path = os.fspath(path)
+        offsets = array("q", [0])
+        seen = set()
+        with open(path, "wb") as data, open(path + URNS_SUFFIX, "w", encoding="utf-8") as urns:
+            for urn, text in passages:
+                key = str(urn)
+                if key in seen:
+                    raise ValueError(f"Passage {key} appears more than once in corpus")
+                if "\n" in text:
+                    raise ValueError(f"Text of passage {key} cannot contain a newline")
+                seen.add(key)
+                encoded = text.encode("utf-8") + b"\n"
+                data.write(encoded)
+                urns.write(key + "\n")
+                offsets.append(offsets[-1] + len(encoded))
+        with open(path + OFFSETS_SUFFIX, "wb") as f:
+            offsets.tofile(f)
+        return cls(path)
+
+    @classmethod
+    def from_cex(cls, source: str | os.PathLike, path: str | os.PathLike, index: CexIndex | None = None, delimiter: str = "#") -> TextStore:
+        """Write a new store from the ``#!ctsdata`` blocks of a CEX source, and open it.
+
+        Args:
+            source (str | os.PathLike): Path to the CEX source.
+            path (str | os.PathLike): Path to write the data file to.
+            index (CexIndex | None): Index of the source. If None, one is loaded or built with ``CexIndex.for_source``.
+            delimiter (str): Column delimiter used in the ``#!ctsdata`` blocks.
+
+        Returns:
+            TextStore: The newly written store.
+        """
+        if index is None:
+            index = CexIndex.for_source(source)
+
+        def records():
+            for occurrence in range(len(index.blocks_labelled("ctsdata"))):
+                for record in index.read_block(source, "ctsdata", occurrence):
+                    urn, text = record.split(delimiter, 1)
+                    yield urn, text
+
+        return cls.build(records(), path)
+
+    def close(self) -> None:
+        """Release the memory map and close the data file.
+
+        Any views returned by ``view`` must be released before the store is closed.
+        """
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> TextStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.urns)
+
+    def __contains__(self, urn: CtsUrn | str) -> bool:
+        return str(urn) in self._positions
+
+    def view(self, urn: CtsUrn | str) -> memoryview:
+        """Get the stored bytes for a URN without copying them.
+
+        The URN may identify a single passage, a range of passages, or a passage (or whole version) containing other passages. Passages of a range or of a containing passage are joined by newlines, in corpus order. Subreferences are ignored.
+
+        Args:
+            urn (CtsUrn | str): The URN to retrieve.
+
+        Returns:
+            memoryview: UTF-8 encoded text, as a view on the mapped data file.
+
+        Raises:
+            KeyError: If the URN does not identify any passage in the store.
+        """
+        first, last = self.span(urn)
+        return self._view[self._offsets[first]:self._offsets[last + 1] - 1]
+
+    def text(self, urn: CtsUrn | str) -> str:
+        """Get the text for a URN.
+
+        Text is decoded from the mapped data file on each call. See ``view`` for how URNs are resolved.
+
+        Args:
+            urn (CtsUrn | str): The URN to retrieve.
+
+        Returns:
+            str: The text of the passage or passages.
+
+        Raises:
+            KeyError: If the URN does not identify any passage in the store.
+        """
+        return str(self.view(urn), "utf-8")
+
+    def span(self, urn: CtsUrn | str) -> tuple[int, int]:
+        """Find the corpus positions of the first and last passages identified by a URN.
+
+        Args:
+            urn (CtsUrn | str): A URN for a single passage, a range, or a containing passage.
+
+        Returns:
+            tuple[int, int]: Positions in corpus order of the first and last passages.
+
+        Raises:
+            KeyError: If the URN does not identify any passage in the store, including a string that is not a valid CTS URN.
+        """
+        if isinstance(urn, str):
+            position = self._positions.get(urn)
+            if position is not None:
+                return position, position
+            try:
+                urn = CtsUrn.from_string(urn)
+            except ValueError as exc:
+                raise KeyError(f"Not a valid CTS URN: {urn}") from exc
+        urn = urn.drop_subreference()
+
+        if urn.is_range():
+            first, _ = self._passage_span(urn.set_passage(urn.range_begin()))
+            _, last = self._passage_span(urn.set_passage(urn.range_end()))
+            if last < first:
+                raise KeyError(f"Range {urn} ends before it begins in corpus order")
+            return first, last
+        return self._passage_span(urn)
+
+    def _passage_span(self, urn: CtsUrn) -> tuple[int, int]:
+        key = str(urn)
+        position = self._positions.get(key)
+        if position is not None:
+            return position, position
+        spans = self._spans
+        if spans is None:
+            with self._spans_lock:
+                if self._spans is None:
+                    self._spans = self._containing_spans()
+                spans = self._spans
+        try:
+            return spans[key]
+        except KeyError:
+            raise KeyError(f"No passages for {key} in text store") from None
+
+    def _containing_spans(self) -> dict[str, tuple[int, int]]:
+        # Map every containing passage, and every version as a whole, to the
+        # positions of its first and last passage.
+        spans = {}
+        for i, urn in enumerate(self.urns):
+            work, passage = urn.rsplit(":", 1)
+            keys = [work + ":"]
+            parts = passage.split(".")
+            for depth in range(1, len(parts)):
+                keys.append(work + ":" + ".".join(parts[:depth]))
+            for key in keys:
+                if key in spans:
+                    spans[key] = (spans[key][0], i)
+                else:
+                    spans[key] = (i, i)
+        return spans
@@ -1,5 +1,86 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple
+
 from pydantic import BaseModel
 
+
+class ParseError(NamedTuple):
+    """Description of why a string could not be parsed as a URN.
+
+    Returned instead of raising an exception by the ``try_parse`` methods of URN classes, so that bulk parsing of mostly valid input avoids the cost of raising and catching exceptions on the failure path.
+
+    Attributes:
+        code (str): Short identifier for the kind of error (e.g., "part_count" or "empty_subreference").
+        component (str): The part of the string that is invalid.
+        message (str): Human-readable explanation, identical to the message ``from_string`` raises.
+    """
+    code: str
+    component: str
+    message: str
+
+
+def _urn_classes() -> dict[str, type]:
+    """Map URN type identifiers to the classes that parse them."""
+    # Imported here because the subclasses import this module.
+    from .cite2urn import Cite2Urn
+    from .ctsurn import CtsUrn
+    return {"cts": CtsUrn, "cite2": Cite2Urn}
+
+
+_trusted = ContextVar("urn_citation_trusted", default=False)
+
+
+@contextmanager
+def trusted_construction() -> Iterator[None]:
+    """Skip model validation when parsing URNs within a block.
+
+    Inside the block, ``from_string``, ``try_parse`` and ``Urn.parse`` build URNs from the parsed fields directly, without running pydantic validation or the model validators, as if called with ``trusted=True``. Strings are still split and checked by the parser, so the resulting URNs are the same as without the block for every valid string.
+
+    Use this only for input known to be valid, such as URNs read back from a store this package wrote. The setting is held in a context variable, so it applies to the current thread or task only.
+
+    Yields:
+        None
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+# Setters of the instance slots of pydantic models, called directly to skip attribute lookup.
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _construct(cls, fields: dict):
+    """Create a URN from a complete dictionary of field values without validating them.
+
+    This sets the same instance state that pydantic's own ``__setstate__`` does.
+    """
+    urn = cls.__new__(cls)
+    _set_dict(urn, fields)
+    _set_fields_set(urn, set(fields))
+    _set_extra(urn, None)
+    _set_private(urn, None)
+    return urn
+
+
+def _restore(cls, values, fields_set=None):
+    """Reconstruct a pickled URN from its field values, in field order, without revalidating them.
+
+    ``fields_set`` holds the names of the fields set explicitly, or is None if all of them were.
+    """
+    urn = _construct(cls, dict(zip(cls.__pydantic_fields__.keys(), values)))
+    if fields_set is not None:
+        _set_fields_set(urn, set(fields_set))
+    return urn
+
+
 class Urn(BaseModel):
     """Superclass for URN types.
 
@@ -10,3 +91,115 @@ class Urn(BaseModel):
 
     """    
     urn_type: str
+
+    @classmethod
+    def _from_fields(cls, fields: dict, trusted: bool = False):
+        """Create a URN from parsed field values, validating them unless construction is trusted."""
+        if trusted or _trusted.get():
+            return _construct(cls, fields)
+        return cls(**fields)
+
+    def __reduce__(self):
+        """Pickle the URN as a tuple of its field values.
+
+        The pickled values were validated when the URN was created, so unpickling restores them directly instead of running validators again. This keeps pickles small and cheap to load, e.g., when sending URNs to ``multiprocessing`` workers. The names of the fields set explicitly are pickled too, only if some field was left at its default, so ``model_dump(exclude_unset=True)`` gives the same result after a round trip.
+
+        Returns:
+            tuple: The reconstruction function and its arguments.
+        """
+        fields = self.__dict__
+        names = type(self).__pydantic_fields__
+        values = tuple(fields[name] for name in names)
+        fields_set = self.__pydantic_fields_set__
+        if len(fields_set) == len(names):
+            return (_restore, (type(self), values))
+        return (_restore, (type(self), values, frozenset(fields_set)))
+
+    @classmethod
+    def _class_for(cls, raw_string: str) -> type | ParseError:
+        """Find the URN class for a string from its type identifier."""
+        if not isinstance(raw_string, str):
+            return ParseError("not_a_string", repr(raw_string), f"URN must be a string, got {type(raw_string).__name__}")
+        parts = raw_string.split(":", 2)
+        if len(parts) < 3 or parts[0] != "urn":
+            return ParseError("prefix", raw_string, f"URN must start with 'urn:<type>:', got {raw_string}")
+        urn_class = _urn_classes().get(parts[1])
+        if urn_class is None:
+            return ParseError("urn_type", parts[1], f"Unsupported URN type '{parts[1]}' in {raw_string}")
+        if not issubclass(urn_class, cls):
+            return ParseError("urn_type", parts[1], f"{cls.__name__} cannot parse a URN of type '{parts[1]}'")
+        return urn_class
+
+    @classmethod
+    def parse(cls, raw_string: str) -> "Urn":
+        """Parse a URN string of any supported type.
+
+        The type identifier following ``urn:`` selects the class: ``cts`` strings are parsed with ``CtsUrn.from_string`` and ``cite2`` strings with ``Cite2Urn.from_string``.
+
+        Args:
+            raw_string (str): The string to parse.
+
+        Returns:
+            Urn: A ``CtsUrn`` or ``Cite2Urn``.
+
+        Raises:
+            ValueError: If the type is not supported, is not a subclass of the class ``parse`` is called on, or the string is not valid for its type.
+        """
+        urn_class = cls._class_for(raw_string)
+        if isinstance(urn_class, ParseError):
+            raise ValueError(urn_class.message)
+        return urn_class.from_string(raw_string)
+
+    @classmethod
+    def try_parse(cls, raw_string: str) -> "Urn | ParseError":
+        """Parse a URN string of any supported type without raising an exception on invalid input.
+
+        Args:
+            raw_string (str): The string to parse.
+
+        Returns:
+            Urn | ParseError: A ``CtsUrn`` or ``Cite2Urn``, or a description of why the string is invalid.
+        """
+        urn_class = cls._class_for(raw_string)
+        if isinstance(urn_class, ParseError):
+            return urn_class
+        return urn_class.try_parse(raw_string)
+
+    @classmethod
+    def parse_many(cls, raw_strings: Iterable[str], errors: str = "raise") -> "list[Urn | ParseError]":
+        """Parse a mixed batch of URN strings.
+
+        Strings are grouped by type identifier, and each group is parsed in one pass by its class, so the type is inspected once per string. Results are returned in input order.
+
+        Args:
+            raw_strings (Iterable[str]): The strings to parse.
+            errors (str): "raise" to raise ValueError for the first invalid string, or "return" to put a ``ParseError`` in its place.
+
+        Returns:
+            list[Urn | ParseError]: Parsed URNs (and, if ``errors`` is "return", parse errors) in input order.
+
+        Raises:
+            ValueError: If ``errors`` is "raise" and a string is invalid, or ``errors`` has another value.
+        """
+        if errors not in ("raise", "return"):
+            raise ValueError(f"errors must be 'raise' or 'return', got {errors!r}")
+        raw_strings = list(raw_strings)
+        results = [None] * len(raw_strings)
+        groups = {}
+        for i, raw_string in enumerate(raw_strings):
+            urn_class = cls._class_for(raw_string)
+            if isinstance(urn_class, ParseError):
+                results[i] = urn_class
+            else:
+                groups.setdefault(urn_class, []).append(i)
+
+        for urn_class, positions in groups.items():
+            parse = urn_class.try_parse
+            for i in positions:
+                results[i] = parse(raw_strings[i])
+
+        if errors == "raise":
+            for result in results:
+                if isinstance(result, ParseError):
+                    raise ValueError(result.message)
+        return results
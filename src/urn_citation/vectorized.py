@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError("urn_citation.vectorized requires numpy; install it with pip install 'urn-citation[numpy]'") from exc
+
+from .columns import CtsUrnColumns
+from .ctsurn import CtsUrn
+from .urn import ParseError
+
+ABSENT = -1
+"""Code of a citation level or work hierarchy field that is not present."""
+
+_WORK_FIELDS = ("text_group", "work", "version", "exemplar")
+_MAX_DIGITS = 18
+
+
+class PassageEncoder:
+    """Encoder of CTS URNs as fixed-depth integer arrays.
+
+    Each dot-separated level of a passage is encoded as one integer. Levels written as plain decimal numbers (without leading zeros) are encoded as their value; every other level, such as "12r", "pr" or a level carrying a subreference ("1@μῆνιν"), is looked up in a side table of symbols and encoded as a negative number below ``ABSENT``. Levels past the depth of a passage are ``ABSENT``. Two levels have the same code exactly when they are the same string, so comparisons of codes give the same results as the string comparisons of ``CtsUrn.passage_contains``.
+
+    Work hierarchy fields are encoded through the same symbol table, as non-negative symbol ids.
+
+    All collections compared with each other must be encoded by the same encoder. The encoder may be shared between threads: looking up a known symbol does not lock, and adding a new one takes a lock, so concurrent threads always agree on its code.
+
+    Attributes:
+        symbols (dict[str, int]): Symbol ids of the non-numeric levels and work hierarchy identifiers seen so far.
+    """
+
+    def __init__(self):
+        self.symbols = {}
+        self._lock = threading.Lock()
+
+    def _symbol(self, value: str) -> int:
+        symbol = self.symbols.get(value)
+        if symbol is None:
+            with self._lock:
+                symbol = self.symbols.get(value)
+                if symbol is None:
+                    symbol = self.symbols[value] = len(self.symbols)
+        return symbol
+
+    def level_code(self, level: str) -> int:
+        """Encode a single citation level.
+
+        Args:
+            level (str): A level of a passage, e.g., "12" or "12r".
+
+        Returns:
+            int: The level's value if it is a plain decimal number, otherwise a negative code from the symbol table.
+        """
+        if level.isdecimal() and level.isascii() and len(level) <= _MAX_DIGITS and (level == "0" or level[0] != "0"):
+            return int(level)
+        return ABSENT - 1 - self._symbol(level)
+
+    def encode(self, urns: Iterable[CtsUrn | str] | CtsUrnColumns, depth: int | None = None) -> EncodedUrns:
+        """Encode a collection of CTS URNs.
+
+        Args:
+            urns (Iterable[CtsUrn | str] | CtsUrnColumns): The URNs to encode. Strings are split without constructing URN models.
+            depth (int | None): Number of citation levels to encode. If None, the depth of the deepest passage is used.
+
+        Returns:
+            EncodedUrns: The encoded URNs, in input order.
+
+        Raises:
+            ValueError: If a string is not a valid CTS URN, a passage is a range, has an empty level or is deeper than ``depth``.
+        """
+        if isinstance(urns, CtsUrnColumns):
+            rows = zip(*(urns.columns[name] for name in _WORK_FIELDS + ("passage",)))
+        else:
+            rows = (_work_and_passage(urn) for urn in urns)
+
+        work_rows, level_rows = [], []
+        for *work, passage in rows:
+            work_rows.append([ABSENT if value is None else self._symbol(value) for value in work])
+            if passage is None:
+                level_rows.append([])
+                continue
+            if "-" in passage:
+                raise ValueError(f"Cannot encode a range passage, got {passage}")
+            levels = passage.split(".")
+            if "" in levels:
+                raise ValueError(f"Cannot encode a passage with an empty citation level, got {passage}")
+            level_rows.append([self.level_code(level) for level in levels])
+
+        depths = np.fromiter((len(levels) for levels in level_rows), dtype=np.int64, count=len(level_rows))
+        max_depth = int(depths.max()) if len(depths) else 0
+        if depth is None:
+            depth = max_depth
+        elif max_depth > depth:
+            raise ValueError(f"Found a passage with {max_depth} citation levels, deeper than depth {depth}")
+        codes = np.full((len(level_rows), depth), ABSENT, dtype=np.int64)
+        for i, levels in enumerate(level_rows):
+            codes[i, :len(levels)] = levels
+        work = np.array(work_rows, dtype=np.int64).reshape(len(work_rows), len(_WORK_FIELDS))
+        return EncodedUrns(self, work, codes, depths)
+
+
+class EncodedUrns:
+    """CTS URNs encoded as integer arrays by a ``PassageEncoder``.
+
+    Attributes:
+        encoder (PassageEncoder): The encoder that produced the arrays.
+        work (np.ndarray): Symbol ids of text group, work, version and exemplar, shape ``(n, 4)``.
+        codes (np.ndarray): Codes of the citation levels of each passage, shape ``(n, depth)``.
+        depths (np.ndarray): Number of citation levels of each passage, shape ``(n,)``. A URN with no passage has depth 0.
+    """
+
+    def __init__(self, encoder: PassageEncoder, work: np.ndarray, codes: np.ndarray, depths: np.ndarray):
+        self.encoder = encoder
+        self.work = work
+        self.codes = codes
+        self.depths = depths
+
+    def __len__(self) -> int:
+        return len(self.depths)
+
+    def __getitem__(self, i) -> EncodedUrns:
+        if isinstance(i, int):
+            i = slice(i, i + 1 or None)
+        return EncodedUrns(self.encoder, self.work[i], self.codes[i], self.depths[i])
+
+    @property
+    def depth(self) -> int:
+        """int: Number of encoded citation levels."""
+        return self.codes.shape[1]
+
+
+def _work_and_passage(urn: CtsUrn | str) -> tuple:
+    if isinstance(urn, str):
+        fields = CtsUrn._parse_fields(urn)
+        if isinstance(fields, ParseError):
+            raise ValueError(fields.message)
+    else:
+        fields = urn.__dict__
+    return tuple(fields[name] for name in _WORK_FIELDS) + (fields["passage"],)
+
+
+def _aligned_codes(containers: EncodedUrns, contained: EncodedUrns) -> tuple[np.ndarray, np.ndarray]:
+    if containers.encoder is not contained.encoder:
+        raise ValueError("Encoded URNs can only be compared if they were encoded by the same PassageEncoder")
+    depth = max(containers.depth, contained.depth)
+    return _pad(containers.codes, depth), _pad(contained.codes, depth)
+
+
+def _pad(codes: np.ndarray, depth: int) -> np.ndarray:
+    if codes.shape[1] == depth:
+        return codes
+    return np.pad(codes, ((0, 0), (0, depth - codes.shape[1])), constant_values=ABSENT)
+
+
+def passage_contains(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``passage_contains`` for aligned pairs of encoded URNs.
+
+    The two collections are compared element by element, following NumPy broadcasting: a collection of length 1 is compared with every element of the other.
+
+    Args:
+        containers (EncodedUrns): The containing URNs.
+        contained (EncodedUrns): The URNs to test.
+
+    Returns:
+        np.ndarray: Boolean array, True where the container's passage equals the other passage or lies above it in the citation hierarchy.
+
+    Raises:
+        ValueError: If the collections were encoded by different encoders or cannot be broadcast together.
+    """
+    a, b = _aligned_codes(containers, contained)
+    prefix = np.all((a == b) | (a == ABSENT), axis=1)
+    # A URN without a passage contains only URNs without a passage.
+    return prefix & ((containers.depths > 0) | (contained.depths == 0))
+
+
+def work_contains(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``work_contains`` for aligned pairs of encoded URNs.
+
+    Args:
+        containers (EncodedUrns): The containing URNs.
+        contained (EncodedUrns): The URNs to test.
+
+    Returns:
+        np.ndarray: Boolean array, True where every work hierarchy field present in the container equals the other URN's.
+
+    Raises:
+        ValueError: If the collections were encoded by different encoders or cannot be broadcast together.
+    """
+    if containers.encoder is not contained.encoder:
+        raise ValueError("Encoded URNs can only be compared if they were encoded by the same PassageEncoder")
+    return np.all((containers.work == contained.work) | (containers.work == ABSENT), axis=1)
+
+
+def contains(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``contains`` for aligned pairs of encoded URNs.
+
+    Args:
+        containers (EncodedUrns): The containing URNs.
+        contained (EncodedUrns): The URNs to test.
+
+    Returns:
+        np.ndarray: Boolean array, True where both the work hierarchy and the passage contain the other URN.
+    """
+    return work_contains(containers, contained) & passage_contains(containers, contained)
+
+
+def passage_contains_matrix(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``passage_contains`` for every pair of encoded URNs.
+
+    Levels are compared one at a time, so memory use is proportional to the size of the result rather than to the result times the depth.
+
+    Args:
+        containers (EncodedUrns): The containing URNs, one per row.
+        contained (EncodedUrns): The URNs to test, one per column.
+
+    Returns:
+        np.ndarray: Boolean matrix of shape ``(len(containers), len(contained))``.
+
+    Raises:
+        ValueError: If the collections were encoded by different encoders.
+    """
+    a, b = _aligned_codes(containers, contained)
+    result = (containers.depths[:, None] > 0) | (contained.depths[None, :] == 0)
+    for level in range(a.shape[1]):
+        container_level = a[:, level, None]
+        result &= (container_level == b[None, :, level]) | (container_level == ABSENT)
+    return result
+
+
+def work_contains_matrix(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``work_contains`` for every pair of encoded URNs.
+
+    Args:
+        containers (EncodedUrns): The containing URNs, one per row.
+        contained (EncodedUrns): The URNs to test, one per column.
+
+    Returns:
+        np.ndarray: Boolean matrix of shape ``(len(containers), len(contained))``.
+
+    Raises:
+        ValueError: If the collections were encoded by different encoders.
+    """
+    if containers.encoder is not contained.encoder:
+        raise ValueError("Encoded URNs can only be compared if they were encoded by the same PassageEncoder")
+    result = np.ones((len(containers), len(contained)), dtype=bool)
+    for field in range(len(_WORK_FIELDS)):
+        container_field = containers.work[:, field, None]
+        result &= (container_field == contained.work[None, :, field]) | (container_field == ABSENT)
+    return result
+
+
+def contains_matrix(containers: EncodedUrns, contained: EncodedUrns) -> np.ndarray:
+    """Check ``contains`` for every pair of encoded URNs.
+
+    Args:
+        containers (EncodedUrns): The containing URNs, one per row.
+        contained (EncodedUrns): The URNs to test, one per column.
+
+    Returns:
+        np.ndarray: Boolean matrix of shape ``(len(containers), len(contained))``.
+    """
+    return work_contains_matrix(containers, contained) & passage_contains_matrix(containers, contained)
@@ -0,0 +1,115 @@
+import pickle
+
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, UrnAggregator
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [
+    ILIAD + "1.1",
+    ILIAD + "1.2",
+    ILIAD + "2.1",
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+]
+
+CITE2_URNS = ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA.v1:12v", "urn:cite2:hmt:msA:12r", "urn:cite2:hmt:msB.v1:1r"]
+
+
+class TestUrnAggregator:
+    """Tests for streaming aggregation over URN hierarchies."""
+
+    def test_count_by_text_group(self):
+        """Test counting URNs per text group."""
+        aggregator = UrnAggregator()
+        aggregator.update(URNS)
+        assert dict(aggregator.items()) == {
+            ("cts", "greekLit", "tlg0012"): 6,
+            ("cts", "latinLit", "phi0959"): 1,
+        }
+
+    def test_count_by_version(self):
+        """Test that missing levels are None in keys."""
+        aggregator = UrnAggregator("version")
+        aggregator.update(URNS)
+        assert aggregator[("cts", "greekLit", "tlg0012", "tlg001", "msA")] == 3
+        assert aggregator[("cts", "greekLit", "tlg0012", None, None)] == 1
+        assert len(aggregator) == 5
+
+    def test_count_by_book(self):
+        """Test grouping by version and the first passage level."""
+        aggregator = UrnAggregator("version", depth=1)
+        aggregator.update(URNS[:3])
+        assert dict(aggregator.items()) == {
+            ("cts", "greekLit", "tlg0012", "tlg001", "msA", "1"): 2,
+            ("cts", "greekLit", "tlg0012", "tlg001", "msA", "2"): 1,
+        }
+
+    def test_objects_and_strings_agree(self):
+        """Test that CtsUrn and Cite2Urn objects give the same keys as strings."""
+        for level in ("namespace", "version"):
+            aggregator = UrnAggregator(level, depth=2)
+            for urn in URNS + CITE2_URNS:
+                parsed = CtsUrn.from_string(urn) if urn.startswith("urn:cts:") else Cite2Urn.from_string(urn)
+                assert aggregator.key(parsed) == aggregator.key(urn)
+
+    def test_cite2_by_collection(self):
+        """Test counting CITE2 URNs per collection and per version."""
+        by_collection = UrnAggregator("collection")
+        by_collection.update(CITE2_URNS)
+        assert dict(by_collection.items()) == {("cite2", "hmt", "msA"): 3, ("cite2", "hmt", "msB"): 1}
+        by_version = UrnAggregator("version")
+        by_version.update(CITE2_URNS)
+        assert by_version[("cite2", "hmt", "msA", None)] == 1
+
+    def test_level_missing_for_type(self):
+        """Test that a level of the other URN type is rejected."""
+        with pytest.raises(ValueError):
+            UrnAggregator("collection").add(URNS[0])
+        with pytest.raises(ValueError):
+            UrnAggregator("work").add(CITE2_URNS[0])
+
+    def test_invalid_arguments(self):
+        """Test that unknown levels, negative depths and non-URNs are rejected."""
+        with pytest.raises(ValueError):
+            UrnAggregator("book")
+        with pytest.raises(ValueError):
+            UrnAggregator(depth=-1)
+        with pytest.raises(ValueError):
+            UrnAggregator().add("not a urn")
+        with pytest.raises(ValueError):
+            UrnAggregator(depth=1).add(ILIAD + "1.1-1.5")
+
+    def test_values_are_summed(self):
+        """Test summing supplied values."""
+        aggregator = UrnAggregator("work")
+        aggregator.update(URNS[:3], [10, 20, 30])
+        assert aggregator[("cts", "greekLit", "tlg0012", "tlg001")] == 60
+
+    def test_custom_reducer(self):
+        """Test collecting values with a custom reducer."""
+        aggregator = UrnAggregator("version", reducer=lambda acc, value: acc | {value}, initial=set, combine=set.union)
+        aggregator.update(URNS[:3], ["a", "b", "a"])
+        assert aggregator[("cts", "greekLit", "tlg0012", "tlg001", "msA")] == {"a", "b"}
+
+    def test_merge_partial_results(self):
+        """Test that merged partial counts equal a single pass."""
+        whole = UrnAggregator("work", depth=1)
+        whole.update(URNS * 3)
+        parts = [UrnAggregator("work", depth=1) for _ in range(3)]
+        for i, part in enumerate(parts):
+            part.update((URNS * 3)[i::3])
+        merged = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            merged.merge(part)
+        assert dict(merged.items()) == dict(whole.items())
+
+    def test_merge_requires_same_grouping(self):
+        """Test that differently grouped aggregators cannot be merged."""
+        with pytest.raises(ValueError):
+            UrnAggregator("work").merge(UrnAggregator("version"))
+        with pytest.raises(ValueError):
+            UrnAggregator(reducer=max).merge(UrnAggregator(reducer=max))
@@ -0,0 +1,138 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from urn_citation import Cite2Urn, Cite2UrnColumns, CtsUrn, CtsUrnColumns  # noqa: E402
+from urn_citation.arrow import (  # noqa: E402
+    Cite2UrnType,
+    CtsUrnType,
+    collection_contains,
+    contains,
+    from_arrow,
+    passage_contains,
+    to_arrow,
+    work_contains,
+)
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [
+    ILIAD + "1.1",
+    ILIAD + "1.2@μῆνιν",
+    ILIAD + "10.1",
+    ILIAD + "1",
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg002:1.1",
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+]
+
+CITE2_URNS = ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA.v2:12r", "urn:cite2:hmt:msA.v1:12v", "urn:cite2:hmt:msB.v1:12r"]
+
+
+@pytest.fixture
+def array():
+    return to_arrow(CtsUrnColumns(URNS))
+
+
+class TestArrowConversion:
+    """Tests for converting URN containers to and from Arrow."""
+
+    def test_extension_type(self, array):
+        """Test that the array has the CTS extension type with struct storage."""
+        assert isinstance(array.type, CtsUrnType)
+        assert array.type.storage_type.field("passage").type == pa.string()
+        assert len(array) == len(URNS)
+
+    def test_scalars_are_urns(self, array):
+        """Test that converting to Python gives CtsUrn objects."""
+        assert array.to_pylist() == [CtsUrn.from_string(urn) for urn in URNS]
+
+    def test_round_trip(self, array):
+        """Test that the container survives a round trip."""
+        assert from_arrow(array).strings() == URNS
+        assert from_arrow(pa.chunked_array([array[:3], array[3:]])).strings() == URNS
+
+    def test_ipc_round_trip(self, array):
+        """Test that the extension type is restored when reading an IPC stream."""
+        table = pa.table({"urn": array})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        restored = pa.ipc.open_stream(sink.getvalue()).read_all()
+        assert isinstance(restored.schema.field("urn").type, CtsUrnType)
+        assert from_arrow(restored.column("urn")).strings() == URNS
+
+    def test_cite2(self):
+        """Test converting CITE2 URNs."""
+        array = to_arrow(Cite2UrnColumns(CITE2_URNS))
+        assert isinstance(array.type, Cite2UrnType)
+        assert array[0].as_py() == Cite2Urn.from_string(CITE2_URNS[0])
+        assert from_arrow(array).strings() == CITE2_URNS
+
+    def test_invalid_arguments(self):
+        """Test that non-URN inputs are rejected."""
+        with pytest.raises(ValueError):
+            to_arrow(URNS)
+        with pytest.raises(ValueError):
+            from_arrow(pa.array(URNS))
+
+
+class TestArrowKernels:
+    """Tests that vectorized predicates agree with the CtsUrn and Cite2Urn methods."""
+
+    @pytest.mark.parametrize("container", [ILIAD + "1", "urn:cts:greekLit:tlg0012:", "urn:cts:greekLit:tlg0012.tlg001:1.1", "urn:cts:latinLit:phi0959:"])
+    def test_work_contains(self, array, container):
+        """Test work containment against CtsUrn.work_contains."""
+        urn = CtsUrn.from_string(container)
+        expected = [urn.work_contains(CtsUrn.from_string(u)) for u in URNS]
+        assert work_contains(array, container).to_pylist() == expected
+
+    @pytest.mark.parametrize("container", [ILIAD + "1", ILIAD + "1.1", ILIAD + "10", "urn:cts:greekLit:tlg0012:"])
+    def test_passage_contains(self, array, container):
+        """Test passage containment against CtsUrn.passage_contains."""
+        urn = CtsUrn.from_string(container)
+        expected = [urn.passage_contains(CtsUrn.from_string(u)) for u in URNS]
+        assert passage_contains(array, urn).to_pylist() == expected
+
+    def test_contains(self, array):
+        """Test combined containment against CtsUrn.contains."""
+        urn = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1")
+        expected = [urn.contains(CtsUrn.from_string(u)) for u in URNS]
+        assert contains(array, urn).to_pylist() == expected
+
+    def test_chunked_array(self, array):
+        """Test that kernels accept chunked arrays."""
+        chunked = pa.chunked_array([array[:5], array[5:]])
+        assert passage_contains(chunked, ILIAD + "1").to_pylist() == passage_contains(array, ILIAD + "1").to_pylist()
+
+    def test_null_urns(self):
+        """Test that null URNs never match."""
+        storage = to_arrow(CtsUrnColumns(URNS[:2])).storage
+        with_null = pa.ExtensionArray.from_storage(CtsUrnType(), pa.concat_arrays([storage, pa.nulls(1, storage.type)]))
+        assert work_contains(with_null, ILIAD).to_pylist() == [True, True, False]
+        assert passage_contains(with_null, "urn:cts:greekLit:tlg0012:").to_pylist() == [False, False, False]
+
+    def test_ranges_are_rejected(self, array):
+        """Test that range passages raise as in CtsUrn.passage_contains."""
+        with pytest.raises(ValueError):
+            passage_contains(array, ILIAD + "1.1-1.5")
+        ranges = to_arrow(CtsUrnColumns([ILIAD + "1.1-1.5"]))
+        with pytest.raises(ValueError):
+            passage_contains(ranges, ILIAD + "1")
+
+    def test_wrong_array_type(self, array):
+        """Test that kernels check the array type."""
+        with pytest.raises(ValueError):
+            collection_contains(array, "urn:cite2:hmt:msA:12r")
+        with pytest.raises(ValueError):
+            work_contains(to_arrow(Cite2UrnColumns(CITE2_URNS)), ILIAD)
+
+    @pytest.mark.parametrize("container", ["urn:cite2:hmt:msA:12r", "urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msB:12r"])
+    def test_cite2_kernels(self, container):
+        """Test CITE2 containment against Cite2Urn methods."""
+        array = to_arrow(Cite2UrnColumns(CITE2_URNS))
+        urn = Cite2Urn.from_string(container)
+        parsed = [Cite2Urn.from_string(u) for u in CITE2_URNS]
+        assert collection_contains(array, urn).to_pylist() == [urn.collection_contains(u) for u in parsed]
+        assert contains(array, urn).to_pylist() == [urn.contains(u) for u in parsed]
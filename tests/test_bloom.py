@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, UrnBloomFilter
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [f"{ILIAD}{book}.{line}" for book in range(1, 25) for line in range(1, 200)]
+
+
+@pytest.fixture
+def bloom():
+    return UrnBloomFilter.from_urns(URNS, error_rate=0.01)
+
+
+class TestUrnBloomFilter:
+    """Tests for Bloom-filter membership of URNs."""
+
+    def test_no_false_negatives(self, bloom):
+        """Test that every added URN is reported present."""
+        assert all(urn in bloom for urn in URNS)
+        assert all(bloom.contains_many(URNS))
+
+    def test_false_positive_rate(self, bloom):
+        """Test that absent URNs are mostly rejected."""
+        absent = [f"{ILIAD}{book}.{line}" for book in range(25, 49) for line in range(1, 200)]
+        false_positives = sum(bloom.contains_many(absent))
+        assert false_positives / len(absent) < 0.03
+
+    def test_models_and_strings_agree(self):
+        """Test that URN objects and their strings hash the same way."""
+        urn = CtsUrn.from_string(ILIAD + "1.1")
+        cite = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r")
+        bloom = UrnBloomFilter.from_urns([urn, cite])
+        assert ILIAD + "1.1" in bloom
+        assert "urn:cite2:hmt:msA.v1:12r" in bloom
+        assert cite in bloom
+
+    def test_add_and_len(self):
+        """Test adding URNs one at a time."""
+        bloom = UrnBloomFilter(capacity=10)
+        assert ILIAD + "1.1" not in bloom
+        bloom.add(ILIAD + "1.1")
+        assert ILIAD + "1.1" in bloom
+        assert len(bloom) == 1
+
+    def test_possibly_present(self, bloom):
+        """Test filtering a batch of strings."""
+        batch = [ILIAD + "1.1", ILIAD + "1.2"]
+        assert bloom.possibly_present(batch) == batch
+
+    def test_sizing(self):
+        """Test that a lower error rate uses more bits and hashes."""
+        loose = UrnBloomFilter(capacity=1000, error_rate=0.1)
+        tight = UrnBloomFilter(capacity=1000, error_rate=0.001)
+        assert tight.num_bits > loose.num_bits
+        assert tight.num_hashes > loose.num_hashes
+
+    def test_expected_error_rate(self, bloom):
+        """Test that the estimated rate at capacity is near the target."""
+        assert bloom.expected_error_rate() == pytest.approx(0.01, rel=0.2)
+
+    @pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0), (10, 1)])
+    def test_invalid_parameters(self, capacity, error_rate):
+        """Test that invalid sizing parameters are rejected."""
+        with pytest.raises(ValueError):
+            UrnBloomFilter(capacity, error_rate)
+
+    def test_save_and_load(self, bloom, tmp_path):
+        """Test that a saved filter loads back with the same answers."""
+        path = tmp_path / "urns.bloom"
+        bloom.save(path)
+        loaded = UrnBloomFilter.load(path)
+        assert loaded.count == bloom.count
+        assert loaded.num_hashes == bloom.num_hashes
+        probes = URNS[:50] + [f"{ILIAD}99.{line}" for line in range(50)]
+        assert loaded.contains_many(probes) == bloom.contains_many(probes)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that loading a file that is not a filter fails."""
+        path = tmp_path / "not.bloom"
+        path.write_bytes(b"not a bloom filter at all, just some bytes")
+        with pytest.raises(ValueError):
+            UrnBloomFilter.load(path)
+
+    def test_load_rejects_truncated_file(self, bloom, tmp_path):
+        """Test that loading a truncated filter fails."""
+        path = tmp_path / "urns.bloom"
+        bloom.save(path)
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError):
+            UrnBloomFilter.load(path)
+
+    def test_concurrent_adds(self):
+        """Test that URNs added from many threads are all present."""
+        bloom = UrnBloomFilter(capacity=len(URNS))
+        chunks = [URNS[i::8] for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(bloom.update, chunks))
+        assert len(bloom) == len(URNS)
+        assert all(bloom.contains_many(URNS))
@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import CacheStats, Cite2Urn, ContainmentCache, CtsUrn
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+BOOK = CtsUrn.from_string(ILIAD + "1")
+LINES = [CtsUrn.from_string(f"{ILIAD}{book}.{line}") for book in range(1, 3) for line in range(1, 20)]
+
+
+class TestContainmentCache:
+    """Tests for memoized containment checks."""
+
+    def test_results_match_direct_checks(self):
+        """Test that cached results equal those of the URN methods."""
+        cache = ContainmentCache()
+        work = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:")
+        for _ in range(2):
+            for line in LINES:
+                assert cache.contains(BOOK, line) == BOOK.contains(line)
+                assert cache.passage_contains(BOOK, line) == BOOK.passage_contains(line)
+                assert cache.work_contains(work, line) == work.work_contains(line)
+
+    def test_hits_and_misses(self):
+        """Test that repeated checks are counted as hits."""
+        cache = ContainmentCache()
+        cache.contains(BOOK, LINES[0])
+        cache.contains(BOOK, LINES[0])
+        cache.contains(BOOK, LINES[1])
+        stats = cache.stats()
+        assert stats == CacheStats(hits=1, misses=2, evictions=0, size=2, maxsize=65536)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+        assert ContainmentCache().stats().hit_rate == 0.0
+
+    def test_equal_urns_share_results(self):
+        """Test that distinct but equal URN objects hit the same entry."""
+        cache = ContainmentCache()
+        cache.contains(BOOK, LINES[0])
+        assert cache.contains(CtsUrn.from_string(ILIAD + "1"), CtsUrn.from_string(ILIAD + "1.1"))
+        assert cache.stats().hits == 1
+
+    def test_keys_follow_field_order_and_class(self):
+        """Test that keys do not depend on the order of the instance dictionary, and include the URN class."""
+        cache = ContainmentCache()
+        cache.contains(BOOK, LINES[0])
+        reordered = CtsUrn.from_string(ILIAD + "1.1")
+        object.__setattr__(reordered, "__dict__", dict(reversed(reordered.__dict__.items())))
+        assert cache.contains(BOOK, reordered)
+        assert cache.stats().hits == 1
+        assert all(container[0] is CtsUrn and other[0] is CtsUrn for _, container, other in cache._results)
+
+    def test_predicates_are_cached_separately(self):
+        """Test that the same pair is stored once per predicate."""
+        cache = ContainmentCache()
+        cache.contains(BOOK, LINES[0])
+        cache.passage_contains(BOOK, LINES[0])
+        assert cache.stats().misses == 2
+
+    def test_strings(self):
+        """Test that URN strings are parsed on a miss and matched by string on a hit."""
+        cache = ContainmentCache()
+        assert cache.contains(ILIAD + "1", ILIAD + "1.5")
+        assert not cache.passage_contains(ILIAD + "1", ILIAD + "12")
+        assert cache.contains(ILIAD + "1", ILIAD + "1.5")
+        assert cache.stats().hits == 1
+        with pytest.raises(ValueError):
+            cache.contains("not a urn", ILIAD + "1")
+
+    def test_cite2(self):
+        """Test containment checks on CITE2 URNs."""
+        cache = ContainmentCache()
+        collection = Cite2Urn.from_string("urn:cite2:hmt:msA:12r")
+        versioned = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r")
+        assert cache.contains(collection, versioned)
+        assert not cache.contains(versioned, collection)
+        assert cache.contains("urn:cite2:hmt:msA:12r", "urn:cite2:hmt:msA.v1:12r")
+
+    def test_eviction(self):
+        """Test that the least recently used result is evicted at capacity."""
+        cache = ContainmentCache(maxsize=2)
+        cache.contains(BOOK, LINES[0])
+        cache.contains(BOOK, LINES[1])
+        cache.contains(BOOK, LINES[0])
+        cache.contains(BOOK, LINES[2])
+        assert len(cache) == 2
+        assert cache.stats().evictions == 1
+        cache.contains(BOOK, LINES[0])
+        assert cache.stats().hits == 2
+        cache.contains(BOOK, LINES[1])
+        assert cache.stats().misses == 4
+
+    def test_errors_are_not_cached(self):
+        """Test that checks raising ValueError raise each time and store nothing."""
+        cache = ContainmentCache()
+        span = CtsUrn.from_string(ILIAD + "1.1-1.5")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.passage_contains(span, LINES[0])
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Test that clear drops results and counters."""
+        cache = ContainmentCache()
+        cache.contains(BOOK, LINES[0])
+        cache.contains(BOOK, LINES[0])
+        cache.clear()
+        assert cache.stats() == CacheStats(0, 0, 0, 0, 65536)
+
+    def test_invalid_maxsize(self):
+        """Test that maxsize must be positive."""
+        with pytest.raises(ValueError):
+            ContainmentCache(maxsize=0)
+
+    def test_threads(self):
+        """Test that a cache shared between threads gives correct results and consistent counts."""
+        cache = ContainmentCache(maxsize=16)
+
+        def check(line):
+            return cache.contains(BOOK, line)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(check, LINES * 50))
+        assert results == [BOOK.contains(line) for line in LINES] * 50
+        stats = cache.stats()
+        assert stats.hits + stats.misses == len(LINES) * 50
+        assert stats.size <= 16
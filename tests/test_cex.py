@@ -0,0 +1,329 @@
+import bz2
+import gzip
+import lzma
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import (
+    CexIndex,
+    CexWriter,
+    Cite2Urn,
+    Cite2UrnColumns,
+    CtsUrn,
+    CtsUrnColumns,
+)
+from urn_citation.cex import sidecar_path
+
+SAMPLE_CEX = """#!cexversion
+3.0
+
+#!ctsdata
+// Iliad, book 1
+urn:cts:greekLit:tlg0012.tlg001.msA:1.1#Μῆνιν ἄειδε θεὰ Πηληϊάδεω Ἀχιλῆος
+urn:cts:greekLit:tlg0012.tlg001.msA:1.2#οὐλομένην, ἣ μυρί' Ἀχαιοῖς ἄλγε' ἔθηκε,
+urn:cts:greekLit:tlg0012.tlg001.msA:1.3#πολλὰς δ' ἰφθίμους ψυχὰς Ἄϊδι προΐαψεν
+
+urn:cts:greekLit:tlg0012.tlg001.msA:1.4#ἡρώων, αὐτοὺς δὲ ἑλώρια τεῦχε κύνεσσιν
+urn:cts:greekLit:tlg0012.tlg001.msA:1.5#οἰωνοῖσί τε πᾶσι, Διὸς δ' ἐτελείετο βουλή,
+
+#!relations
+urn:cite2:hmt:verbs.v1:commentsOn
+urn:cite2:hmt:msA.v1:12r#urn:cite2:hmt:verbs.v1:illustrates#urn:cts:greekLit:tlg0012.tlg001.msA:1.1
+
+#!ctsdata
+urn:cts:greekLit:tlg0012.tlg001.msB:1.1#Μῆνιν ἄειδε θεὰ
+"""
+
+
+@pytest.fixture
+def cex_file(tmp_path):
+    path = tmp_path / "sample.cex"
+    path.write_bytes(SAMPLE_CEX.encode("utf-8"))
+    return path
+
+
+class TestCexIndexBuild:
+    """Tests for building a block index from a CEX source."""
+
+    def test_blocks_are_found_in_order(self, cex_file):
+        """Test that every block header is indexed in source order."""
+        index = CexIndex.build(cex_file)
+        assert [block.label for block in index.blocks] == ["cexversion", "ctsdata", "relations", "ctsdata"]
+
+    def test_labels_are_distinct(self, cex_file):
+        """Test that labels() lists each label once."""
+        index = CexIndex.build(cex_file)
+        assert index.labels() == ["cexversion", "ctsdata", "relations"]
+
+    def test_record_counts_skip_comments_and_blank_lines(self, cex_file):
+        """Test that comments and blank lines are not counted as records."""
+        index = CexIndex.build(cex_file)
+        assert index.block("ctsdata").record_count == 5
+        assert index.block("relations").record_count == 2
+        assert index.block("ctsdata", 1).record_count == 1
+
+    def test_block_offsets_are_byte_offsets(self, cex_file):
+        """Test that block offsets point at the bytes following the header."""
+        data = cex_file.read_bytes()
+        index = CexIndex.build(cex_file)
+        block = index.block("relations")
+        assert data[block.start:block.end].startswith(b"urn:cite2:hmt:verbs.v1:commentsOn")
+        assert data[block.end:].startswith(b"#!ctsdata")
+
+    def test_no_offsets_without_stride(self, cex_file):
+        """Test that record offsets are only recorded when a stride is given."""
+        index = CexIndex.build(cex_file)
+        assert index.block("ctsdata").record_offsets == []
+
+    def test_stride_records_every_nth_offset(self, cex_file):
+        """Test that a stride records the offset of every Nth record."""
+        data = cex_file.read_bytes()
+        index = CexIndex.build(cex_file, stride=2)
+        offsets = index.block("ctsdata").record_offsets
+        assert len(offsets) == 3
+        assert data[offsets[1]:].startswith(b"urn:cts:greekLit:tlg0012.tlg001.msA:1.3#")
+        assert data[offsets[2]:].startswith(b"urn:cts:greekLit:tlg0012.tlg001.msA:1.5#")
+
+    def test_invalid_stride(self, cex_file):
+        """Test that a stride must be positive."""
+        with pytest.raises(ValueError) as exc_info:
+            CexIndex.build(cex_file, stride=0)
+        assert "positive" in str(exc_info.value)
+
+    def test_missing_block(self, cex_file):
+        """Test that requesting a missing block raises KeyError."""
+        index = CexIndex.build(cex_file)
+        with pytest.raises(KeyError):
+            index.block("citedata")
+        with pytest.raises(KeyError):
+            index.block("relations", 1)
+
+
+class TestCexIndexRead:
+    """Tests for reading blocks and records through an index."""
+
+    def test_read_block(self, cex_file):
+        """Test reading all records of a block."""
+        index = CexIndex.build(cex_file)
+        records = list(index.read_block(cex_file, "relations"))
+        assert records == [
+            "urn:cite2:hmt:verbs.v1:commentsOn",
+            "urn:cite2:hmt:msA.v1:12r#urn:cite2:hmt:verbs.v1:illustrates#urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+        ]
+
+    def test_read_second_occurrence(self, cex_file):
+        """Test reading a repeated block by occurrence."""
+        index = CexIndex.build(cex_file)
+        records = list(index.read_block(cex_file, "ctsdata", occurrence=1))
+        assert records == ["urn:cts:greekLit:tlg0012.tlg001.msB:1.1#Μῆνιν ἄειδε θεὰ"]
+
+    def test_read_records_range(self, cex_file):
+        """Test reading a range of records without a stride."""
+        index = CexIndex.build(cex_file)
+        records = list(index.read_records(cex_file, "ctsdata", 1, 4))
+        assert [record.split("#")[0].split(":")[-1] for record in records] == ["1.2", "1.3", "1.4"]
+
+    @pytest.mark.parametrize("stride", [1, 2, 3, 10])
+    def test_read_records_range_with_stride(self, cex_file, stride):
+        """Test that strided reads return the same records as unstrided reads."""
+        plain = CexIndex.build(cex_file)
+        strided = CexIndex.build(cex_file, stride=stride)
+        for start in range(6):
+            for stop in range(start, 7):
+                assert list(strided.read_records(cex_file, "ctsdata", start, stop)) == list(plain.read_records(cex_file, "ctsdata", start, stop))
+
+    def test_read_records_to_end(self, cex_file):
+        """Test that a stop of None reads to the end of the block."""
+        index = CexIndex.build(cex_file, stride=2)
+        records = list(index.read_records(cex_file, "ctsdata", 3))
+        assert len(records) == 2
+
+    def test_read_records_does_not_cross_block(self, cex_file):
+        """Test that reading past the record count stays inside the block."""
+        index = CexIndex.build(cex_file)
+        records = list(index.read_records(cex_file, "relations", 0, 100))
+        assert len(records) == 2
+
+
+class TestCexIndexSidecar:
+    """Tests for persisting an index in a sidecar file."""
+
+    def test_save_and_load_roundtrip(self, cex_file, tmp_path):
+        """Test that a saved index loads back unchanged."""
+        index = CexIndex.build(cex_file, stride=2)
+        index_path = tmp_path / "sample.idx"
+        index.save(index_path)
+        assert CexIndex.load(index_path) == index
+
+    def test_for_source_writes_sidecar(self, cex_file):
+        """Test that for_source writes a sidecar file next to the source."""
+        index = CexIndex.for_source(cex_file)
+        assert os.path.exists(sidecar_path(cex_file))
+        assert CexIndex.load(sidecar_path(cex_file)) == index
+
+    def test_for_source_reuses_current_sidecar(self, cex_file):
+        """Test that a current sidecar is loaded instead of rebuilt."""
+        CexIndex.for_source(cex_file)
+        # Tamper with the stored index so that reuse is observable.
+        stored = CexIndex.load(sidecar_path(cex_file))
+        stored.blocks = stored.blocks[:1]
+        stored.save(sidecar_path(cex_file))
+        assert len(CexIndex.for_source(cex_file).blocks) == 1
+
+    def test_for_source_rebuilds_stale_sidecar(self, cex_file):
+        """Test that a sidecar is rebuilt when the source changes."""
+        CexIndex.for_source(cex_file)
+        with open(cex_file, "ab") as f:
+            f.write(b"\n#!citedata\nurn|label\n")
+        index = CexIndex.for_source(cex_file)
+        assert index.labels() == ["cexversion", "ctsdata", "relations", "citedata"]
+        assert index.is_current(cex_file)
+
+    def test_for_source_rebuilds_for_different_stride(self, cex_file):
+        """Test that a sidecar built with another stride is not reused."""
+        CexIndex.for_source(cex_file)
+        index = CexIndex.for_source(cex_file, stride=2)
+        assert index.stride == 2
+        assert index.block("ctsdata").record_offsets
+
+    @pytest.mark.parametrize("content", [b"", b"not json", b'{"blocks": [', b'{"blocks": 3}', b"\xff\xfe"])
+    def test_for_source_rebuilds_corrupt_sidecar(self, cex_file, content):
+        """Test that a truncated or garbage sidecar is replaced by a rebuilt index."""
+        with open(sidecar_path(cex_file), "wb") as f:
+            f.write(content)
+        index = CexIndex.for_source(cex_file)
+        assert index == CexIndex.build(cex_file)
+        assert CexIndex.load(sidecar_path(cex_file)) == index
+
+    def test_for_source_without_writable_sidecar(self, cex_file, monkeypatch):
+        """Test that an index is still returned when the sidecar cannot be written."""
+        def save(index, index_path):
+            raise PermissionError(13, "Permission denied", str(index_path))
+
+        monkeypatch.setattr(CexIndex, "save", save)
+        index = CexIndex.for_source(cex_file)
+        assert index == CexIndex.build(cex_file)
+        assert not os.path.exists(sidecar_path(cex_file))
+
+
+class TestCexWriter:
+    """Tests for buffered CEX output."""
+
+    def test_blocks_comments_and_records(self, tmp_path):
+        """Test writing headers, comments and records."""
+        path = tmp_path / "out.cex"
+        with CexWriter(path) as writer:
+            writer.begin_block("cexversion")
+            writer.write_record(["3.0"])
+            writer.begin_block("relations")
+            writer.comment(" derived")
+            writer.write_record([
+                Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r"),
+                Cite2Urn.from_string("urn:cite2:hmt:verbs.v1:illustrates"),
+                CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1"),
+            ])
+        assert path.read_text(encoding="utf-8") == (
+            "#!cexversion\n3.0\n#!relations\n// derived\n"
+            "urn:cite2:hmt:msA.v1:12r#urn:cite2:hmt:verbs.v1:illustrates#urn:cts:greekLit:tlg0012.tlg001.msA:1.1\n"
+        )
+
+    def test_write_records(self, tmp_path):
+        """Test writing many records with a custom delimiter."""
+        path = tmp_path / "out.cex"
+        with CexWriter(path, delimiter="|") as writer:
+            writer.write_records([("a", 1), ("b", 2)])
+        assert path.read_text(encoding="utf-8") == "a|1\nb|2\n"
+
+    def test_write_columns(self, tmp_path):
+        """Test writing records column by column."""
+        urns = [CtsUrn.from_string(f"urn:cts:greekLit:tlg0012.tlg001.msA:1.{n}") for n in range(1, 4)]
+        path = tmp_path / "out.cex"
+        with CexWriter(path) as writer:
+            writer.begin_block("ctsdata")
+            writer.write_columns(urns, ["one", "two", "three"])
+        index = CexIndex.build(path)
+        assert list(index.read_block(path, "ctsdata")) == [
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.1#one",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.2#two",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.3#three",
+        ]
+
+    def test_write_urn_columns(self, tmp_path):
+        """Test that URN containers are written from their field lists."""
+        cts = CtsUrnColumns(["urn:cts:greekLit:tlg0012.tlg001.msA:1.1", "urn:cts:greekLit:tlg0012:", "urn:cts:latinLit:phi0959.phi006.v1.ex1:1.1@a"])
+        cite2 = Cite2UrnColumns(["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA:12v", "urn:cite2:hmt:vaimg:VA012RN@0.1,0.2,0.3,0.4"])
+        path = tmp_path / "out.cex"
+        with CexWriter(path) as writer:
+            writer.write_columns(cts, cite2)
+        expected = [f"{a}#{b}" for a, b in zip(map(str, cts), map(str, cite2))]
+        assert path.read_text(encoding="utf-8").splitlines() == expected
+
+    def test_write_columns_length_mismatch(self, tmp_path):
+        """Test that columns of different lengths are rejected."""
+        with CexWriter(tmp_path / "out.cex") as writer:
+            with pytest.raises(ValueError) as exc_info:
+                writer.write_columns(["a", "b"], ["c"])
+        assert "same length" in str(exc_info.value)
+
+    def test_buffer_is_written_when_full(self, tmp_path):
+        """Test that records are held until the buffer fills, and reach the file on flush."""
+        path = tmp_path / "out.cex"
+        writer = CexWriter(path, buffer_size=10)
+        writes = []
+        write = writer._file.write
+        writer._file.write = lambda text: writes.append(text) or write(text)
+        writer.write_record(["abc"])
+        assert writes == []
+        writer.write_record(["defghijk"])
+        assert writes == ["abc\ndefghijk\n"]
+        writer.write_record(["l"])
+        writer.flush()
+        assert path.read_text(encoding="utf-8") == "abc\ndefghijk\nl\n"
+        writer.close()
+
+    def test_close_is_idempotent(self, tmp_path):
+        """Test that closing twice is harmless."""
+        writer = CexWriter(tmp_path / "out.cex")
+        writer.write_record(["x"])
+        writer.close()
+        writer.close()
+
+    @pytest.mark.parametrize("suffix, opener", [(".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)])
+    def test_compression_inferred_from_suffix(self, tmp_path, suffix, opener):
+        """Test that compression is chosen from the file suffix."""
+        path = tmp_path / ("out.cex" + suffix)
+        with CexWriter(path) as writer:
+            writer.begin_block("ctsdata")
+            writer.write_record(["urn:cts:greekLit:tlg0012.tlg001.msA:1.1", "Μῆνιν"])
+        with opener(path, "rt", encoding="utf-8") as f:
+            assert f.read() == "#!ctsdata\nurn:cts:greekLit:tlg0012.tlg001.msA:1.1#Μῆνιν\n"
+
+    def test_explicit_compression(self, tmp_path):
+        """Test that compression can be chosen explicitly."""
+        path = tmp_path / "out.cex"
+        with CexWriter(path, compression="gzip") as writer:
+            writer.write_record(["x"])
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read() == "x\n"
+
+    def test_unsupported_compression(self, tmp_path):
+        """Test that an unknown compression format is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            CexWriter(tmp_path / "out.cex", compression="zip")
+        assert "Unsupported compression" in str(exc_info.value)
+
+    def test_concurrent_writes_are_not_interleaved(self, tmp_path):
+        """Test that records written from many threads stay whole."""
+        path = tmp_path / "out.cex"
+        with CexWriter(path, buffer_size=256) as writer:
+            def write(thread):
+                writer.write_records([(thread, n, "x" * 20) for n in range(200)])
+                for n in range(200, 400):
+                    writer.write_record([thread, n, "x" * 20])
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(write, range(8)))
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 8 * 400
+        assert set(lines) == {f"{thread}#{n}#{'x' * 20}" for thread in range(8) for n in range(400)}
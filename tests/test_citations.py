@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import CexIndex, CitationIndex, CtsUrn
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+ODYSSEY = "urn:cts:greekLit:tlg0012.tlg002.msA:"
+
+# Book 1 has an inserted line 1.10a, which no natural sort would place after 1.10.
+PASSAGES = [f"1.{line}" for line in range(1, 11)] + ["1.10a", "1.11", "1.12"] + [f"2.{line}" for line in range(1, 6)]
+
+URNS = [ILIAD + passage for passage in PASSAGES] + [ODYSSEY + "1.1", ODYSSEY + "1.2"]
+
+
+@pytest.fixture
+def index():
+    return CitationIndex(URNS)
+
+
+def passages(urns):
+    return [urn.passage for urn in urns]
+
+
+class TestCitationIndex:
+    """Tests for building a citation index."""
+
+    def test_works_in_corpus_order(self, index):
+        """Test that each work keeps its passages in corpus order."""
+        assert index.works[ILIAD] == PASSAGES
+        assert index.works[ODYSSEY] == ["1.1", "1.2"]
+        assert len(index) == len(URNS)
+
+    def test_contains(self, index):
+        """Test membership by string and by CtsUrn, ignoring subreferences."""
+        assert ILIAD + "1.10a" in index
+        assert CtsUrn.from_string(ILIAD + "2.1@Ἄλλοι") in index
+        assert ILIAD + "3.1" not in index
+        assert ILIAD + "1" not in index
+
+    def test_invalid_passages(self):
+        """Test that repeated passages, ranges and missing passages are rejected."""
+        with pytest.raises(ValueError):
+            CitationIndex([ILIAD + "1.1", ILIAD + "1.1"])
+        with pytest.raises(ValueError):
+            CitationIndex([ILIAD + "1.1-1.2"])
+        with pytest.raises(ValueError):
+            CitationIndex([ILIAD])
+        with pytest.raises(ValueError):
+            CitationIndex(["not a urn"])
+
+    def test_from_cex(self, tmp_path):
+        """Test building an index from the ctsdata blocks of a CEX source."""
+        source = tmp_path / "homer.cex"
+        lines = ["#!cexversion", "3.0", "", "#!ctsdata"]
+        lines += [f"{urn}#text" for urn in URNS[:5]]
+        lines += ["#!relations", "a#b#c", "#!ctsdata"]
+        lines += [f"{urn}#text" for urn in URNS[5:]]
+        source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        index = CitationIndex.from_cex(source, CexIndex.build(source))
+        assert index.works == CitationIndex(URNS).works
+
+
+class TestRangeExpansion:
+    """Tests for enumerating the passages of a URN."""
+
+    def test_range(self, index):
+        """Test that a range yields its passages in corpus order."""
+        assert passages(index.expand(ILIAD + "1.9-1.11")) == ["1.9", "1.10", "1.10a", "1.11"]
+        assert passages(index.expand(ILIAD + "1.12-2.2")) == ["1.12", "2.1", "2.2"]
+
+    def test_containing_passages(self, index):
+        """Test that containing passages and whole works expand to what they contain."""
+        assert passages(index.expand(ILIAD + "2")) == [f"2.{line}" for line in range(1, 6)]
+        assert passages(index.expand(ILIAD + "1.12-2")) == ["1.12"] + [f"2.{line}" for line in range(1, 6)]
+        assert passages(index.expand(ODYSSEY)) == ["1.1", "1.2"]
+        assert passages(index.expand(ILIAD + "1.1")) == ["1.1"]
+
+    def test_expanded_urns(self, index):
+        """Test that expansion yields CtsUrns of the queried work and drops subreferences."""
+        urns = list(index.expand(CtsUrn.from_string(ILIAD + "1.1@μῆνιν-1.2@οὐλομένην")))
+        assert urns == [CtsUrn.from_string(ILIAD + "1.1"), CtsUrn.from_string(ILIAD + "1.2")]
+
+    def test_expansion_is_lazy(self, index):
+        """Test that URNs are created as iteration proceeds."""
+        expansion = index.expand(ILIAD + "1.1-2.5")
+        assert next(expansion) == CtsUrn.from_string(ILIAD + "1.1")
+        assert index.span(ILIAD + "1.1-2.5") == (0, len(PASSAGES) - 1)
+
+    def test_unknown_passages(self, index):
+        """Test that unknown passages, works and reversed ranges raise KeyError."""
+        with pytest.raises(KeyError):
+            index.expand(ILIAD + "3.1")
+        with pytest.raises(KeyError):
+            index.expand("urn:cts:greekLit:tlg0012.tlg001.msB:1.1")
+        with pytest.raises(KeyError):
+            index.expand(ILIAD + "2.1-1.1")
+
+    def test_spans_after_add(self, index):
+        """Test that containing spans include passages added later."""
+        assert index.span(ILIAD + "2") == (13, 17)
+        index.add(ILIAD + "2.6")
+        assert index.span(ILIAD + "2") == (13, 18)
+
+    def test_threads(self, index):
+        """Test that concurrent lookups agree."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            spans = list(executor.map(index.span, [ILIAD + "1", ILIAD + "2"] * 100))
+        assert spans == [(0, 12), (13, 17)] * 100
+
+
+class TestCompression:
+    """Tests for compressing passages into ranges."""
+
+    def test_runs_become_ranges(self, index):
+        """Test that consecutive passages become ranges and isolated ones stay single."""
+        selected = [ILIAD + "1.3", ILIAD + "1.1", ILIAD + "1.2", ILIAD + "1.10a", ILIAD + "1.10", ILIAD + "2.5"]
+        assert [str(urn) for urn in index.compress(selected)] == [ILIAD + "1.1-1.3", ILIAD + "1.10-1.10a", ILIAD + "2.5"]
+
+    def test_runs_cross_containing_passages(self, index):
+        """Test that a run continues across a book boundary."""
+        assert [str(urn) for urn in index.compress([ILIAD + "1.12", ILIAD + "2.1"])] == [ILIAD + "1.12-2.1"]
+
+    def test_ranges_and_containers_merge(self, index):
+        """Test that overlapping and adjacent ranges and containing passages merge, and repeats count once."""
+        selected = [ILIAD + "1.1-1.5", ILIAD + "1.4-1.6", ILIAD + "1.7", ILIAD + "2", ILIAD + "2.3"]
+        assert [str(urn) for urn in index.compress(selected)] == [ILIAD + "1.1-1.7", ILIAD + "2.1-2.5"]
+
+    def test_works_are_kept_apart(self, index):
+        """Test that passages of different works are compressed separately."""
+        selected = [ODYSSEY + "1.2", ILIAD + "1.1", ODYSSEY + "1.1"]
+        assert [str(urn) for urn in index.compress(selected)] == [ODYSSEY + "1.1-1.2", ILIAD + "1.1"]
+
+    def test_round_trip(self, index):
+        """Test that compressing an expansion gives back the range."""
+        urn = ILIAD + "1.9-2.2"
+        assert [str(urn) for urn in index.compress(index.expand(urn))] == [urn]
+        assert index.compress([]) == []
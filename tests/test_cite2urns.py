@@ -1,6 +1,6 @@
 import pytest
 
-from urn_citation import Cite2Urn
+from urn_citation import Cite2Urn, ParseError
 
 
 class TestCite2UrnFromString:
@@ -1188,3 +1188,68 @@ class TestCite2UrnSubreferenceValidation:
         urn = Cite2Urn.from_string("urn:cite2:hmt:data:obj1@region1-obj2@region2")
         assert urn.object_id == "obj1@region1-obj2@region2"
         assert urn.has_subreference() is True
+
+
+class TestCite2UrnTryParse:
+    """Tests for parsing CITE2 URNs without raising exceptions."""
+
+    @pytest.mark.parametrize("value", [
+        "urn:cite2:hmt:datamodels.v1:codexmodel",
+        "urn:cite2:ns:coll:obj-2",
+        "urn:cite2:hmt:msA.v1:12r@0.1,0.2,0.3,0.4",
+    ])
+    def test_valid_strings_match_from_string(self, value):
+        """Test that valid strings parse to the same URN as from_string."""
+        urn = Cite2Urn.try_parse(value)
+        assert isinstance(urn, Cite2Urn)
+        assert urn == Cite2Urn.from_string(value)
+
+    @pytest.mark.parametrize("value, code", [
+        ("urn:cts:ns:coll:obj", "prefix"),
+        ("urn:cite2:ns:coll", "part_count"),
+        ("urn:cite2::coll:obj", "empty_namespace"),
+        ("urn:cite2:ns::obj", "empty_collection"),
+        ("urn:cite2:ns:coll:", "empty_object"),
+        ("urn:cite2:ns:coll.:obj", "collection_trailing_period"),
+        ("urn:cite2:ns:coll.v1.extra:obj", "collection_part_count"),
+        ("urn:cite2:ns:.v1:obj", "collection_empty_part"),
+        ("urn:cite2:ns:coll:obj-", "object_trailing_hyphen"),
+        ("urn:cite2:ns:coll:one-two-three", "range_count"),
+        ("urn:cite2:ns:coll:-obj", "object_empty_part"),
+        ("urn:cite2:ns:coll:obj@a@b", "subreference_count"),
+        ("urn:cite2:ns:coll:obj@", "empty_subreference"),
+        (42, "not_a_string"),
+    ])
+    def test_invalid_strings_return_parse_error(self, value, code):
+        """Test that invalid strings return a ParseError with the right code."""
+        error = Cite2Urn.try_parse(value)
+        assert isinstance(error, ParseError)
+        assert error.code == code
+
+    def test_error_message_matches_from_string(self):
+        """Test that the error message is the one from_string raises."""
+        with pytest.raises(ValueError) as exc_info:
+            Cite2Urn.from_string("urn:cite2:ns:coll.v1.extra:obj")
+        error = Cite2Urn.try_parse("urn:cite2:ns:coll.v1.extra:obj")
+        assert error.message == str(exc_info.value)
+        assert error.component == "coll.v1.extra"
+
+
+class TestCite2UrnWithObjects:
+    """Tests for generating URNs from a list of object identifiers."""
+
+    def test_with_objects(self):
+        """Test that generated URNs equal those built one at a time."""
+        base = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:1r")
+        objects = ["12r", "12v-13r", "12r@0.1,0.2,0.3,0.4", None]
+        urns = base.with_objects(objects)
+        assert urns == [Cite2Urn(urn_type="cite2", namespace="hmt", collection="msA", version="v1", object_id=object_id) for object_id in objects]
+        assert base.with_objects(iter([])) == []
+
+    def test_invalid_objects(self):
+        """Test that invalid object identifiers are rejected."""
+        base = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:1r")
+        with pytest.raises(ValueError):
+            base.with_objects(["12r", "12r@"])
+        with pytest.raises(ValueError):
+            base.with_objects([12])
@@ -0,0 +1,104 @@
+import pytest
+
+from urn_citation import Cite2Urn, Cite2UrnColumns, CtsUrn, CtsUrnColumns
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [ILIAD + "1.1", ILIAD + "1.2@μῆνιν", "urn:cts:greekLit:tlg0012:", "urn:cts:latinLit:phi0959.phi006:1.1-1.5"]
+
+
+class TestCtsUrnColumns:
+    """Tests for the columnar CTS URN container."""
+
+    def test_columns_hold_fields(self):
+        """Test that each field is stored in its own list."""
+        columns = CtsUrnColumns(URNS)
+        assert len(columns) == 4
+        assert columns.columns["work"] == ["tlg001", "tlg001", None, "phi006"]
+        assert columns.columns["passage"] == ["1.1", "1.2@μῆνιν", None, "1.1-1.5"]
+
+    def test_strings_and_objects_agree(self):
+        """Test that strings and CtsUrn objects give the same columns."""
+        from_strings = CtsUrnColumns(URNS)
+        from_objects = CtsUrnColumns(CtsUrn.from_string(urn) for urn in URNS)
+        assert from_strings.columns == from_objects.columns
+
+    def test_getitem_and_iteration(self):
+        """Test that URNs are reconstructed equal to parsed URNs."""
+        columns = CtsUrnColumns(URNS)
+        assert columns[1] == CtsUrn.from_string(URNS[1])
+        assert columns[-1] == CtsUrn.from_string(URNS[-1])
+        assert list(columns) == [CtsUrn.from_string(urn) for urn in URNS]
+        assert columns.strings() == URNS
+
+    def test_slice(self):
+        """Test that slicing returns a container."""
+        part = CtsUrnColumns(URNS)[1:3]
+        assert isinstance(part, CtsUrnColumns)
+        assert part.strings() == URNS[1:3]
+
+    def test_invalid_values(self):
+        """Test that invalid strings and other URN types are rejected."""
+        columns = CtsUrnColumns()
+        with pytest.raises(ValueError):
+            columns.append("urn:cts:greekLit")
+        with pytest.raises(ValueError):
+            columns.append(Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r"))
+        with pytest.raises(ValueError):
+            columns.append("urn:xyz:greekLit:tlg0012:1.1")
+        assert len(columns) == 0
+
+    def test_from_columns(self):
+        """Test building a container from field lists."""
+        columns = CtsUrnColumns.from_columns(
+            namespace=["greekLit"], text_group=["tlg0012"], work=["tlg001"],
+            version=[None], exemplar=[None], passage=["1.1"],
+        )
+        assert columns.strings() == ["urn:cts:greekLit:tlg0012.tlg001:1.1"]
+
+    def test_from_columns_checks_shape(self):
+        """Test that missing fields and unequal lengths are rejected."""
+        with pytest.raises(ValueError):
+            CtsUrnColumns.from_columns(namespace=["greekLit"])
+        with pytest.raises(ValueError):
+            CtsUrnColumns.from_columns(
+                namespace=["greekLit"], text_group=[], work=[], version=[], exemplar=[], passage=[],
+            )
+
+    def test_from_passages(self):
+        """Test generating a container from a work and a list of passages."""
+        base = CtsUrn.from_string(ILIAD + "1.1")
+        passages = ["1.1", "1.2@μῆνιν", "1.3-1.5", None]
+        columns = CtsUrnColumns.from_passages(base, passages)
+        assert columns.columns["passage"] == passages
+        assert columns.columns["version"] == ["msA"] * 4
+        assert list(columns) == [base.set_passage(passage) for passage in passages]
+
+    def test_from_passages_invalid(self):
+        """Test that invalid passages and bases are rejected."""
+        base = CtsUrn.from_string(ILIAD)
+        with pytest.raises(ValueError):
+            CtsUrnColumns.from_passages(base, ["1.1", "1.2@"])
+        with pytest.raises(ValueError):
+            CtsUrnColumns.from_passages(base, [1])
+        with pytest.raises(ValueError):
+            CtsUrnColumns.from_passages(Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r"), ["1.1"])
+
+
+class TestCite2UrnColumns:
+    """Tests for the columnar CITE2 URN container."""
+
+    def test_round_trip(self):
+        """Test that CITE2 URNs are stored by field and reconstructed."""
+        urns = ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA:12v-13r", "urn:cite2:hmt:vaimg.v1:VA012RN@0.1,0.2,0.3,0.4"]
+        columns = Cite2UrnColumns(urns)
+        assert columns.columns["version"] == ["v1", None, "v1"]
+        assert list(columns) == [Cite2Urn.from_string(urn) for urn in urns]
+
+    def test_from_objects(self):
+        """Test generating a container from a collection and a list of objects."""
+        base = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:1r")
+        columns = Cite2UrnColumns.from_objects(base, ["12r", "12v"])
+        assert columns.strings() == ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA.v1:12v"]
+        with pytest.raises(ValueError):
+            Cite2UrnColumns.from_objects(base, ["12r@a@b"])
@@ -0,0 +1,89 @@
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, Urn
+from urn_citation.containment import containment_pairs
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+CTS_URNS = [
+    ILIAD + "1",
+    ILIAD + "1.1",
+    ILIAD + "1.10",
+    ILIAD + "10.1",
+    ILIAD + "1.1@μῆνιν",
+    ILIAD + "1.1@a.b",
+    ILIAD + "1.",
+    ILIAD,
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1",
+    "urn:cts:greekLit:tlg0012.tlg001:1",
+    "urn:cts:greekLit:tlg0012.tlg001:",
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:latinLit:tlg0012.tlg001.msA:1.1",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+]
+
+CITE2_URNS = [
+    "urn:cite2:hmt:msA.v1:12r",
+    "urn:cite2:hmt:msA.v2:12r",
+    "urn:cite2:hmt:msA:12r",
+    "urn:cite2:hmt:msA.v1:12v",
+    "urn:cite2:hmt:msA.v1:12r-13v",
+    "urn:cite2:hmt:msB.v1:12r",
+    "urn:cite2:other:msA.v1:12r",
+]
+
+
+def brute_force(containers, contained):
+    """Call contains for every pair of URNs of the same type."""
+    pairs = []
+    for j, b in enumerate(contained):
+        for i, a in enumerate(containers):
+            if type(a) is not type(b):
+                continue
+            if isinstance(a, CtsUrn) and (a.is_range() or b.is_range()):
+                continue
+            if a.contains(b):
+                pairs.append((i, j))
+    return pairs
+
+
+class TestContainmentPairs:
+    """Tests for bulk many-to-many containment."""
+
+    def test_cts_matches_pairwise_contains(self):
+        """Test that CTS pairs equal the result of calling contains for every pair."""
+        urns = [CtsUrn.from_string(urn) for urn in CTS_URNS]
+        assert containment_pairs(urns, urns) == brute_force(urns, urns)
+
+    def test_cite2_matches_pairwise_contains(self):
+        """Test that CITE2 pairs equal the result of calling contains for every pair."""
+        urns = [Cite2Urn.from_string(urn) for urn in CITE2_URNS]
+        assert containment_pairs(urns, urns) == brute_force(urns, urns)
+
+    def test_mixed_types_and_strings(self):
+        """Test that strings are parsed and types are compared separately."""
+        values = CTS_URNS + CITE2_URNS
+        urns = [Urn.parse(value) for value in values]
+        assert containment_pairs(values, values[::-1]) == brute_force(urns, urns[::-1])
+
+    def test_book_contains_lines(self):
+        """Test a typical query of books against lines."""
+        books = [ILIAD + "1", ILIAD + "2"]
+        lines = [ILIAD + "2.5", ILIAD + "1.1", ILIAD + "3.1", ILIAD + "1.2"]
+        assert containment_pairs(books, lines) == [(1, 0), (0, 1), (0, 3)]
+
+    def test_ranges_are_skipped(self):
+        """Test that CTS range URNs never appear in the result."""
+        ranged = ILIAD + "1.1-1.5"
+        assert containment_pairs([ranged, ILIAD + "1"], [ranged, ILIAD + "1.1"]) == [(1, 1)]
+
+    def test_empty_inputs(self):
+        """Test that empty collections give no pairs."""
+        assert containment_pairs([], CTS_URNS) == []
+        assert containment_pairs(CTS_URNS, []) == []
+
+    def test_invalid_string(self):
+        """Test that invalid strings raise ValueError."""
+        with pytest.raises(ValueError):
+            containment_pairs(["urn:cts:greekLit"], CTS_URNS)
@@ -1,7 +1,8 @@
 import pytest
 from pydantic import ValidationError
 
-from urn_citation import CtsUrn
+from urn_citation import CtsUrn, ParseError
+from urn_citation.ctsurn import passage_within
 
 
 class TestCtsUrnCreation:
@@ -2275,3 +2276,203 @@ class TestCtsUrnSetExemplar:
         with pytest.raises(ValidationError) as exc_info:
             urn.set_exemplar("ex1")
         assert "exemplar cannot be set when version is None" in str(exc_info.value)
+
+
+class TestCtsUrnTryParse:
+    """Tests for parsing CTS URNs without raising exceptions."""
+
+    @pytest.mark.parametrize("value", [
+        "urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+        "urn:cts:greekLit:tlg0012:",
+        "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1@μῆνιν-1.5@θεά",
+    ])
+    def test_valid_strings_match_from_string(self, value):
+        """Test that valid strings parse to the same URN as from_string."""
+        urn = CtsUrn.try_parse(value)
+        assert isinstance(urn, CtsUrn)
+        assert urn == CtsUrn.from_string(value)
+
+    @pytest.mark.parametrize("value, code, component", [
+        ("urn:cts:greekLit:tlg0012", "part_count", "urn:cts:greekLit:tlg0012"),
+        ("urn:cts:greekLit:tlg0012:1-2-3", "range_count", "1-2-3"),
+        ("urn:cts:greekLit:tlg0012:1.1@a@b", "subreference_count", "1.1@a@b"),
+        ("urn:cts:greekLit:tlg0012:1.1@", "empty_subreference", "1.1@"),
+        ("urn:cts:greekLit:tlg0012..tlg001:1.1", "work_successive_periods", "tlg0012..tlg001"),
+        ("urn:cts:greekLit:tlg0012:1..1", "passage_successive_periods", "1..1"),
+        ("urn:cts:greekLit:a.b.c.d.e:1.1", "work_part_count", "a.b.c.d.e"),
+        (None, "not_a_string", "None"),
+    ])
+    def test_invalid_strings_return_parse_error(self, value, code, component):
+        """Test that invalid strings return a ParseError describing the problem."""
+        error = CtsUrn.try_parse(value)
+        assert isinstance(error, ParseError)
+        assert error.code == code
+        assert error.component == component
+
+    @pytest.mark.parametrize("value", [
+        "urn:cts:greekLit:tlg0012",
+        "urn:cts:greekLit:tlg0012:1-2-3",
+        "urn:cts:greekLit:tlg0012:1.1@",
+        "urn:cts:greekLit:a.b.c.d.e:1.1",
+    ])
+    def test_error_message_matches_from_string(self, value):
+        """Test that the error message is the one from_string raises."""
+        with pytest.raises(ValueError) as exc_info:
+            CtsUrn.from_string(value)
+        assert CtsUrn.try_parse(value).message == str(exc_info.value)
+
+
+class TestCtsUrnHierarchy:
+    """Tests for citation depth, truncation, parents and common ancestors."""
+
+    ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+    @pytest.mark.parametrize("passage, depth", [("", 0), ("1", 1), ("1.2", 2), ("1.2@μῆνιν", 2), ("1.2@a.b", 2), ("pr.3.12r", 3)])
+    def test_depth(self, passage, depth):
+        """Test counting citation levels."""
+        assert CtsUrn.from_string(self.ILIAD + passage).depth() == depth
+
+    def test_depth_of_range(self):
+        """Test that depth is not defined for ranges."""
+        with pytest.raises(ValueError):
+            CtsUrn.from_string(self.ILIAD + "1.1-1.5").depth()
+
+    @pytest.mark.parametrize("passage, depth, expected", [
+        ("1.2.3", 1, "1"),
+        ("1.2.3", 2, "1.2"),
+        ("1.2.3", 3, "1.2.3"),
+        ("1.2", 5, "1.2"),
+        ("1.2@μῆνιν", 2, "1.2@μῆνιν"),
+        ("1.2@μῆνιν", 1, "1"),
+        ("1.2", 0, ""),
+        ("", 2, ""),
+    ])
+    def test_truncate(self, passage, depth, expected):
+        """Test cutting a passage down to a depth."""
+        urn = CtsUrn.from_string(self.ILIAD + passage)
+        truncated = urn.truncate(depth)
+        assert truncated == CtsUrn.from_string(self.ILIAD + expected)
+        assert urn == CtsUrn.from_string(self.ILIAD + passage)
+
+    def test_truncate_invalid(self):
+        """Test that negative depths and ranges are rejected."""
+        with pytest.raises(ValueError):
+            CtsUrn.from_string(self.ILIAD + "1.2").truncate(-1)
+        with pytest.raises(ValueError):
+            CtsUrn.from_string(self.ILIAD + "1.2-1.4").truncate(1)
+
+    @pytest.mark.parametrize("passage, expected", [("1.2.3", "1.2"), ("1", ""), ("1.2@μῆνιν", "1.2"), ("1.2@a.b", "1.2")])
+    def test_parent(self, passage, expected):
+        """Test moving one level up the citation hierarchy."""
+        assert CtsUrn.from_string(self.ILIAD + passage).parent() == CtsUrn.from_string(self.ILIAD + expected)
+
+    def test_parent_of_whole_text(self):
+        """Test that a URN without a passage has no parent."""
+        assert CtsUrn.from_string(self.ILIAD).parent() is None
+
+    def test_parent_contains_child(self):
+        """Test that a parent contains its child."""
+        urn = CtsUrn.from_string(self.ILIAD + "1.2.3")
+        assert urn.parent().contains(urn)
+
+    @pytest.mark.parametrize("urns, expected", [
+        (["1.1", "1.2", "1.10"], ILIAD + "1"),
+        (["1.1.1", "1.1.2"], ILIAD + "1.1"),
+        (["1.1@μῆνιν", "1.1@μῆνιν"], ILIAD + "1.1@μῆνιν"),
+        (["1.1@μῆνιν", "1.1@ἄειδε"], ILIAD + "1.1"),
+        (["1.1", "2.1"], ILIAD),
+        (["1.1", ""], ILIAD),
+        (["1.1"], ILIAD + "1.1"),
+    ])
+    def test_common_ancestor_of_passages(self, urns, expected):
+        """Test the deepest shared passage of one version."""
+        assert CtsUrn.common_ancestor(self.ILIAD + passage for passage in urns) == CtsUrn.from_string(expected)
+
+    def test_common_ancestor_of_work_hierarchies(self):
+        """Test that the work hierarchy is shortened to the shared prefix."""
+        urns = [
+            CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1"),
+            CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msB:1.2"),
+        ]
+        ancestor = CtsUrn.common_ancestor(urns)
+        assert ancestor == CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1")
+        assert all(ancestor.contains(urn) for urn in urns)
+        assert CtsUrn.common_ancestor(["urn:cts:greekLit:tlg0012.tlg001:1", "urn:cts:greekLit:tlg0012.tlg002:1"]) == CtsUrn.from_string("urn:cts:greekLit:tlg0012:1")
+
+    def test_no_common_ancestor(self):
+        """Test that no ancestor exists across namespaces or text groups, or for no URNs."""
+        assert CtsUrn.common_ancestor(["urn:cts:greekLit:tlg0012:1", "urn:cts:greekLit:tlg0011:1"]) is None
+        assert CtsUrn.common_ancestor(["urn:cts:greekLit:tlg0012:1", "urn:cts:latinLit:tlg0012:1"]) is None
+        assert CtsUrn.common_ancestor([]) is None
+
+    def test_common_ancestor_rejects_ranges(self):
+        """Test that ranges are rejected."""
+        with pytest.raises(ValueError):
+            CtsUrn.common_ancestor([self.ILIAD + "1.1", self.ILIAD + "1.2-1.4"])
+
+
+class TestPassageReplacement:
+    """Tests for replacing the passage of a URN."""
+
+    def test_set_passage_validates_passage(self):
+        """Test that set_passage still rejects invalid subreferences and non-string passages."""
+        urn = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        with pytest.raises(ValueError):
+            urn.set_passage("1.1@a@b")
+        with pytest.raises(ValidationError):
+            urn.set_passage(12)
+        assert urn.set_passage("1.2@μῆνιν").subreference() == "μῆνιν"
+
+
+class TestCtsUrnWithPassages:
+    """Tests for generating URNs from a list of passages."""
+
+    def test_with_passages(self):
+        """Test that generated URNs equal those made with set_passage."""
+        base = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        passages = [f"1.{line}" for line in range(1, 50)] + ["1.1@μῆνιν", "1.1-1.5", None, ""]
+        urns = base.with_passages(passages)
+        assert urns == [base.set_passage(passage) for passage in passages]
+        assert all(urn.work is base.work and urn.version is base.version for urn in urns)
+        assert base.with_passages(p for p in []) == []
+
+    def test_invalid_passages(self):
+        """Test that invalid passages are rejected."""
+        base = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:")
+        with pytest.raises(ValueError):
+            base.with_passages(["1.1", "1.1@a@b"])
+        with pytest.raises(ValueError):
+            base.with_passages([1.1])
+
+
+class TestPassageWithin:
+    """Tests for checking whether passages lie within a containing passage."""
+
+    @pytest.mark.parametrize("passage, expected", [
+        ("1", True),
+        ("1.1", True),
+        ("1.1@μῆνιν", True),
+        ("1@x", False),
+        ("10", False),
+        ("1.5-1.9", True),
+        ("1.5-2.3", False),
+        ("0.9-1.2", False),
+        (None, False),
+    ])
+    def test_passage_within(self, passage, expected):
+        """Test single passages and ranges against a book."""
+        assert passage_within(passage, "1") is expected
+
+    def test_agrees_with_passage_contains(self):
+        """Test that single passages follow CtsUrn.passage_contains."""
+        base = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:")
+        passages = ["1", "1.1", "1.1@μῆνιν", "1.1@μῆνιν.2", "1@x", "1.10", "11"]
+        for container in passages:
+            for passage in passages:
+                expected = base.set_passage(container).passage_contains(base.set_passage(passage))
+                assert passage_within(passage, container) is expected
+
+    def test_no_container(self):
+        """Test that every passage lies within no passage."""
+        assert passage_within("1.5-2.3", None)
+        assert passage_within(None, None)
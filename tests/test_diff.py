@@ -0,0 +1,79 @@
+import pytest
+
+from urn_citation.diff import ADDED, REMOVED, SortedUrnDiff, diff_files
+from urn_citation.ordering import canonical_key
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+OLD = sorted([ILIAD + "1.1", ILIAD + "1.2", ILIAD + "1.10", ILIAD + "2.1", "urn:cite2:hmt:msA.v1:12r"], key=canonical_key)
+NEW = sorted([ILIAD + "1.1", ILIAD + "1.3", ILIAD + "1.10", ILIAD + "2.1", ILIAD + "2.2", "urn:cite2:hmt:msA.v1:12v"], key=canonical_key)
+
+
+class TestSortedUrnDiff:
+    """Tests for the streaming diff of sorted URN sequences."""
+
+    def test_differences_in_order(self):
+        """Test that changes are yielded in canonical order and counted."""
+        diff = SortedUrnDiff(OLD, NEW)
+        assert list(diff) == [
+            (REMOVED, ILIAD + "1.2"),
+            (ADDED, ILIAD + "1.3"),
+            (ADDED, ILIAD + "2.2"),
+            (REMOVED, "urn:cite2:hmt:msA.v1:12r"),
+            (ADDED, "urn:cite2:hmt:msA.v1:12v"),
+        ]
+        assert (diff.added, diff.removed, diff.unchanged) == (3, 2, 3)
+
+    def test_matches_set_difference(self):
+        """Test that the result equals a set comparison."""
+        diff = SortedUrnDiff(OLD, NEW)
+        changes = list(diff)
+        assert {urn for change, urn in changes if change == ADDED} == set(NEW) - set(OLD)
+        assert {urn for change, urn in changes if change == REMOVED} == set(OLD) - set(NEW)
+        assert diff.unchanged == len(set(OLD) & set(NEW))
+
+    def test_natural_order_is_required(self):
+        """Test that lexically sorted input is detected as unsorted."""
+        with pytest.raises(ValueError) as exc_info:
+            SortedUrnDiff(sorted(OLD), NEW).run()
+        assert "old is not sorted" in str(exc_info.value)
+
+    def test_repeated_urns(self):
+        """Test that repeated URNs are compared as multisets."""
+        diff = SortedUrnDiff([ILIAD + "1.1", ILIAD + "1.1"], [ILIAD + "1.1"]).run()
+        assert (diff.added, diff.removed, diff.unchanged) == (0, 1, 1)
+
+    def test_equal_keys_different_strings(self):
+        """Test that strings with equal sort keys are still told apart."""
+        diff = SortedUrnDiff([ILIAD + "1.01"], [ILIAD + "1.1"])
+        assert list(diff) == [(REMOVED, ILIAD + "1.01"), (ADDED, ILIAD + "1.1")]
+
+    def test_empty_sides(self):
+        """Test comparisons with an empty sequence."""
+        assert SortedUrnDiff([], NEW).run().added == len(NEW)
+        assert SortedUrnDiff(OLD, []).run().removed == len(OLD)
+
+    def test_consumes_iterators_lazily(self):
+        """Test that the inputs may be one-shot iterators."""
+        diff = SortedUrnDiff(iter(OLD), iter(NEW))
+        assert next(iter(diff)) == (REMOVED, ILIAD + "1.2")
+
+
+class TestDiffFiles:
+    """Tests for comparing URN files."""
+
+    def test_diff_files(self, tmp_path):
+        """Test writing added and removed URNs to files."""
+        (tmp_path / "old.txt").write_text("\n".join(OLD) + "\n", encoding="utf-8")
+        (tmp_path / "new.txt").write_text("\n".join(NEW) + "\n", encoding="utf-8")
+        diff = diff_files(tmp_path / "old.txt", tmp_path / "new.txt", tmp_path / "added.txt", tmp_path / "removed.txt")
+        assert (diff.added, diff.removed, diff.unchanged) == (3, 2, 3)
+        assert (tmp_path / "added.txt").read_text(encoding="utf-8").splitlines() == [ILIAD + "1.3", ILIAD + "2.2", "urn:cite2:hmt:msA.v1:12v"]
+        assert (tmp_path / "removed.txt").read_text(encoding="utf-8").splitlines() == [ILIAD + "1.2", "urn:cite2:hmt:msA.v1:12r"]
+
+    def test_counts_only(self, tmp_path):
+        """Test comparing files without writing the differences."""
+        (tmp_path / "old.txt").write_text("\n".join(OLD), encoding="utf-8")
+        (tmp_path / "new.txt").write_text("\n".join(OLD), encoding="utf-8")
+        diff = diff_files(tmp_path / "old.txt", tmp_path / "new.txt")
+        assert (diff.added, diff.removed, diff.unchanged) == (0, 0, len(OLD))
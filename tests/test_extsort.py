@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from urn_citation.extsort import external_sort, sort_file
+from urn_citation.ordering import canonical_key
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [f"{ILIAD}{book}.{line}" for book in range(1, 13) for line in range(1, 60)] + [
+    "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+    "urn:cite2:hmt:msA.v1:12r",
+    "urn:cite2:hmt:msA.v1:2r",
+]
+
+
+@pytest.fixture
+def shuffled():
+    urns = list(URNS)
+    random.Random(7).shuffle(urns)
+    return urns
+
+
+class TestExternalSort:
+    """Tests for sorting URNs with spilled runs."""
+
+    def test_in_memory(self, shuffled, tmp_path):
+        """Test that input within the memory limit is sorted without temporary files."""
+        assert list(external_sort(shuffled, temp_dir=tmp_path)) == sorted(URNS, key=canonical_key)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("memory_limit", [1, 5000, 50000])
+    def test_spilled_runs(self, shuffled, memory_limit, tmp_path):
+        """Test that merging spilled runs gives the same order as sorting in memory."""
+        assert list(external_sort(shuffled, memory_limit=memory_limit, temp_dir=tmp_path)) == sorted(URNS, key=canonical_key)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_multi_pass_merge(self, shuffled, tmp_path):
+        """Test that runs beyond the fan-in are merged in several passes."""
+        result = external_sort(shuffled, memory_limit=20000, fan_in=2, temp_dir=tmp_path)
+        assert list(result) == sorted(URNS, key=canonical_key)
+
+    def test_natural_order(self):
+        """Test that passages are in natural, not lexical, order."""
+        assert list(external_sort([ILIAD + "10.1", ILIAD + "2.1", ILIAD + "1.10", ILIAD + "1.9"], memory_limit=1)) == [
+            ILIAD + "1.9", ILIAD + "1.10", ILIAD + "2.1", ILIAD + "10.1",
+        ]
+
+    @pytest.mark.parametrize("memory_limit", [1, 10 ** 9])
+    def test_unique(self, shuffled, memory_limit):
+        """Test dropping repeated URNs within and across runs."""
+        result = list(external_sort(shuffled + shuffled[:40], memory_limit=memory_limit, unique=True))
+        assert result == sorted(URNS, key=canonical_key)
+
+    def test_custom_key(self, shuffled):
+        """Test sorting by another key."""
+        assert list(external_sort(shuffled, memory_limit=3000, key=str)) == sorted(URNS)
+
+    def test_closing_removes_runs(self, shuffled, tmp_path):
+        """Test that an abandoned sort removes its temporary files."""
+        result = external_sort(shuffled, memory_limit=1000, temp_dir=tmp_path)
+        next(result)
+        assert list(tmp_path.iterdir()) != []
+        result.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_arguments(self):
+        """Test that the memory limit and fan-in are checked."""
+        with pytest.raises(ValueError):
+            external_sort(URNS, memory_limit=0)
+        with pytest.raises(ValueError):
+            external_sort(URNS, fan_in=1)
+
+
+class TestSortFile:
+    """Tests for sorting URN files."""
+
+    def test_sort_file(self, shuffled, tmp_path):
+        """Test sorting one file into another."""
+        source = tmp_path / "urns.txt"
+        source.write_text("\n".join(shuffled) + "\n\n", encoding="utf-8")
+        count = sort_file(source, tmp_path / "sorted.txt", memory_limit=5000)
+        assert count == len(URNS)
+        assert (tmp_path / "sorted.txt").read_text(encoding="utf-8").splitlines() == sorted(URNS, key=canonical_key)
+
+    def test_sort_file_in_place(self, shuffled, tmp_path):
+        """Test sorting a file onto itself."""
+        source = tmp_path / "urns.txt"
+        source.write_text("\n".join(shuffled), encoding="utf-8")
+        sort_file(source, source, memory_limit=5000)
+        assert source.read_text(encoding="utf-8").splitlines() == sorted(URNS, key=canonical_key)
+        assert [path.name for path in tmp_path.iterdir()] == ["urns.txt"]
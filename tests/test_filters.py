@@ -0,0 +1,176 @@
+import pytest
+
+from urn_citation import (
+    Cite2Urn,
+    CtsUrn,
+    SortedUrnArray,
+    SqliteUrnStore,
+    Urn,
+    UrnFilter,
+)
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [
+    ILIAD + "1",
+    ILIAD + "1.1",
+    ILIAD + "1.2",
+    ILIAD + "1.10",
+    ILIAD + "1.1@μῆνιν",
+    ILIAD + "1.1-1.5",
+    ILIAD + "2.1",
+    ILIAD + "10.1",
+    ILIAD,
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+    "urn:cts:latinLit:phi0959.phi006:1.1.3",
+    "urn:cite2:hmt:msA.v1:12r",
+    "urn:cite2:hmt:msA:12v",
+    "urn:cite2:hmt:vaimg.v1:VA012RN@0.1,0.2,0.3,0.4",
+]
+
+CTS_URNS = [urn for urn in URNS if urn.startswith("urn:cts:")]
+
+
+class TestUrnFilterExpressions:
+    """Tests for compiling and evaluating filter expressions."""
+
+    @pytest.mark.parametrize("expression, method", [
+        ('within("urn:cts:greekLit:tlg0012.tlg001.msA:1")', None),
+        ('contained_by("urn:cts:greekLit:tlg0012.tlg001:1")', "contains"),
+        ('contained_by("urn:cts:greekLit:tlg0012:")', "contains"),
+        ('contained_by("urn:cite2:hmt:msA:12r")', "contains"),
+    ])
+    def test_containment_functions(self, expression, method):
+        """Test that contained_by agrees with contains."""
+        selected = [urn for urn in URNS if UrnFilter(expression)(urn)]
+        if method is not None:
+            container = Urn.parse(expression.split('"')[1])
+            expected = []
+            for urn in URNS:
+                parsed = Urn.parse(urn)
+                if type(parsed) is not type(container) or (isinstance(parsed, CtsUrn) and parsed.is_range()):
+                    continue
+                if container.contains(parsed):
+                    expected.append(urn)
+            assert selected == expected
+
+    def test_within_matches_store(self):
+        """Test that within agrees with SqliteUrnStore.within."""
+        with SqliteUrnStore() as store:
+            store.add_many(URNS)
+            for container in (ILIAD + "1", ILIAD + "1.1", "urn:cts:greekLit:tlg0012:", ILIAD):
+                selected = UrnFilter(f'within("{container}")').select(URNS)
+                assert sorted(selected) == sorted(store.within(container))
+
+    def test_within_ranges_and_subreferences(self):
+        """Test that within selects ranges only when both ends lie within, and follows CtsUrn.contains for subreferences."""
+        urns = [ILIAD + "1.5-1.9", ILIAD + "1.5-2.3", ILIAD + "1@x", ILIAD + "1.1@μῆνιν", ILIAD + "1.1"]
+        within = UrnFilter(f'within("{ILIAD}1")')
+        assert within.select(urns) == [ILIAD + "1.5-1.9", ILIAD + "1.1@μῆνιν", ILIAD + "1.1"]
+        assert within.select(SortedUrnArray(urns)) == SortedUrnArray(urns).contained(ILIAD + "1")
+        with SqliteUrnStore() as store:
+            store.add_many(urns)
+            assert within.select(store) == store.within(ILIAD + "1")
+        assert UrnFilter(f'within("{ILIAD}1.1")').select(urns) == [ILIAD + "1.1"]
+
+    def test_field_comparisons(self):
+        """Test comparisons, membership and None checks on fields."""
+        assert UrnFilter('namespace == "latinLit"').select(URNS) == ["urn:cts:latinLit:phi0959.phi006:1.1.3"]
+        assert UrnFilter('urn_type == "cite2" and version is None').select(URNS) == ["urn:cite2:hmt:msA:12v"]
+        assert UrnFilter('version in ("msB", "v1") and urn_type == "cts"').select(URNS) == ["urn:cts:greekLit:tlg0012.tlg001.msB:1.1"]
+        assert len(UrnFilter('collection != "msA"').select(URNS)) == len(URNS) - 2
+
+    def test_missing_fields_in_mixed_input(self):
+        """Test that ordering and membership on missing fields are false instead of raising."""
+        assert UrnFilter('passage < "2"').select(URNS) == [ILIAD + "1", ILIAD + "1.1", ILIAD + "1.2", ILIAD + "1.10", ILIAD + "1.1@μῆνιν", ILIAD + "1.1-1.5", ILIAD + "10.1", "urn:cts:greekLit:tlg0012.tlg001.msB:1.1", "urn:cts:greekLit:tlg0012.tlg002.msA:1.1", "urn:cts:latinLit:phi0959.phi006:1.1.3"]
+        assert UrnFilter('"@" in passage').select(URNS) == [ILIAD + "1.1@μῆνιν"]
+        assert UrnFilter('"@" not in passage and urn_type == "cts"').select(URNS) == [urn for urn in CTS_URNS if urn != ILIAD + "1.1@μῆνιν"]
+        assert UrnFilter('version > "a"').select(URNS) == [urn for urn in URNS if ".msA:" in urn or ".msB:" in urn or ".v1:" in urn]
+        assert UrnFilter('"1" <= passage < "2"').select(URNS + ["urn:cts:greekLit:tlg0012.tlg001:"]) == UrnFilter('passage < "2"').select(URNS)
+        for urn in [*URNS, "urn:cts:greekLit:tlg0012.tlg001:"]:
+            assert UrnFilter('passage >= "1" or object_id in "12r"')(Urn.parse(urn)) is UrnFilter('passage >= "1" or object_id in "12r"')(urn)
+
+    def test_string_methods(self):
+        """Test startswith and endswith, which are false for missing fields."""
+        assert UrnFilter('passage.startswith("10")').select(URNS) == [ILIAD + "10.1"]
+        assert UrnFilter('object_id.endswith("r")').select(URNS) == ["urn:cite2:hmt:msA.v1:12r"]
+
+    def test_structure_functions(self):
+        """Test is_range, has_subreference and depth."""
+        assert UrnFilter("is_range()").select(URNS) == [ILIAD + "1.1-1.5"]
+        assert UrnFilter("has_subreference()").select(URNS) == [ILIAD + "1.1@μῆνιν", "urn:cite2:hmt:vaimg.v1:VA012RN@0.1,0.2,0.3,0.4"]
+        assert UrnFilter('depth() == 3').select(URNS) == ["urn:cts:latinLit:phi0959.phi006:1.1.3"]
+        assert UrnFilter('urn_type == "cts" and depth() == 0').select(URNS) == [ILIAD]
+
+    def test_boolean_combinations(self):
+        """Test and, or, not and parentheses."""
+        expression = 'within("urn:cts:greekLit:tlg0012.tlg001.msA:1") and not (is_range() or has_subreference()) and depth() > 1'
+        assert UrnFilter(expression).select(URNS) == [ILIAD + "1.1", ILIAD + "1.2", ILIAD + "1.10"]
+
+    def test_objects_and_strings_agree(self):
+        """Test that URN objects are filtered like their strings."""
+        urn_filter = UrnFilter('namespace == "hmt" or within("urn:cts:greekLit:tlg0012.tlg001:1")')
+        objects = [Urn.parse(urn) for urn in URNS]
+        assert [str(urn) for urn in urn_filter.filter(objects)] == list(urn_filter.filter(URNS))
+        assert all(isinstance(urn, (CtsUrn, Cite2Urn)) for urn in urn_filter.filter(objects))
+
+    @pytest.mark.parametrize("expression", [
+        "__import__('os')",
+        "passage.upper()",
+        "f.get('x')",
+        "unknown == 'x'",
+        "passage == b'1'",
+        "within(passage)",
+        'within("urn:cts:greekLit:tlg0012:1-2")',
+        'contained_by("urn:cts:bad")',
+        "namespace ==",
+        "-depth()",
+        "passage[0]",
+        "lambda: 1",
+    ])
+    def test_rejected_expressions(self, expression):
+        """Test that anything outside the filter language is rejected."""
+        with pytest.raises(ValueError):
+            UrnFilter(expression)
+
+    def test_source_is_one_function(self):
+        """Test that the expression compiles to a single function."""
+        urn_filter = UrnFilter('namespace == "greekLit" and not is_range()')
+        assert urn_filter.source.startswith("def predicate(f):")
+        assert urn_filter.source.count("def ") == 1
+
+
+class TestUrnFilterPushdown:
+    """Tests for narrowing candidates with indexes."""
+
+    EXPRESSIONS = [
+        'within("urn:cts:greekLit:tlg0012.tlg001.msA:1") and not has_subreference()',
+        'contained_by("urn:cts:greekLit:tlg0012.tlg001:1") and passage != "1.2"',
+        'within("urn:cts:greekLit:tlg0012:") or namespace == "latinLit"',
+        'version == "msA"',
+    ]
+
+    @pytest.mark.parametrize("expression", EXPRESSIONS)
+    def test_sorted_array(self, expression):
+        """Test that selection from a SortedUrnArray equals a scan."""
+        urn_filter = UrnFilter(expression)
+        array = SortedUrnArray(CTS_URNS)
+        assert urn_filter.select(array) == list(urn_filter.filter(array.urns))
+
+    @pytest.mark.parametrize("expression", EXPRESSIONS + ['contained_by("urn:cite2:hmt:msA:12r")'])
+    def test_sqlite_store(self, expression):
+        """Test that selection from a SqliteUrnStore equals a scan."""
+        urn_filter = UrnFilter(expression)
+        with SqliteUrnStore() as store:
+            store.add_many(URNS)
+            assert urn_filter.select(store) == list(urn_filter.filter(store))
+
+    def test_pushdown_narrows_candidates(self, monkeypatch):
+        """Test that a within term is answered by the index."""
+        array = SortedUrnArray(CTS_URNS)
+        calls = []
+        original = SortedUrnArray.contained
+        monkeypatch.setattr(SortedUrnArray, "contained", lambda self, urn: calls.append(urn) or original(self, urn))
+        UrnFilter('within("urn:cts:greekLit:tlg0012.tlg001.msA:2") and depth() == 2').select(array)
+        assert calls == ["urn:cts:greekLit:tlg0012.tlg001.msA:2"]
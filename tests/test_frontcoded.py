@@ -0,0 +1,110 @@
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, FrontCodedUrnList
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [f"{ILIAD}{book}.{line}" for book in range(1, 4) for line in range(1, 40)] + [
+    "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+]
+
+
+@pytest.fixture
+def urn_list():
+    return FrontCodedUrnList(reversed(URNS), block_size=8)
+
+
+class TestFrontCodedUrnList:
+    """Tests for the front-coded URN list."""
+
+    def test_entries_are_sorted(self, urn_list):
+        """Test that entries decode in sorted order."""
+        assert list(urn_list.strings()) == sorted(URNS)
+        assert len(urn_list) == len(URNS)
+
+    def test_getitem_constructs_ctsurn(self, urn_list):
+        """Test that indexing returns CtsUrn objects."""
+        urn = urn_list[0]
+        assert isinstance(urn, CtsUrn)
+        assert str(urn) == sorted(URNS)[0]
+        assert str(urn_list[-1]) == sorted(URNS)[-1]
+
+    def test_iteration_constructs_ctsurns(self, urn_list):
+        """Test that iteration yields CtsUrn objects in order."""
+        assert [str(urn) for urn in urn_list] == sorted(URNS)
+
+    def test_string_out_of_range(self, urn_list):
+        """Test that an out-of-range position raises IndexError."""
+        with pytest.raises(IndexError):
+            urn_list.string(len(URNS))
+
+    def test_contains_and_index(self, urn_list):
+        """Test binary search for every entry."""
+        ordered = sorted(URNS)
+        for i, urn in enumerate(ordered):
+            assert urn in urn_list
+            assert urn_list.index(urn) == i
+        assert CtsUrn.from_string(ILIAD + "2.7") in urn_list
+
+    def test_missing_entries(self, urn_list):
+        """Test that absent URNs are not found."""
+        assert ILIAD + "9.9" not in urn_list
+        assert "urn:cts:aaa:x:" not in urn_list
+        assert "urn:cts:zzz:x:" not in urn_list
+        with pytest.raises(ValueError):
+            urn_list.index(ILIAD + "9.9")
+
+    def test_bisect_left(self, urn_list):
+        """Test insertion points agree with a plain sorted list."""
+        import bisect
+        ordered = sorted(URNS)
+        for probe in ["urn:cts:a", ILIAD + "1.15x", ILIAD + "3", "urn:cts:z"] + ordered:
+            assert urn_list.bisect_left(probe) == bisect.bisect_left(ordered, probe)
+
+    def test_prefixed(self, urn_list):
+        """Test decoding all entries under a string prefix."""
+        book_two = list(urn_list.prefixed(ILIAD + "2."))
+        assert book_two == sorted(urn for urn in URNS if urn.startswith(ILIAD + "2."))
+        assert list(urn_list.prefixed("urn:cts:greekLit:tlg9999")) == []
+
+    def test_sequential_slice(self, urn_list):
+        """Test decoding a slice that crosses restart points."""
+        assert list(urn_list.strings(5, 30)) == sorted(URNS)[5:30]
+
+    def test_encoding_is_smaller_than_strings(self, urn_list):
+        """Test that shared prefixes are not stored repeatedly."""
+        assert urn_list.nbytes() < sum(len(urn) for urn in URNS) / 2
+
+    @pytest.mark.parametrize("block_size", [1, 2, 16, 1000])
+    def test_block_sizes(self, block_size):
+        """Test that any block size decodes the same entries."""
+        urn_list = FrontCodedUrnList(URNS, block_size=block_size)
+        assert list(urn_list.strings()) == sorted(URNS)
+        assert all(urn in urn_list for urn in URNS)
+
+    def test_invalid_block_size(self):
+        """Test that block_size must be positive."""
+        with pytest.raises(ValueError):
+            FrontCodedUrnList(URNS, block_size=0)
+
+    def test_empty_list(self):
+        """Test an empty list."""
+        urn_list = FrontCodedUrnList([])
+        assert len(urn_list) == 0
+        assert ILIAD + "1.1" not in urn_list
+        assert list(urn_list) == []
+
+    def test_cite2urn_entries(self):
+        """Test a list of Cite2Urn objects."""
+        urns = [Cite2Urn.from_string(f"urn:cite2:hmt:msA.v1:{n}r") for n in range(1, 20)]
+        urn_list = FrontCodedUrnList(urns, urn_class=Cite2Urn)
+        assert isinstance(urn_list[0], Cite2Urn)
+        assert urns[4] in urn_list
+
+    def test_non_ascii_entries(self):
+        """Test that entries are ordered and decoded as UTF-8."""
+        urns = ["urn:cts:greekLit:tlg0012.tlg001.msA:1.1@μῆνιν", "urn:cts:greekLit:tlg0012.tlg001.msA:1.1@ἄειδε"]
+        urn_list = FrontCodedUrnList(urns)
+        assert set(urn_list.strings()) == set(urns)
+        assert all(urn in urn_list for urn in urns)
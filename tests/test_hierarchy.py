@@ -0,0 +1,51 @@
+import pytest
+
+from urn_citation import CtsUrn, CtsUrnColumns
+from urn_citation.hierarchy import depths, parents, truncate_many
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [ILIAD + "1.2.3", ILIAD + "1", ILIAD + "1.2@μῆνιν", ILIAD, "urn:cts:latinLit:phi0959.phi006:3.14"]
+
+
+class TestBatchHierarchy:
+    """Tests that batch hierarchy operations agree with the CtsUrn methods."""
+
+    @pytest.mark.parametrize("as_objects", [False, True])
+    def test_depths(self, as_objects):
+        """Test counting levels for strings and CtsUrn objects."""
+        urns = [CtsUrn.from_string(urn) for urn in URNS] if as_objects else URNS
+        assert depths(urns) == [CtsUrn.from_string(urn).depth() for urn in URNS]
+
+    def test_depths_of_columns(self):
+        """Test counting levels of a columnar container."""
+        assert depths(CtsUrnColumns(URNS)) == [3, 1, 2, 0, 2]
+
+    @pytest.mark.parametrize("depth", [0, 1, 2, 3])
+    @pytest.mark.parametrize("as_objects", [False, True])
+    def test_truncate_many(self, depth, as_objects):
+        """Test truncating strings and CtsUrn objects."""
+        urns = [CtsUrn.from_string(urn) for urn in URNS] if as_objects else URNS
+        assert truncate_many(urns, depth) == [str(CtsUrn.from_string(urn).truncate(depth)) for urn in URNS]
+
+    def test_truncate_columns(self):
+        """Test that truncating columns replaces only the passage column."""
+        columns = CtsUrnColumns(URNS)
+        truncated = truncate_many(columns, 1)
+        assert isinstance(truncated, CtsUrnColumns)
+        assert truncated.columns["passage"] == ["1", "1", "1", None, "3"]
+        assert truncated.columns["work"] is columns.columns["work"]
+        assert columns.columns["passage"][0] == "1.2.3"
+
+    @pytest.mark.parametrize("as_objects", [False, True])
+    def test_parents(self, as_objects):
+        """Test finding parents of strings and CtsUrn objects."""
+        urns = [CtsUrn.from_string(urn) for urn in URNS] if as_objects else URNS
+        expected = [CtsUrn.from_string(urn).parent() for urn in URNS]
+        assert parents(urns) == [None if urn is None else str(urn) for urn in expected]
+
+    def test_ranges_are_rejected(self):
+        """Test that ranges raise ValueError."""
+        for function in (depths, parents, lambda urns: truncate_many(urns, 1)):
+            with pytest.raises(ValueError):
+                function([ILIAD + "1.1-1.5"])
@@ -0,0 +1,148 @@
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn
+from urn_citation.ordering import (
+    canonical_key,
+    cite2_key,
+    cts_key,
+    cts_passage_bounds,
+    cts_work_bounds,
+    natural_key,
+    reference_key,
+    sort_key,
+)
+
+
+class TestNaturalKey:
+    """Tests for natural ordering of identifiers."""
+
+    def test_numbers_compare_numerically(self):
+        """Test that digit runs compare as numbers."""
+        assert natural_key("2") < natural_key("10")
+        assert natural_key("tlg2") < natural_key("tlg10")
+
+    def test_text_compares_as_text(self):
+        """Test that text runs compare as text."""
+        assert natural_key("12r") < natural_key("12v")
+        assert natural_key("12v") < natural_key("13r")
+        assert natural_key("a") < natural_key("b")
+
+    def test_none_sorts_first(self):
+        """Test that a missing identifier sorts before any identifier."""
+        assert natural_key(None) < natural_key("")
+        assert natural_key(None) < natural_key("0")
+
+
+class TestReferenceKey:
+    """Tests for ordering passage references."""
+
+    def test_levels_in_natural_order(self):
+        """Test that citation levels compare level by level."""
+        ordered = ["1", "1.1", "1.2", "1.10", "2", "10", "10.1"]
+        assert sorted(ordered, key=reference_key) == ordered
+
+    def test_container_sorts_before_contents(self):
+        """Test that a passage sorts before the passages it contains."""
+        assert reference_key("1") < reference_key("1.1") < reference_key("1.1.1")
+
+    def test_subreference_and_range(self):
+        """Test ordering of subreferences and ranges after their passage."""
+        ordered = ["1.1", "1.1-1.5", "1.1@a", "1.1@b", "1.2"]
+        assert sorted(ordered, key=reference_key) == ordered
+
+    def test_no_passage_sorts_first(self):
+        """Test that a missing passage sorts before any passage."""
+        assert reference_key(None) < reference_key("1")
+
+
+class TestCtsKey:
+    """Tests for canonical ordering of CTS URNs."""
+
+    def test_string_and_model_keys_agree(self):
+        """Test that keys from strings equal keys from CtsUrn objects."""
+        for value in [
+            "urn:cts:greekLit:tlg0012:",
+            "urn:cts:greekLit:tlg0012.tlg001:",
+            "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1@μῆνιν-1.5",
+        ]:
+            assert cts_key(value) == cts_key(CtsUrn.from_string(value))
+
+    def test_work_hierarchy_before_passage(self):
+        """Test that URNs are grouped by work hierarchy before passage."""
+        ordered = [
+            "urn:cts:greekLit:tlg0012:",
+            "urn:cts:greekLit:tlg0012.tlg001:",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:2.1",
+            "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+            "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+        ]
+        assert sorted(reversed(ordered), key=cts_key) == ordered
+
+    def test_passage_bounds(self):
+        """Test that passage bounds enclose exactly the contained passages."""
+        container = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1")
+        lower, upper = cts_passage_bounds(cts_key(container)[:5], container.passage)
+        inside = ["urn:cts:greekLit:tlg0012.tlg001.msA:1", "urn:cts:greekLit:tlg0012.tlg001.msA:1.1", "urn:cts:greekLit:tlg0012.tlg001.msA:1.999.3"]
+        outside = ["urn:cts:greekLit:tlg0012.tlg001.msA:10", "urn:cts:greekLit:tlg0012.tlg001.msA:2", "urn:cts:greekLit:tlg0012.tlg001.msA:", "urn:cts:greekLit:tlg0012.tlg001.msB:1.1"]
+        for value in inside:
+            assert lower <= cts_key(value) < upper
+        for value in outside:
+            assert not lower <= cts_key(value) < upper
+
+    def test_passage_bounds_rejects_range(self):
+        """Test that a range cannot be used as a prefix."""
+        with pytest.raises(ValueError):
+            cts_passage_bounds(cts_key("urn:cts:greekLit:tlg0012.tlg001.msA:")[:5], "1.1-1.5")
+
+    def test_work_bounds(self):
+        """Test that work bounds enclose every URN of the work."""
+        lower, upper = cts_work_bounds(CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:"))
+        for value in ["urn:cts:greekLit:tlg0012.tlg001:", "urn:cts:greekLit:tlg0012.tlg001.msA:1.1", "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:24.804"]:
+            assert lower <= cts_key(value) < upper
+        for value in ["urn:cts:greekLit:tlg0012:", "urn:cts:greekLit:tlg0012.tlg002.msA:1.1", "urn:cts:latinLit:tlg0012.tlg001:"]:
+            assert not lower <= cts_key(value) < upper
+
+
+class TestCite2Key:
+    """Tests for canonical ordering of CITE2 URNs."""
+
+    def test_string_and_model_keys_agree(self):
+        """Test that keys from strings equal keys from Cite2Urn objects."""
+        for value in ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA:1r-2v"]:
+            assert cite2_key(value) == cite2_key(Cite2Urn.from_string(value))
+
+    def test_object_ids_in_natural_order(self):
+        """Test that object identifiers sort naturally."""
+        ordered = ["urn:cite2:hmt:msA.v1:2r", "urn:cite2:hmt:msA.v1:2v", "urn:cite2:hmt:msA.v1:10r"]
+        assert sorted(reversed(ordered), key=cite2_key) == ordered
+
+
+class TestSortKey:
+    """Tests for ordering URNs of either type."""
+
+    def test_cts_before_cite2(self):
+        """Test that CTS URNs sort before CITE2 URNs."""
+        assert sort_key("urn:cts:greekLit:tlg0012:") < sort_key("urn:cite2:hmt:msA.v1:1r")
+        assert sort_key(CtsUrn.from_string("urn:cts:zzz:tlg0012:")) < sort_key(Cite2Urn.from_string("urn:cite2:aaa:msA.v1:1r"))
+
+    def test_unknown_type(self):
+        """Test that unknown URN types are rejected."""
+        with pytest.raises(ValueError):
+            sort_key("urn:isbn:0451450523")
+
+
+class TestCanonicalKey:
+    """Tests for the total canonical order of URN strings."""
+
+    def test_ties_broken_by_string(self):
+        """Test that strings with equal sort keys are ordered by the string."""
+        urns = ["urn:cts:greekLit:tlg0012.tlg001.msA:1.1", "urn:cts:greekLit:tlg0012.tlg001.msA:1.01"]
+        assert sort_key(urns[0]) == sort_key(urns[1])
+        assert sorted(urns, key=canonical_key) == sorted(urns)
+
+    def test_follows_sort_key(self):
+        """Test that distinct sort keys keep their order."""
+        urns = ["urn:cite2:hmt:msA:1r", "urn:cts:greekLit:tlg0012.tlg001.msA:1.10", "urn:cts:greekLit:tlg0012.tlg001.msA:1.2"]
+        assert sorted(urns, key=canonical_key) == sorted(urns, key=sort_key)
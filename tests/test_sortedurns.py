@@ -0,0 +1,157 @@
+import random
+
+import pytest
+
+from urn_citation import CtsUrn, SortedUrnArray
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = (
+    [f"{ILIAD}{book}.{line}" for book in range(1, 13) for line in range(1, 12)]
+    + [f"{ILIAD}{book}" for book in range(1, 13)]
+    + ["urn:cts:greekLit:tlg0012.tlg001.msB:1.1", "urn:cts:greekLit:tlg0012.tlg002.msA:1.1", "urn:cts:greekLit:tlg0012.tlg001.msA:"]
+    + ["urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1", "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:2.1"]
+)
+
+
+@pytest.fixture
+def array():
+    shuffled = list(URNS)
+    random.Random(0).shuffle(shuffled)
+    return SortedUrnArray(shuffled)
+
+
+def scan_contained(container):
+    """Select contained URNs by scanning with the CtsUrn predicates."""
+    container = CtsUrn.from_string(container)
+    selected = []
+    for value in URNS:
+        urn = CtsUrn.from_string(value)
+        if not (urn.namespace == container.namespace and container.work_contains(urn)):
+            continue
+        if container.passage is None or (urn.passage is not None and container.passage_contains(urn)):
+            selected.append(value)
+    return selected
+
+
+class TestSortedUrnArray:
+    """Tests for the sorted URN array."""
+
+    def test_natural_passage_order(self, array):
+        """Test that passages are in natural, not lexical, order."""
+        position_2 = array.index(ILIAD + "2.1")
+        position_10 = array.index(ILIAD + "10.1")
+        assert position_2 < position_10
+        assert array.index(ILIAD + "1.2") < array.index(ILIAD + "1.10")
+
+    def test_contains_and_index(self, array):
+        """Test exact lookup."""
+        assert ILIAD + "3.4" in array
+        assert CtsUrn.from_string(ILIAD + "3.4") in array
+        assert ILIAD + "13.1" not in array
+        assert array[array.index(ILIAD + "3.4")] == CtsUrn.from_string(ILIAD + "3.4")
+        with pytest.raises(ValueError):
+            array.index(ILIAD + "13.1")
+
+    def test_leading_zeros_are_distinct(self):
+        """Test that URNs whose keys are equal but strings differ are not confused."""
+        array = SortedUrnArray([ILIAD + "1.1", ILIAD + "1.01.2", ILIAD + "1.1.3", "urn:cts:greekLit:tlg0012.tlg01.msA:1.1"])
+        assert ILIAD + "1.1" in array
+        assert ILIAD + "1.01" not in array
+        with pytest.raises(ValueError):
+            array.index(ILIAD + "1.01")
+        assert array.contained(ILIAD + "1.1") == [ILIAD + "1.1", ILIAD + "1.1.3"]
+        assert array.contained(ILIAD + "1.01") == [ILIAD + "1.01.2"]
+        assert array.contained("urn:cts:greekLit:tlg0012.tlg001:") == [ILIAD + "1.1", ILIAD + "1.01.2", ILIAD + "1.1.3"]
+        assert all(CtsUrn.from_string(ILIAD + "1.1").contains(CtsUrn.from_string(value)) for value in array.contained(ILIAD + "1.1"))
+
+    @pytest.mark.parametrize("container", [
+        ILIAD + "1",
+        ILIAD + "10",
+        ILIAD + "1.1",
+        ILIAD,
+        "urn:cts:greekLit:tlg0012.tlg001:1",
+        "urn:cts:greekLit:tlg0012.tlg001:",
+        "urn:cts:greekLit:tlg0012:",
+        "urn:cts:greekLit:tlg0013:",
+    ])
+    def test_contained_matches_scan(self, array, container):
+        """Test that bisection selects the same URNs as a scan."""
+        assert sorted(array.contained(container)) == sorted(scan_contained(container))
+
+    def test_contained_slices_per_exemplar(self, array):
+        """Test that an open exemplar gives one slice per exemplar."""
+        slices = array.contained_slices(ILIAD + "1")
+        assert [array.urns[s.start] for s in slices] == [ILIAD + "1", "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1"]
+
+    def test_contained_subreferences(self):
+        """Test that subreferences are compared as in CtsUrn.passage_contains."""
+        urns = [ILIAD + "1", ILIAD + "1@x", ILIAD + "1.1", ILIAD + "1.1@μῆνιν", ILIAD + "1.1@μῆνιν.2"]
+        array = SortedUrnArray(urns)
+        assert array.contained(ILIAD + "1") == [ILIAD + "1", ILIAD + "1.1", ILIAD + "1.1@μῆνιν", ILIAD + "1.1@μῆνιν.2"]
+        assert array.contained(ILIAD + "1.1") == [ILIAD + "1.1"]
+        assert array.contained(ILIAD + "1.1@μῆνιν") == [ILIAD + "1.1@μῆνιν", ILIAD + "1.1@μῆνιν.2"]
+        for container in (ILIAD + "1", ILIAD + "1.1", ILIAD + "1.1@μῆνιν"):
+            parsed = CtsUrn.from_string(container)
+            assert array.contained(container) == [urn for urn in array.urns if parsed.contains(CtsUrn.from_string(urn))]
+
+    def test_contained_ranges(self):
+        """Test that a range is contained only when both of its ends are."""
+        urns = [ILIAD + "1.5-1.9", ILIAD + "1.5-2.3", ILIAD + "1.5@a-1.6", ILIAD + "2.1-2.2", ILIAD + "1.1"]
+        array = SortedUrnArray(urns)
+        assert array.contained(ILIAD + "1") == [ILIAD + "1.1", ILIAD + "1.5-1.9", ILIAD + "1.5@a-1.6"]
+        assert array.contained(ILIAD + "2") == [ILIAD + "2.1-2.2"]
+        assert array.first_contained(ILIAD + "1.5") is None
+        assert array.contained(ILIAD[:-1].rpartition(".")[0] + ":") == array.urns
+
+    def test_contained_rejects_range(self, array):
+        """Test that a range cannot be a container."""
+        with pytest.raises(ValueError):
+            array.contained(ILIAD + "1.1-1.5")
+
+    def test_first_contained(self, array):
+        """Test finding the first passage under a prefix."""
+        assert str(array.first_contained(ILIAD + "4")) == ILIAD + "4"
+        assert str(array.first_contained("urn:cts:greekLit:tlg0012.tlg002:")) == "urn:cts:greekLit:tlg0012.tlg002.msA:1.1"
+        assert array.first_contained(ILIAD + "13") is None
+
+    def test_between(self, array):
+        """Test retrieving all passages from one passage to another."""
+        selected = array.between(ILIAD + "1.10", ILIAD + "2.2")
+        assert selected == [ILIAD + "1.10", ILIAD + "1.11", ILIAD + "2", ILIAD + "2.1", ILIAD + "2.2"]
+
+    def test_between_includes_contents_of_end(self, array):
+        """Test that a containing end includes its contents."""
+        selected = array.between(ILIAD + "11.11", ILIAD + "12")
+        assert selected[0] == ILIAD + "11.11"
+        assert selected[-1] == ILIAD + "12.11"
+        assert len(selected) == 13
+
+    def test_between_backwards_is_empty(self, array):
+        """Test that a backwards range is empty."""
+        assert array.between(ILIAD + "3.1", ILIAD + "2.1") == []
+
+    def test_range(self, array):
+        """Test retrieving the passages of a range URN."""
+        assert array.range(ILIAD + "5.3-5.5") == [ILIAD + "5.3", ILIAD + "5.4", ILIAD + "5.5"]
+        with pytest.raises(ValueError):
+            array.range(ILIAD + "5.3")
+
+    def test_bisect(self, array):
+        """Test insertion points."""
+        assert array.bisect_left(ILIAD + "1") == array.index(ILIAD + "1")
+        assert array.bisect_right(ILIAD + "1") == array.index(ILIAD + "1") + 1
+
+    def test_save_and_load(self, array, tmp_path):
+        """Test that a saved array loads back unchanged."""
+        path = tmp_path / "urns.txt"
+        array.save(path)
+        loaded = SortedUrnArray.load(path)
+        assert loaded.urns == array.urns
+        assert loaded.contained(ILIAD + "7") == array.contained(ILIAD + "7")
+
+    def test_iteration(self, array):
+        """Test that iteration yields CtsUrn objects."""
+        urns = list(array)
+        assert len(urns) == len(URNS)
+        assert all(isinstance(urn, CtsUrn) for urn in urns)
@@ -0,0 +1,144 @@
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, SortedUrnArray, SqliteUrnStore
+from urn_citation.ordering import canonical_key, cts_key
+from urn_citation.sqlitestore import encode_key
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+CTS_URNS = [
+    ILIAD + "1",
+    ILIAD + "1.1",
+    ILIAD + "1.2",
+    ILIAD + "1.10",
+    ILIAD + "1.1@μῆνιν",
+    ILIAD + "1.1-1.5",
+    ILIAD + "1-2",
+    ILIAD + "2.1",
+    ILIAD + "10.1",
+    ILIAD + "1a.1",
+    ILIAD + "pr.1",
+    ILIAD,
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg002.msA:1.1",
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:latinLit:tlg0012.tlg001.msA:1.1",
+]
+
+CITE2_URNS = ["urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msA.v2:12r", "urn:cite2:hmt:msA:12r", "urn:cite2:hmt:msA.v1:2r", "urn:cite2:hmt:msB.v1:12r"]
+
+
+@pytest.fixture
+def store():
+    with SqliteUrnStore() as store:
+        store.add_many(CTS_URNS + CITE2_URNS)
+        yield store
+
+
+class TestEncodeKey:
+    """Tests for the byte encoding of sort keys."""
+
+    def test_preserves_order(self):
+        """Test that encoded keys sort like the keys."""
+        urns = CTS_URNS + [ILIAD + "1.1.1", ILIAD + "1.01", ILIAD + "1.1@a-1.2"]
+        assert sorted(urns, key=lambda urn: encode_key(cts_key(urn))) == sorted(urns, key=cts_key)
+
+    def test_prefix_tuples_sort_first(self):
+        """Test that a tuple sorts before a longer tuple it begins."""
+        assert encode_key(((1,), "")) < encode_key(((1, 2), ""))
+        assert encode_key(("a",)) < encode_key(("a", 0))
+        assert encode_key(9) < encode_key(10)
+
+    def test_long_digit_runs(self):
+        """Test that integers of more than 255 digits are encoded in order."""
+        numbers = [10 ** 253, 10 ** 254 - 1, 10 ** 254, 10 ** 255 - 1, 10 ** 255, 2 * 10 ** 255, 10 ** 300, 10 ** 1000]
+        assert sorted(numbers, key=encode_key) == numbers
+        assert encode_key((10 ** 300, "a")) < encode_key((10 ** 300 + 1, ""))
+        urns = [ILIAD + "1." + "9" * 300, ILIAD + "1." + "1" + "0" * 300, ILIAD + "2"]
+        assert sorted(urns, key=lambda urn: encode_key(cts_key(urn))) == sorted(urns, key=cts_key)
+        with SqliteUrnStore() as store:
+            store.add_many(urns)
+            assert list(store) == sorted(urns, key=cts_key)
+
+
+class TestSqliteUrnStore:
+    """Tests for the SQLite URN store."""
+
+    def test_bulk_insert_and_membership(self, store):
+        """Test that URNs are stored once and found."""
+        assert len(store) == len(CTS_URNS) + len(CITE2_URNS)
+        assert store.add_many(CTS_URNS[:3]) == 0
+        assert store.add(CtsUrn.from_string(ILIAD + "3.1"))
+        assert not store.add(ILIAD + "3.1")
+        assert ILIAD + "1.10" in store
+        assert Cite2Urn.from_string(CITE2_URNS[0]) in store
+        assert ILIAD + "9.9" not in store
+
+    def test_canonical_order(self, store):
+        """Test that iteration follows canonical order."""
+        assert list(store) == sorted(CTS_URNS + CITE2_URNS, key=canonical_key)
+
+    def test_small_batches(self):
+        """Test inserting in several transactions."""
+        with SqliteUrnStore() as store:
+            assert store.add_many(CTS_URNS, batch_size=3) == len(CTS_URNS)
+
+    def test_invalid_urn_rolls_back_batch(self):
+        """Test that an invalid URN rejects its batch."""
+        with SqliteUrnStore() as store:
+            with pytest.raises(ValueError):
+                store.add_many(CTS_URNS[:3] + ["urn:cts:greekLit"], batch_size=2)
+            assert len(store) == 2
+
+    @pytest.mark.parametrize("container", [ILIAD + "1", ILIAD + "1.1", ILIAD, "urn:cts:greekLit:tlg0012:1", "urn:cts:greekLit:tlg0012.tlg001:1.1", "urn:cts:greekLit:tlg0012:"])
+    def test_contained_matches_contains(self, store, container):
+        """Test that SQL containment equals CtsUrn.contains."""
+        urn = CtsUrn.from_string(container)
+        expected = [u for u in sorted(CTS_URNS, key=canonical_key) if not CtsUrn.from_string(u).is_range() and urn.contains(CtsUrn.from_string(u))]
+        assert store.contained(container) == expected
+
+    @pytest.mark.parametrize("container", ["urn:cite2:hmt:msA:12r", "urn:cite2:hmt:msA.v1:12r", "urn:cite2:hmt:msB:2r"])
+    def test_cite2_contained_matches_contains(self, store, container):
+        """Test that SQL containment equals Cite2Urn.contains."""
+        urn = Cite2Urn.from_string(container)
+        expected = [u for u in sorted(CITE2_URNS, key=canonical_key) if urn.contains(Cite2Urn.from_string(u))]
+        assert store.contained(urn) == expected
+
+    @pytest.mark.parametrize("container", [ILIAD + "1", ILIAD + "1.1", ILIAD + "1.1@x", ILIAD, "urn:cts:greekLit:tlg0012:1", "urn:cts:greekLit:tlg0012:", "urn:cts:greekLit:tlg0012.tlg001:1.1"])
+    def test_within_matches_sorted_array(self, store, container):
+        """Test that SQL hierarchy selection equals SortedUrnArray.contained."""
+        assert store.within(container) == SortedUrnArray(CTS_URNS).contained(container)
+
+    def test_within_ranges_and_subreferences(self):
+        """Test that a range is within a passage only when both of its ends are, and subreferences follow CtsUrn.contains."""
+        urns = [ILIAD + "1.5-1.9", ILIAD + "1.5-2.3", ILIAD + "1@x", ILIAD + "1.1@μῆνιν", ILIAD + "1.1", ILIAD + "1-1.5"]
+        with SqliteUrnStore() as store:
+            store.add_many(urns)
+            assert store.within(ILIAD + "1") == [ILIAD + "1-1.5", ILIAD + "1.1", ILIAD + "1.1@μῆνιν", ILIAD + "1.5-1.9"]
+            assert store.within(ILIAD + "1.1") == [ILIAD + "1.1"]
+            assert store.within(ILIAD + "2") == []
+            assert store.within(ILIAD + "1") == SortedUrnArray(urns).contained(ILIAD + "1")
+
+    def test_ranges_rejected(self, store):
+        """Test that range containers are rejected."""
+        with pytest.raises(ValueError):
+            store.contained(ILIAD + "1.1-1.5")
+        with pytest.raises(ValueError):
+            store.within(ILIAD + "1.1-1.5")
+
+    def test_queries_use_index(self, store):
+        """Test that containment is answered with the hierarchy index."""
+        plan = store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT urn FROM cts_urns WHERE text_group = ? AND work = ? AND (passage = ? OR (passage > ? AND passage < ?))",
+            ("tlg0012", "tlg001", "1", "1.", "1/"),
+        ).fetchall()
+        assert any("cts_urns_hierarchy" in row[-1] for row in plan)
+
+    def test_persistence(self, tmp_path):
+        """Test that URNs survive reopening the database."""
+        path = tmp_path / "urns.sqlite"
+        with SqliteUrnStore(path) as store:
+            store.add_many(CTS_URNS)
+        with SqliteUrnStore(path) as store:
+            assert len(store) == len(CTS_URNS)
+            assert store.within(ILIAD + "2") == [ILIAD + "2.1"]
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import Cite2Urn, CtsUrn, SymbolTable
+from urn_citation.symbols import COMPONENTS
+
+
+class TestSymbolTable:
+    """Tests for the symbol table."""
+
+    def test_ids_in_order_of_first_use(self):
+        """Test that IDs are assigned in order and are stable."""
+        table = SymbolTable()
+        assert table.id("greekLit") == 0
+        assert table.id("tlg0012") == 1
+        assert table.id("greekLit") == 0
+        assert len(table) == 2
+        assert table.symbol(1) == "tlg0012"
+        assert "tlg0012" in table
+        assert "tlg0013" not in table
+
+    def test_unknown_id(self):
+        """Test that looking up an unassigned ID raises KeyError."""
+        table = SymbolTable()
+        table.id("greekLit")
+        with pytest.raises(KeyError):
+            table.symbol(1)
+        with pytest.raises(KeyError):
+            table.symbol(-1)
+
+    def test_intern_returns_shared_copy(self):
+        """Test that equal strings intern to one object."""
+        table = SymbolTable()
+        first = "".join(["tlg", "0012"])
+        second = "".join(["tlg", "0012"])
+        assert first is not second
+        assert table.intern(first) is first
+        assert table.intern(second) is first
+        assert table.intern(None) is None
+
+    def test_threads_agree_on_ids(self):
+        """Test that concurrent threads get one ID per string."""
+        table = SymbolTable()
+        values = [f"work{i % 50}" for i in range(5000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(table.id, values))
+        assert len(table) == 50
+        assert all(table.symbol(id) == value for id, value in zip(ids, values))
+
+
+class TestInternedComponents:
+    """Tests for interning of URN hierarchy components."""
+
+    def test_parsed_cts_urns_share_components(self):
+        """Test that parsed CTS URNs share their work hierarchy strings but not passages."""
+        first = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        second = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1", trusted=True)
+        for name in ("urn_type", "namespace", "text_group", "work", "version"):
+            assert getattr(first, name) is getattr(second, name)
+        assert first.version in COMPONENTS
+        assert "1.1" not in COMPONENTS
+
+    def test_constructed_urns_share_components(self):
+        """Test that URNs built from keyword arguments are interned too."""
+        parsed = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1.1")
+        built = CtsUrn(urn_type="cts", namespace="greekLit", text_group="".join(["tlg", "0012"]), work="tlg001")
+        assert built.text_group is parsed.text_group
+        assert built.work_equals(parsed.drop_passage())
+
+    def test_cite2_urns_share_components(self):
+        """Test that CITE2 URNs share their collection hierarchy strings."""
+        first = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r")
+        second = Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12v")
+        assert first.collection is second.collection
+        assert first.version is second.version
+        assert first.collection_equals(second)
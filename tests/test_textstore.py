@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from urn_citation import CexIndex, CtsUrn, TextStore
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+PASSAGES = [
+    (ILIAD + "1.1", "Μῆνιν ἄειδε θεὰ Πηληϊάδεω Ἀχιλῆος"),
+    (ILIAD + "1.2", "οὐλομένην, ἣ μυρί' Ἀχαιοῖς ἄλγε' ἔθηκε,"),
+    (ILIAD + "1.3", "πολλὰς δ' ἰφθίμους ψυχὰς Ἄϊδι προΐαψεν"),
+    (ILIAD + "2.1", "Ἄλλοι μέν ῥα θεοί τε καὶ ἀνέρες ἱπποκορυσταὶ"),
+    (ILIAD + "2.2", "εὗδον παννύχιοι, Δία δ' οὐκ ἔχε νήδυμος ὕπνος,"),
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with TextStore.build(PASSAGES, tmp_path / "iliad.txt") as store:
+        yield store
+
+
+class TestTextStoreBuild:
+    """Tests for writing and opening a text store."""
+
+    def test_urns_in_corpus_order(self, store):
+        """Test that URNs are kept in corpus order."""
+        assert store.urns == [urn for urn, _ in PASSAGES]
+        assert len(store) == 5
+
+    def test_contains(self, store):
+        """Test membership by string and by CtsUrn."""
+        assert ILIAD + "1.2" in store
+        assert CtsUrn.from_string(ILIAD + "2.1") in store
+        assert ILIAD + "3.1" not in store
+
+    def test_build_accepts_ctsurn_keys(self, tmp_path):
+        """Test that passages may be keyed by CtsUrn objects."""
+        passages = [(CtsUrn.from_string(urn), text) for urn, text in PASSAGES]
+        with TextStore.build(passages, tmp_path / "iliad.txt") as store:
+            assert store.text(ILIAD + "1.1") == PASSAGES[0][1]
+
+    def test_reopen(self, tmp_path):
+        """Test that a written store can be opened again."""
+        TextStore.build(PASSAGES, tmp_path / "iliad.txt").close()
+        with TextStore(tmp_path / "iliad.txt") as store:
+            assert store.text(ILIAD + "2.2") == PASSAGES[4][1]
+
+    def test_duplicate_urn(self, tmp_path):
+        """Test that a repeated URN is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            TextStore.build(PASSAGES + PASSAGES[:1], tmp_path / "iliad.txt")
+        assert "more than once" in str(exc_info.value)
+
+    def test_newline_in_text(self, tmp_path):
+        """Test that a text containing a newline is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            TextStore.build([(ILIAD + "1.1", "one\ntwo")], tmp_path / "iliad.txt")
+        assert "newline" in str(exc_info.value)
+
+    def test_empty_store(self, tmp_path):
+        """Test that an empty corpus can be stored."""
+        with TextStore.build([], tmp_path / "empty.txt") as store:
+            assert len(store) == 0
+            with pytest.raises(KeyError):
+                store.text(ILIAD + "1.1")
+
+    def test_from_cex(self, tmp_path):
+        """Test building a store from the ctsdata blocks of a CEX source."""
+        source = tmp_path / "iliad.cex"
+        lines = ["#!cexversion", "3.0", "", "#!ctsdata"]
+        lines += [f"{urn}#{text}" for urn, text in PASSAGES[:3]]
+        lines += ["#!relations", "a#b#c", "#!ctsdata"]
+        lines += [f"{urn}#{text}" for urn, text in PASSAGES[3:]]
+        source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with TextStore.from_cex(source, tmp_path / "iliad.txt", CexIndex.build(source)) as store:
+            assert store.urns == [urn for urn, _ in PASSAGES]
+            assert store.text(ILIAD + "2.1") == PASSAGES[3][1]
+
+
+class TestTextStoreRetrieval:
+    """Tests for retrieving passages, ranges and containing passages."""
+
+    def test_single_passage_text(self, store):
+        """Test retrieving a single passage as a string."""
+        assert store.text(ILIAD + "1.2") == PASSAGES[1][1]
+
+    def test_single_passage_view(self, store):
+        """Test retrieving a single passage as a memoryview."""
+        view = store.view(CtsUrn.from_string(ILIAD + "1.1"))
+        assert isinstance(view, memoryview)
+        assert bytes(view) == PASSAGES[0][1].encode("utf-8")
+        view.release()
+
+    def test_range(self, store):
+        """Test that a range concatenates passages in corpus order."""
+        assert store.text(ILIAD + "1.2-2.1") == "\n".join(text for _, text in PASSAGES[1:4])
+
+    def test_range_with_containing_endpoints(self, store):
+        """Test that range endpoints may be containing passages."""
+        assert store.text(ILIAD + "1-2") == "\n".join(text for _, text in PASSAGES)
+
+    def test_range_ending_before_beginning(self, store):
+        """Test that a backwards range is rejected."""
+        with pytest.raises(KeyError):
+            store.text(ILIAD + "2.1-1.2")
+
+    def test_containing_passage(self, store):
+        """Test that a book retrieves all of its lines."""
+        assert store.text(ILIAD + "2") == "\n".join(text for _, text in PASSAGES[3:])
+
+    def test_whole_version(self, store):
+        """Test that a version URN without a passage retrieves the whole text."""
+        assert store.text(ILIAD) == "\n".join(text for _, text in PASSAGES)
+
+    def test_subreference_is_ignored(self, store):
+        """Test that subreferences resolve to their passage."""
+        assert store.text(ILIAD + "1.1@Μῆνιν") == PASSAGES[0][1]
+
+    def test_span(self, store):
+        """Test corpus positions of a URN."""
+        assert store.span(ILIAD + "1") == (0, 2)
+        assert store.span(ILIAD + "1.3-2.2") == (2, 4)
+
+    def test_missing_passage(self, store):
+        """Test that an unknown passage raises KeyError."""
+        with pytest.raises(KeyError):
+            store.text(ILIAD + "3")
+        with pytest.raises(KeyError):
+            store.text("urn:cts:greekLit:tlg0012.tlg002.msA:1.1")
+
+    @pytest.mark.parametrize("value", ["not a urn", "urn:cts:greekLit", "urn:cite2:hmt:msA:12r", ILIAD + "1.1@a@b"])
+    def test_invalid_urn_string(self, store, value):
+        """Test that a string that is not a valid CTS URN raises KeyError."""
+        with pytest.raises(KeyError):
+            store.span(value)
+        with pytest.raises(KeyError):
+            store.text(value)
+
+    def test_concurrent_containing_lookups(self, store):
+        """Test that containing passages resolve consistently across threads."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            spans = list(pool.map(store.span, [ILIAD + "1", ILIAD + "2", ILIAD] * 20))
+        assert spans == [(0, 2), (3, 4), (0, 4)] * 20
@@ -1,7 +1,9 @@
+import pickle
+
 import pytest
 from pydantic import ValidationError
 
-from urn_citation import Urn
+from urn_citation import Cite2Urn, CtsUrn, ParseError, Urn, trusted_construction
 
 
 class TestUrn:
@@ -42,3 +44,201 @@ class TestUrn:
         data = urn.model_dump()
         assert data["urn_type"] == "test"
 
+
+
+class TestUrnPickling:
+    """Tests for compact pickling of URNs."""
+
+    @pytest.mark.parametrize("value", [
+        "urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+        "urn:cts:greekLit:tlg0012:",
+        "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1@μῆνιν-1.5",
+    ])
+    def test_ctsurn_roundtrip(self, value):
+        """Test that a CtsUrn survives a pickle round trip."""
+        urn = CtsUrn.from_string(value)
+        restored = pickle.loads(pickle.dumps(urn))
+        assert restored == urn
+        assert type(restored) is CtsUrn
+        assert str(restored) == value
+
+    @pytest.mark.parametrize("value", [
+        "urn:cite2:hmt:msA.v1:12r",
+        "urn:cite2:hmt:msA:12r@0.1,0.2,0.3,0.4-12v",
+    ])
+    def test_cite2urn_roundtrip(self, value):
+        """Test that a Cite2Urn survives a pickle round trip."""
+        urn = Cite2Urn.from_string(value)
+        restored = pickle.loads(pickle.dumps(urn))
+        assert restored == urn
+        assert type(restored) is Cite2Urn
+        assert str(restored) == value
+
+    def test_base_urn_roundtrip(self):
+        """Test that the base class survives a pickle round trip."""
+        urn = Urn(urn_type="test")
+        assert pickle.loads(pickle.dumps(urn)) == urn
+
+    def test_pickle_is_compact(self):
+        """Test that pickles hold field values, not pydantic state."""
+        urn = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        data = pickle.dumps(urn)
+        assert b"__pydantic_fields_set__" not in data
+        assert len(data) < 150
+
+    def test_unpickling_skips_validation(self):
+        """Test that unpickling does not run validators."""
+        urn = CtsUrn.model_construct(urn_type="cts", namespace="greekLit", text_group="tlg0012", version="v1")
+        restored = pickle.loads(pickle.dumps(urn))
+        assert restored.version == "v1"
+        assert restored.work is None
+
+    def test_values_follow_field_order(self):
+        """Test that values are restored by field name when the instance dictionary is in another order."""
+        urn = CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1.1")
+        object.__setattr__(urn, "__dict__", dict(reversed(urn.__dict__.items())))
+        restored = pickle.loads(pickle.dumps(urn))
+        assert restored == CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1.1")
+        assert list(restored.__dict__) == list(CtsUrn.model_fields)
+
+    def test_fields_set_survives_roundtrip(self):
+        """Test that the fields set explicitly are restored."""
+        urn = CtsUrn(urn_type="cts", namespace="greekLit", text_group="tlg0012", passage="1.1")
+        restored = pickle.loads(pickle.dumps(urn))
+        assert restored.model_fields_set == urn.model_fields_set
+        assert restored.model_dump(exclude_unset=True) == urn.model_dump(exclude_unset=True)
+        parsed = CtsUrn.from_string("urn:cts:greekLit:tlg0012:1.1")
+        assert pickle.loads(pickle.dumps(parsed)).model_fields_set == parsed.model_fields_set
+
+    def test_restored_urn_is_mutable_like_original(self):
+        """Test that a restored URN supports copying and dumping."""
+        urn = pickle.loads(pickle.dumps(CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001:1.1")))
+        assert urn.model_copy(update={"passage": "1.2"}).passage == "1.2"
+        assert urn.model_dump()["passage"] == "1.1"
+        assert urn.set_passage("2.1").passage == "2.1"
+
+
+class TestUrnParse:
+    """Tests for parsing URN strings of any type."""
+
+    def test_parse_dispatches_on_type(self):
+        """Test that parse returns the class matching the type identifier."""
+        cts = Urn.parse("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        cite = Urn.parse("urn:cite2:hmt:msA.v1:12r")
+        assert cts == CtsUrn.from_string("urn:cts:greekLit:tlg0012.tlg001.msA:1.1")
+        assert cite == Cite2Urn.from_string("urn:cite2:hmt:msA.v1:12r")
+
+    @pytest.mark.parametrize("value, fragment", [
+        ("urn:isbn:0451450523", "Unsupported URN type"),
+        ("cts:greekLit:tlg0012:1.1", "must start with 'urn:<type>:'"),
+        ("urn:cts", "must start with 'urn:<type>:'"),
+        ("urn:cts:greekLit:tlg0012:1.1@", "Subreference cannot be empty"),
+    ])
+    def test_parse_rejects_invalid_strings(self, value, fragment):
+        """Test that invalid strings raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            Urn.parse(value)
+        assert fragment in str(exc_info.value)
+
+    def test_parse_on_subclass_restricts_type(self):
+        """Test that parse called on a subclass only accepts that type."""
+        assert isinstance(CtsUrn.parse("urn:cts:greekLit:tlg0012:1.1"), CtsUrn)
+        with pytest.raises(ValueError) as exc_info:
+            CtsUrn.parse("urn:cite2:hmt:msA.v1:12r")
+        assert "CtsUrn cannot parse" in str(exc_info.value)
+
+    def test_try_parse(self):
+        """Test parsing without exceptions."""
+        assert isinstance(Urn.try_parse("urn:cite2:hmt:msA.v1:12r"), Cite2Urn)
+        assert Urn.try_parse("urn:isbn:0451450523").code == "urn_type"
+        assert Urn.try_parse("urn:cts:greekLit:tlg0012:1..1").code == "passage_successive_periods"
+        assert Urn.try_parse(None).code == "not_a_string"
+
+    def test_parse_many_preserves_order(self):
+        """Test that a mixed batch is returned in input order."""
+        values = [
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+            "urn:cite2:hmt:msA.v1:12r",
+            "urn:cts:greekLit:tlg0012.tlg001.msA:1.2",
+            "urn:cite2:hmt:msA.v1:12v",
+        ]
+        parsed = Urn.parse_many(values)
+        assert [type(urn) for urn in parsed] == [CtsUrn, Cite2Urn, CtsUrn, Cite2Urn]
+        assert [str(urn) for urn in parsed] == values
+
+    def test_parse_many_raises_on_invalid(self):
+        """Test that an invalid string raises by default."""
+        with pytest.raises(ValueError):
+            Urn.parse_many(["urn:cts:greekLit:tlg0012:1.1", "urn:isbn:0451450523"])
+
+    def test_parse_many_returns_errors(self):
+        """Test that errors can be returned in place."""
+        parsed = Urn.parse_many(["urn:cts:greekLit:tlg0012:1.1", "urn:isbn:0451450523", "urn:cite2:hmt:msA.v1:"], errors="return")
+        assert isinstance(parsed[0], CtsUrn)
+        assert isinstance(parsed[1], ParseError)
+        assert parsed[2].code == "empty_object"
+
+    def test_parse_many_rejects_unknown_errors_mode(self):
+        """Test that the errors argument is checked."""
+        with pytest.raises(ValueError):
+            Urn.parse_many([], errors="ignore")
+
+
+VALID_URNS = [
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:greekLit:tlg0012.tlg001:1",
+    "urn:cts:greekLit:tlg0012.tlg001.msA:1.1",
+    "urn:cts:greekLit:tlg0012.tlg001.msA.ex1:1.1@μῆνιν",
+    "urn:cts:greekLit:tlg0012.tlg001.msA:1.1-1.10",
+    "urn:cts:greekLit:tlg0012.tlg001.msA:1.1@a[1]-1.2@b",
+    "urn:cite2:hmt:msA.v1:12r",
+    "urn:cite2:hmt:vaimg.v1:VA012RN_0013@0.1,0.2,0.3,0.4",
+    "urn:cite2:hmt:msA.v1:12r-14v",
+]
+
+
+class TestTrustedConstruction:
+    """Tests for building URNs without model validation."""
+
+    @pytest.mark.parametrize("value", VALID_URNS)
+    def test_trusted_equals_validated(self, value):
+        """Test that trusted and validated construction give identical URNs."""
+        validated = Urn.parse(value)
+        trusted = type(validated).from_string(value, trusted=True)
+        assert trusted == validated
+        assert type(trusted) is type(validated)
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert str(trusted) == value
+        assert pickle.loads(pickle.dumps(trusted)) == validated
+
+    @pytest.mark.parametrize("value", VALID_URNS)
+    def test_context_equals_validated(self, value):
+        """Test that URNs parsed inside the context equal validated URNs."""
+        validated = Urn.parse(value)
+        with trusted_construction():
+            assert Urn.parse(value) == validated
+            assert type(validated).try_parse(value) == validated
+
+    def test_trusted_skips_validators(self, monkeypatch):
+        """Test that the validating constructor is not called for trusted construction."""
+        calls = []
+        monkeypatch.setattr(CtsUrn, "__init__", lambda self, **data: calls.append(data))
+        CtsUrn.from_string("urn:cts:greekLit:tlg0012:1.1", trusted=True)
+        with trusted_construction():
+            CtsUrn.from_string("urn:cts:greekLit:tlg0012:1.1")
+        assert calls == []
+
+    def test_trusted_still_rejects_malformed_strings(self):
+        """Test that the parser's own checks still apply."""
+        with pytest.raises(ValueError):
+            CtsUrn.from_string("urn:cts:greekLit", trusted=True)
+        with trusted_construction():
+            assert isinstance(Cite2Urn.try_parse("urn:cite2:hmt:msA.v1:"), ParseError)
+
+    def test_context_is_restored(self):
+        """Test that validation resumes after the context exits."""
+        with trusted_construction():
+            pass
+        with pytest.raises(ValidationError):
+            CtsUrn(urn_type="cts", namespace="greekLit", text_group="tlg0012", passage="1@")
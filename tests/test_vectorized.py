@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from urn_citation import CtsUrn, CtsUrnColumns  # noqa: E402
+from urn_citation.vectorized import (  # noqa: E402
+    ABSENT,
+    PassageEncoder,
+    contains,
+    contains_matrix,
+    passage_contains,
+    passage_contains_matrix,
+    work_contains,
+    work_contains_matrix,
+)
+
+ILIAD = "urn:cts:greekLit:tlg0012.tlg001.msA:"
+
+URNS = [
+    ILIAD + "1",
+    ILIAD + "1.1",
+    ILIAD + "1.10",
+    ILIAD + "10.1",
+    ILIAD + "01.1",
+    ILIAD + "1.1@μῆνιν",
+    ILIAD + "1.1@μῆνιν.2",
+    ILIAD + "pr.1",
+    ILIAD + "12r.3",
+    ILIAD + "1.123456789012345678901",
+    ILIAD,
+    "urn:cts:greekLit:tlg0012.tlg001.msB:1.1",
+    "urn:cts:greekLit:tlg0012.tlg001:1",
+    "urn:cts:greekLit:tlg0012:",
+    "urn:cts:latinLit:phi0959.phi006:1.1",
+]
+
+PARSED = [CtsUrn.from_string(urn) for urn in URNS]
+
+
+@pytest.fixture
+def encoded():
+    return PassageEncoder().encode(URNS)
+
+
+class TestPassageEncoder:
+    """Tests for encoding passages as integer arrays."""
+
+    def test_numeric_levels(self, encoded):
+        """Test that numeric levels are encoded as their values and padded."""
+        assert encoded.depth == 3
+        assert encoded.codes[1].tolist() == [1, 1, ABSENT]
+        assert encoded.codes[0].tolist() == [1, ABSENT, ABSENT]
+        assert encoded.depths[:3].tolist() == [1, 2, 2]
+
+    def test_non_numeric_levels_use_side_table(self, encoded):
+        """Test that levels that are not plain numbers get negative symbol codes."""
+        assert encoded.codes[4, 0] < ABSENT
+        assert encoded.codes[7, 0] < ABSENT
+        assert encoded.codes[9, 1] < ABSENT
+        assert "01" in encoded.encoder.symbols
+        assert "1@μῆνιν" in encoded.encoder.symbols
+
+    def test_missing_passage(self, encoded):
+        """Test that a URN without a passage has depth 0."""
+        assert encoded.depths[10] == 0
+        assert encoded.codes[10].tolist() == [ABSENT] * 3
+
+    def test_inputs_agree(self):
+        """Test that strings, CtsUrn objects and columns encode identically."""
+        encoder = PassageEncoder()
+        from_strings = encoder.encode(URNS)
+        from_objects = encoder.encode(PARSED)
+        from_columns = encoder.encode(CtsUrnColumns(URNS))
+        for other in (from_objects, from_columns):
+            assert np.array_equal(from_strings.codes, other.codes)
+            assert np.array_equal(from_strings.work, other.work)
+
+    def test_fixed_depth(self):
+        """Test encoding to an explicit depth."""
+        encoded = PassageEncoder().encode([ILIAD + "1.1"], depth=4)
+        assert encoded.codes.tolist() == [[1, 1, ABSENT, ABSENT]]
+        with pytest.raises(ValueError):
+            PassageEncoder().encode([ILIAD + "1.1.1"], depth=2)
+
+    @pytest.mark.parametrize("value", [ILIAD + "1.1-1.5", ILIAD + "1.", "urn:cts:greekLit"])
+    def test_rejected_inputs(self, value):
+        """Test that ranges, empty levels and invalid strings are rejected."""
+        with pytest.raises(ValueError):
+            PassageEncoder().encode([value])
+
+    def test_threads_agree_on_codes(self):
+        """Test that concurrent threads get one code per symbol, through encode and level_code."""
+        encoder = PassageEncoder()
+        levels = [f"{i % 50}r" for i in range(5000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            codes = list(executor.map(encoder.level_code, levels))
+            list(executor.map(lambda level: encoder.encode([ILIAD + level]), levels))
+        assert sorted(encoder.symbols.values()) == list(range(len(encoder.symbols)))
+        assert len(encoder.symbols) == 50 + len(["tlg0012", "tlg001", "msA"])
+        assert codes == [encoder.level_code(level) for level in levels]
+
+    def test_empty_collection(self):
+        """Test encoding no URNs."""
+        encoded = PassageEncoder().encode([])
+        assert len(encoded) == 0
+        assert passage_contains_matrix(encoded, encoded).shape == (0, 0)
+
+
+class TestVectorizedPredicates:
+    """Tests that vectorized predicates agree with the CtsUrn methods."""
+
+    def test_passage_contains_matrix(self, encoded):
+        """Test every pair against CtsUrn.passage_contains."""
+        expected = [[a.passage_contains(b) for b in PARSED] for a in PARSED]
+        assert passage_contains_matrix(encoded, encoded).tolist() == expected
+
+    def test_work_contains_matrix(self, encoded):
+        """Test every pair against CtsUrn.work_contains."""
+        expected = [[a.work_contains(b) for b in PARSED] for a in PARSED]
+        assert work_contains_matrix(encoded, encoded).tolist() == expected
+
+    def test_contains_matrix(self, encoded):
+        """Test every pair against CtsUrn.contains."""
+        expected = [[a.contains(b) for b in PARSED] for a in PARSED]
+        assert contains_matrix(encoded, encoded).tolist() == expected
+
+    def test_aligned_pairs(self, encoded):
+        """Test element-wise predicates on aligned collections."""
+        reversed_urns = encoded[::-1]
+        pairs = list(zip(PARSED, reversed(PARSED)))
+        assert passage_contains(encoded, reversed_urns).tolist() == [a.passage_contains(b) for a, b in pairs]
+        assert work_contains(encoded, reversed_urns).tolist() == [a.work_contains(b) for a, b in pairs]
+        assert contains(encoded, reversed_urns).tolist() == [a.contains(b) for a, b in pairs]
+
+    def test_broadcast_single_container(self, encoded):
+        """Test that one container is compared with every URN."""
+        book = encoded.encoder.encode([ILIAD + "1"])
+        assert passage_contains(book, encoded).tolist() == [PARSED[0].passage_contains(b) for b in PARSED]
+        assert contains(encoded[0], encoded).tolist() == [PARSED[0].contains(b) for b in PARSED]
+
+    def test_different_depths(self):
+        """Test comparing collections encoded to different depths."""
+        encoder = PassageEncoder()
+        books = encoder.encode([ILIAD + "1", ILIAD + "2"])
+        lines = encoder.encode([ILIAD + "1.1.3", ILIAD + "2.4", ILIAD + "3.1"])
+        assert passage_contains_matrix(books, lines).tolist() == [[True, False, False], [False, True, False]]
+
+    def test_different_encoders(self, encoded):
+        """Test that collections from different encoders cannot be compared."""
+        other = PassageEncoder().encode(URNS)
+        with pytest.raises(ValueError):
+            passage_contains_matrix(encoded, other)
+        with pytest.raises(ValueError):
+            work_contains(encoded, other)